@@ -0,0 +1,77 @@
+import sys
+import time
+
+BURST_MIN_CLICKS = 100      # Beyond the legacy two-digit click field
+BURST_MAX_INTERVAL = 0.1    # Sub-100ms intervals were not expressible in the legacy field
+# Final stretch before each click is spun instead of slept: Windows waits are ~15.6ms granular
+SPIN_WINDOW = 0.02 if sys.platform == "win32" else 0.002
+
+
+def pace_until(target, cancel_event):
+    """Wait for perf_counter() `target`: sleep most of the way, spin the rest. False if cancelled."""
+    delay = target - time.perf_counter()
+    if delay > SPIN_WINDOW:
+        if cancel_event.wait(delay - SPIN_WINDOW):
+            return False
+    elif cancel_event.is_set():
+        return False
+    while time.perf_counter() < target:
+        pass
+    return True
+
+
+def is_burst(clicks, interval):
+    """Rows outside the legacy click/interval ranges run in burst mode (v2.3)."""
+    return clicks >= BURST_MIN_CLICKS or interval < BURST_MAX_INTERVAL
+
+
+class BurstStats:
+    """Outcome of one burst: clicks sent, wall time and per-click lateness (seconds)."""
+    def __init__(self, interval):
+        self.interval = interval
+        self.count = 0
+        self.elapsed = 0.0
+        self.lateness = []
+        self.cancelled = False
+
+    @property
+    def rate(self):
+        """Achieved clicks per second (first to last click)."""
+        return (self.count - 1) / self.elapsed if self.count > 1 and self.elapsed > 0 else 0.0
+
+    @property
+    def target_rate(self):
+        return 1 / self.interval if self.interval > 0 else 0.0
+
+    @property
+    def jitter_avg_ms(self):
+        return sum(self.lateness) / len(self.lateness) * 1000 if self.lateness else 0.0
+
+    @property
+    def jitter_max_ms(self):
+        return max(self.lateness) * 1000 if self.lateness else 0.0
+
+
+def run_burst(count, interval, action, cancel_event):
+    """
+    Call `action()` `count` times with drift-free pacing: click i is due at
+    start + i * interval, so a late click never pushes the following ones back.
+    Nothing is logged per click; the returned BurstStats is reported once at the end.
+    """
+    stats = BurstStats(interval)
+    start = time.perf_counter()
+    last = start
+    for i in range(count):
+        target = start + i * interval
+        if not pace_until(target, cancel_event):
+            stats.cancelled = True
+            break
+        last = time.perf_counter()
+        stats.lateness.append(last - target)
+        keep_going = action()
+        stats.count += 1
+        if keep_going is False:
+            stats.cancelled = True
+            break
+    stats.elapsed = last - start
+    return stats
@@ -1,7 +1,11 @@
 import os
 import sys
+import copy
 import configparser
 
+from core.input_backend import PASTE_MODES
+from core.late_policy import normalize_late_policy
+
 class ConfigManager:
     LANGUAGE_FILE = "assets/language.ini"
     CONFIG_FILE = "config/config.ini"
@@ -20,8 +24,19 @@ class ConfigManager:
         self.copy_range = 7
         self.auto_close_enabled = True
         self.auto_close_delay_seconds = 10
+        self.paste_mode = "clipboard"
+        self.pre_arm_ms = 200
+        self.reference_clock = ""  # v2.3: "host[:port]" of an SNTP server, blank = local clock
+        self.clock_sync_interval = 900
+        self.input_process = False  # v2.3: Inject input from a separate process
+        self.critical_window_ms = 100  # v2.3: Guarded stretch before each deadline (0 = off)
+        self.late_policy = "fire 5"  # v2.3: Missed-deadline policy for rows without their own
+        self.journal = True  # v2.3: Journal running sessions for crash recovery
         self.theme = "Light"
         self.timers_data = []
+        # v2.3: Per-language caches (section dicts + shared UI string bundles)
+        self._lang_texts_cache = {}
+        self._bundles = {}
 
         self.load_language()
         self.load_app_config()
@@ -35,11 +50,32 @@ class ConfigManager:
         lang_path = self.get_resource_path(self.LANGUAGE_FILE)
         if os.path.exists(lang_path):
             self.lang_config.read(lang_path, encoding="utf-8")
+        self._lang_texts_cache.clear()
+        self._bundles.clear()
 
     def get_lang_texts(self):
-        if self.selected_language in self.lang_config:
-            return dict(self.lang_config[self.selected_language])
-        return {}
+        texts = self._lang_texts_cache.get(self.selected_language)
+        if texts is None:
+            if self.selected_language in self.lang_config:
+                texts = dict(self.lang_config[self.selected_language])
+            else:
+                texts = {}
+            self._lang_texts_cache[self.selected_language] = texts
+        return texts
+
+    def get_bundle(self, name, keys):
+        """
+        Resolve `keys` once per language into a dict shared by every caller (v2.3).
+        The same object is returned until the language changes, so callers can use
+        identity (`is`) to detect that their cached strings are stale.
+        """
+        cache_key = (self.selected_language, name)
+        bundle = self._bundles.get(cache_key)
+        if bundle is None:
+            texts = self.get_lang_texts()
+            bundle = {key: texts.get(key, key) for key in keys}
+            self._bundles[cache_key] = bundle
+        return bundle
 
     def get_message(self, key, **kwargs):
         texts = self.get_lang_texts()
@@ -67,6 +103,19 @@ class ConfigManager:
         self.auto_close_enabled = self.app_config.getboolean("General", "auto_close_enabled", fallback=True)
         self.auto_close_delay_seconds = self.app_config.getint("General", "auto_close_delay_seconds", fallback=10)
         self.theme = self.app_config.get("General", "theme", fallback="Light")
+        self.paste_mode = self.app_config.get("General", "paste_mode", fallback="clipboard").strip().lower()
+        if self.paste_mode not in PASTE_MODES:
+            self.paste_mode = "clipboard"
+        self.pre_arm_ms = max(0, self.app_config.getint("General", "pre_arm_ms", fallback=200))
+        self.reference_clock = self.app_config.get("General", "reference_clock", fallback="").strip()
+        self.clock_sync_interval = max(30, self.app_config.getint("General", "clock_sync_interval", fallback=900))
+        self.input_process = self.app_config.getboolean("General", "input_process", fallback=False)
+        self.critical_window_ms = max(0, self.app_config.getint("General", "critical_window_ms", fallback=100))
+        try:
+            self.late_policy = normalize_late_policy(self.app_config.get("General", "late_policy", fallback="")) or "fire 5"
+        except ValueError:
+            self.late_policy = "fire 5"
+        self.journal = self.app_config.getboolean("General", "journal", fallback=True)
 
         self.timers_data = []
         # Clear existing Timer_ sections to rebuild cleanly if needed, 
@@ -81,10 +130,32 @@ class ConfigManager:
                     "show_desktop": self.app_config.getboolean(section, "show_desktop", fallback=False),
                     "clicks": self.app_config.get(section, "clicks", fallback="1"),
                     "interval": self.app_config.get(section, "interval", fallback="1"),
-                    "paste_text": self.app_config.get(section, "paste_text", fallback="")
+                    "paste_text": self.app_config.get(section, "paste_text", fallback=""),
+                    "time_ms": self.app_config.getint(section, "time_ms", fallback=0),
+                    "day_offset": self.app_config.getint(section, "day_offset", fallback=0),
+                    "repeat": self.app_config.get(section, "repeat", fallback=""),
+                    "date": self.app_config.get(section, "date", fallback=""),
+                    "steps": self.app_config.get(section, "steps", fallback=""),
+                    "trigger": self.app_config.get(section, "trigger", fallback=""),
+                    "late": self.app_config.get(section, "late", fallback="")
                 }
                 self.timers_data.append(data)
 
+    def load_file(self, path):
+        """
+        Replace the settings and rows with those of `path` (v2.3: load dialog and control
+        API). The file is parsed into a scratch copy first, so a missing, malformed or
+        out-of-range file raises (OSError / configparser.Error / ValueError) and leaves
+        this manager untouched.
+        """
+        parser = configparser.ConfigParser()
+        if not parser.read(path, encoding="utf-8"):
+            raise OSError(f"cannot read {path}")
+        staged = copy.copy(self)
+        staged.app_config = parser
+        staged.load_app_config(read_default_file=False)
+        vars(self).update(vars(staged))
+
     def save_config(self, window_geo=None, timers_list=None):
         # Update General section in self.app_config
         self.app_config.set("General", "language", self.selected_language)
@@ -92,6 +163,14 @@ class ConfigManager:
         self.app_config.set("General", "auto_close_enabled", str(self.auto_close_enabled).lower())
         self.app_config.set("General", "auto_close_delay_seconds", str(self.auto_close_delay_seconds))
         self.app_config.set("General", "theme", self.theme)
+        self.app_config.set("General", "paste_mode", self.paste_mode)
+        self.app_config.set("General", "pre_arm_ms", str(self.pre_arm_ms))
+        self.app_config.set("General", "reference_clock", self.reference_clock)
+        self.app_config.set("General", "clock_sync_interval", str(self.clock_sync_interval))
+        self.app_config.set("General", "input_process", str(self.input_process))
+        self.app_config.set("General", "critical_window_ms", str(self.critical_window_ms))
+        self.app_config.set("General", "late_policy", self.late_policy)
+        self.app_config.set("General", "journal", str(self.journal))
         self.app_config.set("General", "timer_canvas_height", str(self.timer_canvas_height))
         
         if window_geo:
@@ -117,6 +196,22 @@ class ConfigManager:
                 self.app_config.set(section, "clicks", str(timer.get('clicks', '1')))
                 self.app_config.set(section, "interval", str(timer.get('interval', '1')))
                 self.app_config.set(section, "paste_text", timer.get('paste_text', ''))
+                # v2.3: Only written when set, keeps legacy configs unchanged
+                if timer.get('time_ms'):
+                    self.app_config.set(section, "time_ms", str(timer['time_ms']))
+                if timer.get('day_offset'):
+                    self.app_config.set(section, "day_offset", str(timer['day_offset']))
+                if timer.get('repeat'):
+                    self.app_config.set(section, "repeat", timer['repeat'])
+                if timer.get('date'):
+                    self.app_config.set(section, "date", timer['date'])
+                if timer.get('steps'):
+                    # "%" is the interpolation escape (e.g. type "50%")
+                    self.app_config.set(section, "steps", timer['steps'].replace("%", "%%"))
+                if timer.get('trigger'):
+                    self.app_config.set(section, "trigger", timer['trigger'])
+                if timer.get('late'):
+                    self.app_config.set(section, "late", timer['late'])
 
         config_dir = os.path.dirname(self.CONFIG_FILE)
         if config_dir and not os.path.exists(config_dir):
@@ -0,0 +1,179 @@
+"""
+Execution-window conflicts (v2.3).
+
+Every enabled row holds the mouse / keyboard / clipboard from its deadline for about
+
+    clicks        (clicks - 1) * interval, plus each paste (the clipboard restore runs
+                  off the executor and holds nothing up)
+    macro steps   the span of the compiled plan
+    show desktop  the Win+D press and its settle time
+
+All input runs on one executor, so a row due while another one is still running does
+not interleave with it: it starts late, by the remaining overlap. Such pairs are found
+before they cost a deadline.
+
+Windows are seconds from today's midnight (see core.timeline.row_seconds). ConflictIndex
+keeps them sorted by start:
+
+    rebuild(windows)      sort-and-sweep over every row (Start, loading a schedule)
+    update(key, window)   one edited row: only rows overlapping its old or new window
+                          are re-checked (candidates found by bisect, bounded by the
+                          longest window)
+
+Recurring rows are checked at their first occurrence; trigger rows at their deadline.
+"""
+import bisect
+
+from core.timeline import row_seconds
+from core.schedule import parse_interval
+from core.macro import parse_steps, compile_plan, plan_span_ms
+from core.input_backend import chunk_text, TYPE_CHUNK_GAP
+
+ACTION_ESTIMATE = 0.02   # One click or Ctrl+V including the target's reaction
+DESKTOP_DURATION = 0.55  # Key hold (0.05s) + settle (0.5s), see TimerWorker.execute
+CONFLICT_LOG_MAX = 10
+
+
+def row_duration(vals, paste_mode="clipboard"):
+    """Seconds a row keeps the input devices busy once it fires."""
+    if vals.get('show_desktop'):
+        return DESKTOP_DURATION
+    if vals.get('steps'):
+        return plan_span_ms(compile_plan(parse_steps(vals['steps']))) / 1000 + ACTION_ESTIMATE
+    clicks = int(vals['clicks']) if vals.get('clicks') else 1
+    interval = parse_interval(vals['interval']) if vals.get('interval') else 1.0
+    duration = max(0, clicks - 1) * interval + ACTION_ESTIMATE
+    if vals.get('paste_text'):
+        if paste_mode == "type":
+            gaps = len(chunk_text(vals['paste_text'])) - 1
+            duration += clicks * (ACTION_ESTIMATE + gaps * TYPE_CHUNK_GAP)
+        else:
+            duration += clicks * ACTION_ESTIMATE
+    return duration
+
+
+def execution_window(vals, now, day_of, paste_mode="clipboard"):
+    """(start, end) in seconds from midnight, or None for disabled rows and rows that do not parse."""
+    if not vals.get('enabled', True):
+        return None
+    start = row_seconds(vals, now, day_of)
+    if start is None:
+        return None
+    try:
+        return start, start + row_duration(vals, paste_mode)
+    except (KeyError, ValueError, TypeError):
+        return None
+
+
+def check_rows(rows, now, paste_mode="clipboard"):
+    """ConflictIndex of row dicts keyed by 1-based row number (Start in headless mode)."""
+    day_of = {}
+    index = ConflictIndex()
+    index.rebuild({idx + 1: execution_window(vals, now, day_of, paste_mode) for idx, vals in enumerate(rows)})
+    return index
+
+
+class ConflictIndex:
+    """
+    Rows' execution windows and, per conflicting row, one row it overlaps (`conflicts`).
+    Keys only need to be hashable (row cards, row numbers); they are never sorted.
+    """
+    def __init__(self):
+        self.windows = {}
+        self.conflicts = {}
+        self._starts = []
+        self._keys = []
+        self._max_len = 0.0
+
+    def __len__(self):
+        return len(self._keys)
+
+    def rebuild(self, windows):
+        """Replace everything with `windows` (key -> (start, end) or None). Returns the conflicting keys."""
+        items = sorted(((w, key) for key, w in windows.items() if w is not None), key=lambda item: item[0][0])
+        self.windows = {key: w for w, key in items}
+        self._starts = [w[0] for w, _ in items]
+        self._keys = [key for _, key in items]
+        self._max_len = max((w[1] - w[0] for w, _ in items), default=0.0)
+        conflicts = {}
+        reach_end, reach_key = float("-inf"), None
+        for (start, end), key in items:
+            # Anything overlapping an earlier row overlaps the one reaching furthest
+            if start < reach_end:
+                conflicts[key] = reach_key
+                conflicts.setdefault(reach_key, key)
+            if end > reach_end:
+                reach_end, reach_key = end, key
+        self.conflicts = conflicts
+        return set(conflicts)
+
+    def update(self, key, window):
+        """Set (or with None, drop) one row's window. Returns the keys whose conflict changed."""
+        old = self.windows.pop(key, None)
+        if old is not None:
+            self._remove(key, old[0])
+        if window is not None:
+            i = bisect.bisect_right(self._starts, window[0])
+            self._starts.insert(i, window[0])
+            self._keys.insert(i, key)
+            self.windows[key] = window
+            self._max_len = max(self._max_len, window[1] - window[0])
+
+        affected = {key}
+        for w in (old, window):
+            if w is not None:
+                affected.update(self._overlapping(w, key))
+        changed = set()
+        for k in affected:
+            w = self.windows.get(k)
+            partner = next(self._overlapping(w, k), None) if w is not None else None
+            if partner is None:
+                if self.conflicts.pop(k, None) is not None:
+                    changed.add(k)
+            elif self.conflicts.get(k) is None:
+                self.conflicts[k] = partner
+                changed.add(k)
+            elif self.conflicts[k] not in self.windows or not self._overlap(w, self.windows[self.conflicts[k]]):
+                self.conflicts[k] = partner  # Old partner moved away; the flag stays
+                changed.add(k)
+        return changed
+
+    def delay_seconds(self, key):
+        """How late the later of `key` and its recorded partner starts (0 when not in conflict)."""
+        partner = self.conflicts.get(key)
+        if partner is None:
+            return 0.0
+        first, second = sorted((self.windows[key], self.windows[partner]))
+        return max(0.0, first[1] - second[0])
+
+    @staticmethod
+    def _overlap(a, b):
+        return a[0] < b[1] and b[0] < a[1]
+
+    def _overlapping(self, window, exclude):
+        """Keys (other than `exclude`) whose window overlaps `window`."""
+        start, end = window
+        lo = bisect.bisect_left(self._starts, start - self._max_len)
+        hi = bisect.bisect_left(self._starts, end)
+        for i in range(lo, hi):
+            key = self._keys[i]
+            if key != exclude and self.windows[key][1] > start:
+                yield key
+
+    def _remove(self, key, start):
+        i = bisect.bisect_left(self._starts, start)
+        while self._keys[i] != key:
+            i += 1
+        del self._starts[i]
+        del self._keys[i]
+
+
+def report_conflicts(index, row_of, config, log, limit=CONFLICT_LOG_MAX):
+    """Log the conflicts found at Start: a count, then the first `limit` rows in row order."""
+    if not index.conflicts:
+        return
+    log(config.get_message("log_conflicts_found", count=len(index.conflicts)))
+    flagged = sorted(index.conflicts, key=row_of)
+    for key in flagged[:limit]:
+        log(config.get_message("log_conflict_row", row=row_of(key), other=row_of(index.conflicts[key]),
+                               delay=f"{index.delay_seconds(key):.2f}"))
@@ -0,0 +1,147 @@
+"""
+Critical window around deadlines (v2.3).
+
+From `window` seconds before a group's deadline until the group has run, the
+dispatching thread (the input executor) is guarded:
+
+  * its OS thread priority is raised (THREAD_PRIORITY_TIME_CRITICAL on Windows, a
+    lower nice value elsewhere when permitted) and restored afterwards;
+  * cyclic garbage collection is disabled and re-enabled afterwards, so a collection
+    triggered by an unrelated allocation cannot land on the deadline (not when the
+    previous window closed less than `window` ago: back-to-back groups would otherwise
+    keep GC off indefinitely and the backlog would land on a later deadline). A long
+    group (a burst, a macro) gets GC back GC_HOLD_AFTER seconds past its deadline
+    instead of only when it ends;
+  * housekeeping is deferred: log lines produced on the guarded thread are queued
+    and emitted when the window closes, and other engine threads hold back their
+    bookkeeping (wait_clear) until then.
+
+`state()` is attached to each fire's telemetry so the effect can be verified.
+"""
+import os
+import gc
+import sys
+import time
+import threading
+
+DEFAULT_WINDOW_MS = 100
+POSIX_NICE_BOOST = 10
+HOLD_MAX = 1.0  # Longest a housekeeping thread waits for a window to close
+GC_HOLD_AFTER = 0.25  # Longest GC stays disabled past the deadline within one group
+
+
+def _boost_current_thread():
+    """Raise this thread's priority. Returns a restore callable, or None if not permitted."""
+    if sys.platform == "win32":
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetCurrentThread()
+        previous = kernel32.GetThreadPriority(handle)
+        if not kernel32.SetThreadPriority(handle, 15):  # THREAD_PRIORITY_TIME_CRITICAL
+            return None
+        return lambda: kernel32.SetThreadPriority(handle, previous)
+    if not hasattr(os, "setpriority"):
+        return None
+    tid = threading.get_native_id()  # Linux: per-thread nice via the thread id
+    try:
+        previous = os.getpriority(os.PRIO_PROCESS, tid)
+        os.setpriority(os.PRIO_PROCESS, tid, max(-20, previous - POSIX_NICE_BOOST))
+    except OSError:
+        return None  # Lowering nice needs CAP_SYS_NICE / root
+
+    def restore():
+        try:
+            os.setpriority(os.PRIO_PROCESS, tid, previous)
+        except OSError:
+            pass
+    return restore
+
+
+class CriticalGuard:
+    """Enter / exit around each group on the dispatching thread (re-entrant)."""
+    def __init__(self, window=DEFAULT_WINDOW_MS / 1000, boost=True, gc_control=True):
+        self.window = max(0.0, window)
+        self.boost = boost
+        self.gc_control = gc_control
+        self.boosted = False
+        self.gc_paused = False
+        self._depth = 0
+        self._owner = None
+        self._restore_priority = None
+        self._gc_was_enabled = False
+        self._last_exit = float("-inf")
+        self._gc_timer = None
+        self._gc_lock = threading.Lock()
+        self._deferred = []
+        self._clear = threading.Event()
+        self._clear.set()
+
+    @property
+    def active(self):
+        return self._depth > 0
+
+    def enter(self):
+        self._depth += 1
+        if self._depth > 1:
+            return
+        self._owner = threading.get_ident()
+        self._clear.clear()
+        if self.boost:
+            self._restore_priority = _boost_current_thread()
+            self.boosted = self._restore_priority is not None
+        if self.gc_control and time.monotonic() - self._last_exit >= self.window:
+            self._gc_was_enabled = gc.isenabled()
+            gc.disable()
+            self.gc_paused = self._gc_was_enabled
+            if self.gc_paused:
+                # Entered `window` before the deadline: the cap counts from there
+                self._gc_timer = threading.Timer(self.window + GC_HOLD_AFTER, self._resume_gc)
+                self._gc_timer.daemon = True
+                self._gc_timer.start()
+
+    def _resume_gc(self):
+        with self._gc_lock:
+            if self.gc_paused:
+                gc.enable()
+                self.gc_paused = False
+
+    def exit(self):
+        self._depth -= 1
+        if self._depth > 0:
+            return
+        if self._restore_priority:
+            self._restore_priority()
+            self._restore_priority = None
+        if self._gc_timer is not None:
+            self._gc_timer.cancel()
+            self._gc_timer = None
+        self._resume_gc()
+        self._last_exit = time.monotonic()
+        self.boosted = False
+        self._owner = None
+        deferred, self._deferred = self._deferred, []
+        self._clear.set()
+        for fn in deferred:
+            fn()
+
+    def state(self):
+        """Per-fire telemetry: 'window' / 'priority' / 'gc' that are in force right now."""
+        if not self.active:
+            return "off"
+        parts = ["window"]
+        if self.boosted:
+            parts.append("priority")
+        if self.gc_paused:
+            parts.append("gc")
+        return "+".join(parts)
+
+    def defer(self, fn):
+        """Run `fn` now, or when the window closes if called on the guarded thread inside it."""
+        if self.active and threading.get_ident() == self._owner:
+            self._deferred.append(fn)
+        else:
+            fn()
+
+    def wait_clear(self, timeout=HOLD_MAX):
+        """Housekeeping threads: hold back (bounded) while a window is open."""
+        return self._clear.wait(timeout)
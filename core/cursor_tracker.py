@@ -0,0 +1,88 @@
+import sys
+from PySide6.QtCore import QObject, Signal, QTimer
+
+
+class Win32CursorSource:
+    """Reads the real cursor position. Raises while the desktop is locked (secure desktop)."""
+    def __init__(self):
+        import win32api
+        self._get_cursor_pos = win32api.GetCursorPos
+
+    def position(self):
+        return self._get_cursor_pos()
+
+
+class FakeCursorSource:
+    """Scriptable stand-in for non-Windows hosts and tests: set `pos` (or `locked`) directly."""
+    def __init__(self, pos=(0, 0)):
+        self.pos = tuple(pos)
+        self.locked = False
+        self.reads = 0
+
+    def position(self):
+        self.reads += 1
+        if self.locked:
+            raise OSError("desktop locked")
+        return self.pos
+
+
+def default_cursor_source():
+    if sys.platform == "win32":
+        return Win32CursorSource()
+    return FakeCursorSource()
+
+
+class CursorTracker(QObject):
+    """
+    Change-driven cursor coordinate tracking (v2.3).
+    Replaces the fixed 200ms polling timer: `position_changed` is only emitted when
+    the value moves, the poll rate adapts to the window state, and polling backs off
+    while the cursor sits still or the desktop is locked.
+    """
+    position_changed = Signal(int, int)
+
+    ACTIVE_INTERVAL_MS = 100       # Window focused: user is reading coordinates
+    BACKGROUND_INTERVAL_MS = 250   # Window visible but not focused
+    IDLE_MAX_INTERVAL_MS = 1000    # Back-off ceiling while nothing changes / locked
+
+    def __init__(self, source=None, parent=None):
+        super().__init__(parent)
+        self.source = source if source is not None else default_cursor_source()
+        self.last_pos = None
+        self._base_interval = self.BACKGROUND_INTERVAL_MS
+        self._paused = True
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.poll)
+
+    def set_window_state(self, active, minimized):
+        """Called by the owning window on activation / minimize changes."""
+        if minimized:
+            self._paused = True
+            self._timer.stop()
+            return
+        self._base_interval = self.ACTIVE_INTERVAL_MS if active else self.BACKGROUND_INTERVAL_MS
+        was_paused = self._paused
+        self._paused = False
+        # Re-arm at the new base rate (immediately when resuming from minimized)
+        self._timer.start(0 if was_paused else self._base_interval)
+
+    def stop(self):
+        self._paused = True
+        self._timer.stop()
+
+    def poll(self):
+        interval = self._timer.interval() or self._base_interval
+        try:
+            pos = tuple(self.source.position())
+        except Exception:
+            # Locked workstation / secure desktop: keep backing off until it comes back
+            pos = None
+        if pos is not None and pos != self.last_pos:
+            self.last_pos = pos
+            self.position_changed.emit(pos[0], pos[1])
+            interval = self._base_interval
+        else:
+            interval = min(max(interval, self._base_interval) * 2, self.IDLE_MAX_INTERVAL_MS)
+        if not self._paused:
+            self._timer.start(interval)
@@ -0,0 +1,196 @@
+import os
+import sys
+import time
+import signal
+import datetime
+from PySide6.QtCore import QCoreApplication, QObject, QTimer
+
+from core.config_manager import ConfigManager
+from core.timer_engine import TimerEngine
+from core.schedule import compile_tasks, resume_tasks
+from core.journal import replay, discard, JOURNAL_FILE
+from core.conflicts import check_rows, report_conflicts
+from core.reference_clock import start_clock_sync
+from core.ipc import ControlServer
+
+
+class HeadlessRunner(QObject):
+    """
+    Headless runner (v2.3): executes the saved schedule without building any widgets.
+    Loads config/config.ini through ConfigManager, compiles the enabled rows with the
+    same rules as the Start button and streams the engine log to `out`.
+    Auto-close mirrors the GUI: after the last task the process exits once the
+    configured delay has elapsed; with auto-close disabled it stays up until interrupted.
+    """
+    def __init__(self, config, out):
+        super().__init__()
+        self.config = config
+        self.out = out
+        self.exit_code = 0
+        self.active_tasks_count = 0
+        self._shutting_down = False
+        self.running = False
+        self.engine = TimerEngine(config=self.config)
+        self.engine.log_signal.connect(self.log)
+        self.engine.task_finished.connect(self.on_task_finished)
+        self.clock_sync = start_clock_sync(self.config, self.engine.clock, self.log)
+        self.control_server = None
+
+    def log(self, message):
+        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        self.out.write(f"[{timestamp}] {message}\n")
+        self.out.flush()
+
+    def start(self):
+        self.log(self.config.get_message("log_timer_started"))
+        now = self.engine.clock.now()
+        tasks_info = compile_tasks(self.config.timers_data, self.config, self.log, now=now)
+        # v2.3: Overlapping execution windows are reported, not refused (the later row starts late)
+        report_conflicts(check_rows(self.config.timers_data, now, self.config.paste_mode),
+                         lambda row: row, self.config, self.log)
+        return self.arm_tasks(tasks_info)
+
+    def resume(self, recovery, started):
+        """Re-arm the rows an interrupted session still had pending (v2.3)."""
+        self.config.timers_data = recovery.rows
+        tasks_info = resume_tasks(recovery.rows, recovery.states, self.config, self.log,
+                                  now=self.engine.clock.now())
+        armed = bool(tasks_info) and self.arm_tasks(tasks_info)
+        if not tasks_info:
+            discard(JOURNAL_FILE)
+        self.log(self.config.get_message("log_journal_recovered", pending=len(tasks_info),
+                                         interrupted=len(recovery.states) - len(tasks_info),
+                                         ms=f"{(time.perf_counter() - started) * 1000:.0f}"))
+        return armed
+
+    def arm_tasks(self, tasks_info):
+        if not tasks_info:
+            self.log(self.config.get_message("error_no_valid_timer"))
+            self.exit_code = 1
+            return False
+        self.active_tasks_count = len(tasks_info)
+        self.engine.start_tasks(tasks_info, self.config.timers_data)
+        self.running = True
+        next_fire = self.engine.next_fire()
+        if next_fire:
+            self.log(self.config.get_message("log_timer_next_fire", timer_no=next_fire[1],
+                                             time=next_fire[0].strftime("%Y-%m-%d %H:%M:%S"),
+                                             count=len(self.engine.fire_index)))
+        return True
+
+    def on_task_finished(self, timer_no, is_last):
+        if self.active_tasks_count > 0:
+            self.active_tasks_count -= 1
+        if self.active_tasks_count <= 0 and not self.engine.recurring_active:
+            self.running = False
+        if is_last and self.config.auto_close_enabled:
+            self.log(self.config.get_message("log_autoclose_countdown", delay=self.config.auto_close_delay_seconds))
+            QTimer.singleShot(self.config.auto_close_delay_seconds * 1000, self.shutdown)
+
+    # --- Local control API (v2.3, see core.ipc): rows live in config.timers_data ---
+    def _ipc_require_idle(self):
+        if self.running:
+            raise ValueError("schedule is running; send stop first")
+
+    def ipc_status(self):
+        next_fire = self.engine.next_fire() if self.running else None
+        rows = self.config.timers_data
+        return {
+            "running": self.running,
+            "rows": len(rows),
+            "enabled": [i + 1 for i, row in enumerate(rows) if row.get("enabled", True)],
+            "pending": len(self.engine.fire_index),
+            "late_events": len(self.engine.late_events),
+            "next_fire": {"row": next_fire[1], "time": next_fire[0].isoformat(timespec="milliseconds")}
+                         if next_fire else None,
+        }
+
+    def ipc_load(self, path):
+        self._ipc_require_idle()
+        self.config.load_file(path)
+        self.log(self.config.get_message("log_config_loaded", filename=os.path.basename(path)))
+
+    def ipc_append(self, rows):
+        self._ipc_require_idle()
+        self.config.timers_data.extend(rows)
+        self.log(self.config.get_message("log_ipc_rows_appended", count=len(rows)))
+        return len(rows)
+
+    def ipc_set_enabled(self, row_numbers, enabled):
+        self._ipc_require_idle()
+        rows = self.config.timers_data
+        changed = 0
+        for number in row_numbers:
+            idx = int(number) - 1
+            if 0 <= idx < len(rows):
+                rows[idx]["enabled"] = enabled
+                changed += 1
+        return changed
+
+    def ipc_start(self):
+        return self.running or self.start()
+
+    def ipc_stop(self):
+        if self.running:
+            self.engine.stop_all()
+            self.running = False
+            self.active_tasks_count = 0
+            self.log(self.config.get_message("log_stop_all_timer"))
+
+    def ipc_show(self):
+        pass  # No window
+
+    def shutdown(self, *_):
+        if self._shutting_down:
+            return
+        self._shutting_down = True
+        self.engine.stop_all()
+        if self.clock_sync:
+            self.clock_sync.stop()
+        if self.control_server:
+            self.control_server.close()
+        self.log(self.config.get_message("log_headless_exit"))
+        QCoreApplication.quit()
+
+
+DEFAULT_LOG_FILE = "config/headless.log"
+
+
+def run_headless(log_path=None):
+    """Entry point for `main.py --headless [--log FILE]`. Returns the process exit code."""
+    if log_path is None and sys.stdout is None:
+        # Windowed EXE (console=False) has no stdout: fall back to a log file
+        log_path = DEFAULT_LOG_FILE
+    if log_path:
+        log_dir = os.path.dirname(log_path)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    app.setApplicationName("Flow Track")
+
+    out = open(log_path, "a", encoding="utf-8") if log_path else sys.stdout
+    try:
+        runner = HeadlessRunner(ConfigManager(), out)
+        # Later launches / scripts drive this process through the control API
+        runner.control_server = ControlServer(runner, parent=runner)
+        runner.control_server.listen()
+        # v2.3: Resume a session that was still armed when the process died (core/journal.py)
+        started = time.perf_counter()
+        recovery = replay(JOURNAL_FILE) if runner.config.journal else None
+        if not (recovery is not None and runner.resume(recovery, started)) and not runner.start():
+            return runner.exit_code
+
+        # Ctrl+C / service stop: Python only sees signals when it gets control back,
+        # so a coarse idle timer hands the interpreter a slice twice a second.
+        signal.signal(signal.SIGINT, lambda *_: runner.shutdown())
+        signal.signal(signal.SIGTERM, lambda *_: runner.shutdown())
+        wakeup = QTimer()
+        wakeup.timeout.connect(lambda: None)
+        wakeup.start(500)
+
+        app.exec()
+        return runner.exit_code
+    finally:
+        if log_path:
+            out.close()
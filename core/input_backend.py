@@ -0,0 +1,339 @@
+import sys
+import time
+import weakref
+import threading
+
+VK_RETURN = 0x0D
+VK_CONTROL = 0x11
+VK_LWIN = 0x5B
+VK_D = ord('D')
+VK_V = ord('V')
+
+PASTE_MODES = ("clipboard", "type")
+
+TYPE_CHUNK_CHARS = 32          # Characters per SendInput batch in "type" mode
+TYPE_CHUNK_GAP = 0.01          # Lets the target's message queue drain between batches
+CLIPBOARD_READY_TIMEOUT = 0.5  # Upper bound for the clipboard to report the new text
+CLIPBOARD_POLL = 0.005
+CLIPBOARD_RESTORE_DELAY = 0.3  # Ctrl+V is consumed asynchronously by the target app
+
+# Restores waiting out CLIPBOARD_RESTORE_DELAY, per backend (one clipboard each)
+_restore_lock = threading.Lock()
+_pending_restores = weakref.WeakKeyDictionary()
+
+
+def _build_unicode_sender():
+    """SendInput wrapper typing text as KEYEVENTF_UNICODE events (no clipboard, no layout)."""
+    import ctypes
+    from ctypes import wintypes
+
+    INPUT_KEYBOARD = 1
+    KEYEVENTF_KEYUP = 0x0002
+    KEYEVENTF_UNICODE = 0x0004
+
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [("dx", wintypes.LONG), ("dy", wintypes.LONG), ("mouseData", wintypes.DWORD),
+                    ("dwFlags", wintypes.DWORD), ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+    class KEYBDINPUT(ctypes.Structure):
+        _fields_ = [("wVk", wintypes.WORD), ("wScan", wintypes.WORD), ("dwFlags", wintypes.DWORD),
+                    ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+    class _UNION(ctypes.Union):
+        # MOUSEINPUT is the largest member: keeps sizeof(INPUT) what SendInput expects
+        _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT)]
+
+    class INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("u", _UNION)]
+
+    send_input = ctypes.windll.user32.SendInput
+
+    def key(vk, scan, flags):
+        event = INPUT(type=INPUT_KEYBOARD)
+        event.u.ki = KEYBDINPUT(vk, scan, flags, 0, 0)
+        return event
+
+    def send(text):
+        events = []
+        for ch in text.replace("\r\n", "\n"):
+            if ch == "\n":
+                # Most edit controls ignore a Unicode LF: send a real Enter instead
+                events += (key(VK_RETURN, 0, 0), key(VK_RETURN, 0, KEYEVENTF_KEYUP))
+                continue
+            data = ch.encode("utf-16-le")
+            # Astral characters go out as their surrogate pair, one code unit per event
+            for i in range(0, len(data), 2):
+                unit = int.from_bytes(data[i:i + 2], "little")
+                events += (key(0, unit, KEYEVENTF_UNICODE),
+                           key(0, unit, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP))
+        if events:
+            # One SendInput call per chunk: the batch is never interleaved with other input
+            send_input(len(events), (INPUT * len(events))(*events), ctypes.sizeof(INPUT))
+
+    return send
+
+
+class Win32InputBackend:
+    """Real mouse / keyboard (pywin32 + SendInput) and clipboard (pyperclip)."""
+    def __init__(self):
+        import win32api
+        import win32con
+        import pyperclip
+        self._api = win32api
+        self._con = win32con
+        self._clip = pyperclip
+        self._send_unicode = _build_unicode_sender()
+
+    def move(self, x, y):
+        self._api.SetCursorPos((x, y))
+
+    def click(self):
+        self._api.mouse_event(self._con.MOUSEEVENTF_LEFTDOWN, 0, 0)
+        self._api.mouse_event(self._con.MOUSEEVENTF_LEFTUP, 0, 0)
+
+    def key_down(self, vk):
+        self._api.keybd_event(vk, 0, 0, 0)
+
+    def key_up(self, vk):
+        self._api.keybd_event(vk, 0, self._con.KEYEVENTF_KEYUP, 0)
+
+    def paste_shortcut(self):
+        self.key_down(VK_CONTROL)
+        self.key_down(VK_V)
+        self.key_up(VK_V)
+        self.key_up(VK_CONTROL)
+
+    def type_text(self, text):
+        self._send_unicode(text)
+
+    def get_clipboard(self):
+        try:
+            return self._clip.paste()
+        except Exception:
+            # Clipboard held open by another process: treat as unknown
+            return None
+
+    def set_clipboard(self, text):
+        self._clip.copy(text)
+
+    def clear_clipboard(self):
+        import win32clipboard
+        win32clipboard.OpenClipboard()
+        try:
+            win32clipboard.EmptyClipboard()
+        finally:
+            win32clipboard.CloseClipboard()
+
+
+class FakeInputBackend:
+    """
+    Recording stand-in for non-Windows hosts and benchmarks: every action is appended
+    to `events`. Clipboard writes become readable only after `clipboard_delay` seconds,
+    which emulates the owner round-trip that the clipboard path has to wait for.
+    """
+    def __init__(self, clipboard="", clipboard_delay=0.0):
+        self.events = []
+        self.clipboard_delay = clipboard_delay
+        self._clipboard = clipboard
+        self._pending = None  # (text, visible_at)
+        self._lock = threading.Lock()
+
+    def _record(self, *event):
+        with self._lock:
+            self.events.append(event)
+
+    def move(self, x, y):
+        self._record("move", x, y)
+
+    def click(self):
+        self._record("click")
+
+    def key_down(self, vk):
+        self._record("key_down", vk)
+
+    def key_up(self, vk):
+        self._record("key_up", vk)
+
+    def paste_shortcut(self):
+        self._record("paste", self.get_clipboard())
+
+    def type_text(self, text):
+        self._record("type", text)
+
+    def get_clipboard(self):
+        with self._lock:
+            if self._pending and time.perf_counter() >= self._pending[1]:
+                self._clipboard, self._pending = self._pending[0], None
+            return self._clipboard
+
+    def set_clipboard(self, text):
+        with self._lock:
+            self.events.append(("clipboard", text))
+            self._pending = (text, time.perf_counter() + self.clipboard_delay)
+
+    def clear_clipboard(self):
+        with self._lock:
+            self.events.append(("clipboard", None))
+            self._clipboard, self._pending = "", None
+
+
+def default_input_backend():
+    if sys.platform == "win32":
+        return Win32InputBackend()
+    return FakeInputBackend()
+
+
+def chunk_text(text, size=TYPE_CHUNK_CHARS):
+    """Split on code points (never inside a surrogate pair) into batches of `size`."""
+    return [text[i:i + size] for i in range(0, len(text), size)] or [""]
+
+
+class TextInjector:
+    """
+    Delivers one row's paste text for a whole task (v2.3).
+      "clipboard": the clipboard is set once per task (not once per click), readiness is
+                   polled instead of a fixed 100ms sleep, and the user's previous text is
+                   restored when the task ends. Only text round-trips: if the clipboard
+                   was empty, unreadable or held something else (an image, files, rich
+                   text only), it is emptied instead, so the task text never stays behind.
+                   The restore runs on a timer thread after CLIPBOARD_RESTORE_DELAY, not on
+                   the input executor; a task staging the clipboard before then takes the
+                   pending restore over, so the user's content comes back once, at the end.
+      "type":      the text is typed as Unicode key events in batched chunks; the
+                   clipboard is never touched.
+    Each paste's duration is recorded in `latencies_ms`.
+    """
+    def __init__(self, backend, mode, cancel_event, chunk_size=TYPE_CHUNK_CHARS):
+        self.backend = backend
+        self.mode = mode if mode in PASTE_MODES else "clipboard"
+        self.cancel_event = cancel_event
+        self.chunk_size = chunk_size
+        self.text = ""
+        self.latencies_ms = []
+        self._saved = None
+        self._staged = False
+        self._ready = False
+
+    def begin(self, text):
+        """Prepare the task's text. Returns False only if cancelled while waiting."""
+        self.text = text
+        if self.mode != "clipboard":
+            return True
+        with _restore_lock:
+            pending = _pending_restores.pop(self.backend, None)
+            if pending is not None:
+                # The clipboard still holds the previous task's text; the user's is in its restore
+                pending.timer.cancel()
+                self._saved = pending.saved
+            else:
+                self._saved = self.backend.get_clipboard()
+        self._staged = True
+        self.backend.set_clipboard(text)
+        return self._wait_ready()
+
+    def _wait_ready(self):
+        deadline = time.perf_counter() + CLIPBOARD_READY_TIMEOUT
+        while self.backend.get_clipboard() != self.text:
+            if time.perf_counter() >= deadline:
+                # Reader never confirmed (e.g. clipboard locked): fall through like legacy
+                break
+            if self.cancel_event.wait(CLIPBOARD_POLL):
+                return False
+        self._ready = True
+        return True
+
+    def paste(self):
+        """Deliver the text once at the current focus. Returns False if cancelled mid-way."""
+        t0 = time.perf_counter()
+        if self.mode == "clipboard":
+            if not self._ready and not self._wait_ready():
+                return False
+            self.backend.paste_shortcut()
+        else:
+            chunks = chunk_text(self.text, self.chunk_size)
+            for i, chunk in enumerate(chunks):
+                self.backend.type_text(chunk)
+                if i < len(chunks) - 1 and self.cancel_event.wait(TYPE_CHUNK_GAP):
+                    return False
+        self.latencies_ms.append((time.perf_counter() - t0) * 1000)
+        return True
+
+    def end(self):
+        """Restore the clipboard text that was there before the task (clipboard mode only)."""
+        if not self._staged:
+            return
+        self._staged = False
+        pending = _PendingRestore(self.backend, self._saved)
+        self._saved = None
+        if self.cancel_event.is_set():
+            pending.run()  # Stopped: nothing is pasting any more
+            return
+        with _restore_lock:
+            _pending_restores[self.backend] = pending
+            pending.timer.start()
+
+
+class _PendingRestore:
+    """One task's clipboard restore, due CLIPBOARD_RESTORE_DELAY after its last paste."""
+    def __init__(self, backend, saved):
+        self.backend = backend
+        self.saved = saved
+        self.timer = threading.Timer(CLIPBOARD_RESTORE_DELAY, self.run)
+        self.timer.daemon = False  # Still restores if the process is exiting
+
+    def run(self):
+        with _restore_lock:
+            if _pending_restores.get(self.backend, self) is not self:
+                return  # Taken over by a later task
+            _pending_restores.pop(self.backend, None)
+            if self.saved:
+                self.backend.set_clipboard(self.saved)
+            else:
+                # No text to put back (see TextInjector): do not leave the task text behind
+                self.backend.clear_clipboard()
+
+
+def flush_clipboard_restores():
+    """Run every pending restore now (before a process exits without joining threads)."""
+    with _restore_lock:
+        pending = list(_pending_restores.values())
+    for restore in pending:
+        restore.timer.cancel()
+        restore.run()
+
+
+def measure_paste_latency(mode, text, repeats=20, backend=None, clipboard_delay=0.02):
+    """
+    Per-paste latencies (ms) for `mode` ("clipboard", "type" or "legacy") against a
+    fake backend. "legacy" replays the old per-click copy + fixed 100ms sleep.
+    """
+    backend = backend if backend is not None else FakeInputBackend(clipboard_delay=clipboard_delay)
+    cancel_event = threading.Event()
+    if mode == "legacy":
+        latencies = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            backend.set_clipboard(text)
+            cancel_event.wait(0.1)
+            backend.paste_shortcut()
+            latencies.append((time.perf_counter() - t0) * 1000)
+        return latencies
+    injector = TextInjector(backend, mode, cancel_event)
+    t0 = time.perf_counter()
+    injector.begin(text)
+    setup_ms = (time.perf_counter() - t0) * 1000
+    for _ in range(repeats):
+        injector.paste()
+    injector.end()
+    # The one-off clipboard setup is charged to the first paste
+    latencies = list(injector.latencies_ms)
+    latencies[0] += setup_ms
+    return latencies
+
+
+if __name__ == "__main__":
+    sample = "Flow Track 定时粘贴 ✓ " * 4
+    for mode in ("legacy", "clipboard", "type"):
+        samples = measure_paste_latency(mode, sample)
+        print(f"{mode:9s} pastes={len(samples)} total={sum(samples):8.1f}ms "
+              f"avg={sum(samples) / len(samples):6.2f}ms max={max(samples):6.2f}ms")
@@ -0,0 +1,167 @@
+import sys
+import time
+import heapq
+import threading
+from collections import deque
+
+# Last stretch before a pre-armed deadline is spun: Windows waits are ~15.6ms granular
+SPIN_WINDOW = 0.02 if sys.platform == "win32" else 0.002
+
+
+class InputJob:
+    """One atomic action group: a row's whole occurrence (move, clicks, pastes)."""
+    __slots__ = ("deadline", "timer_no", "seq", "action", "prepare", "done", "result",
+                 "submitted", "started", "queue_delay_ms", "guard_state", "not_before", "error")
+
+    def __init__(self, deadline, timer_no, seq, action, prepare=None, submitted=0.0, not_before=0.0):
+        self.deadline = deadline
+        self.not_before = not_before
+        self.timer_no = timer_no
+        self.seq = seq
+        self.action = action
+        self.prepare = prepare
+        self.done = threading.Event()
+        self.result = False
+        self.error = None  # Exception raised by prepare / action, for the submitting worker to log
+        self.submitted = submitted
+        self.started = None
+        self.queue_delay_ms = 0.0
+        self.guard_state = "off"
+
+    def __lt__(self, other):
+        return (self.deadline, self.timer_no, self.seq) < (other.deadline, other.timer_no, other.seq)
+
+
+class InputExecutor:
+    """
+    Serialized input executor (v2.3).
+    Every row used to drive the global mouse / keyboard / clipboard from its own thread,
+    so rows sharing a timestamp interleaved their SetCursorPos / click / Ctrl+V sequences.
+    Workers now hand their action group to this single thread `SUBMIT_LEAD` seconds
+    before the deadline; groups run one at a time ordered by (deadline, row number),
+    and the time each group spent queued behind another is measured.
+    Pre-arm (v2.3): `pre_arm` seconds before the deadline the head group's `prepare`
+    step runs (cursor move, clipboard load, plan resolution), so at the deadline only
+    the click / keystroke itself goes out.
+    Critical window (v2.3): with a CriticalGuard, the thread is guarded (priority, GC,
+    deferred housekeeping) from `guard.window` before each deadline (after any pre-arm
+    step) until the group ends.
+    """
+    SUBMIT_LEAD = 0.25       # Minimum seconds before the deadline a worker enqueues its group
+    DELAY_HISTORY = 1000
+
+    def __init__(self, pre_arm=0.0, clock=None, guard=None):
+        self.pre_arm = max(0.0, pre_arm)
+        self.guard = guard
+        # v2.3: Deadlines are in reference-clock time when a ReferenceClock is supplied
+        self._now = clock.time if clock is not None else time.time
+        # Groups must be queued before any earlier one can be pre-armed, keeping the order
+        window = guard.window if guard is not None else 0.0
+        self.submit_lead = max(self.SUBMIT_LEAD, max(self.pre_arm, window) + 0.05)
+        self._heap = []
+        self._cond = threading.Condition()
+        self._stop_event = threading.Event()
+        self._seq = 0
+        self._stopped = False
+        self._thread = None
+        self.delays_ms = deque(maxlen=self.DELAY_HISTORY)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="InputExecutor", daemon=True)
+        self._thread.start()
+
+    def submit(self, deadline, timer_no, action, prepare=None, not_before=0.0):
+        """
+        Queue `action` for epoch-seconds `deadline`; wait on the returned job's `done`.
+        `prepare()` runs in the pre-arm window and its plan is passed to `action`; if the
+        group is dropped after preparing, `plan.release()` undoes the staging.
+        `not_before` holds an overdue group briefly so others due earlier can overtake it.
+        """
+        with self._cond:
+            self._seq += 1
+            job = InputJob(deadline, timer_no, self._seq, action, prepare, self._now(), not_before)
+            if self._stopped:
+                job.done.set()
+                return job
+            heapq.heappush(self._heap, job)
+            self._cond.notify()
+        return job
+
+    def stop(self):
+        """Drop pending groups (their waiters wake with result False); the running one finishes."""
+        self._stop_event.set()
+        with self._cond:
+            self._stopped = True
+            pending, self._heap = self._heap, []
+            self._cond.notify()
+        for job in pending:
+            job.done.set()
+
+    def _next_job(self):
+        with self._cond:
+            while not self._stopped:
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                head = self._heap[0]
+                delay = max(head.deadline - self._lead(head), head.not_before) - self._now()
+                if delay > 0:
+                    # Re-evaluated on wake-up: an earlier group may have been submitted meanwhile
+                    self._cond.wait(delay)
+                    continue
+                return heapq.heappop(self._heap)
+            return None
+
+    def _lead(self, job):
+        """How long before its deadline a group is taken off the queue."""
+        lead = self.pre_arm if job.prepare else 0.0
+        return max(lead, self.guard.window) if self.guard is not None else lead
+
+    def _wait_until(self, deadline):
+        """Sleep most of the way, spin the rest. False if the executor was stopped."""
+        remaining = deadline - self._now()
+        if remaining > SPIN_WINDOW and self._stop_event.wait(remaining - SPIN_WINDOW):
+            return False
+        while self._now() < deadline:
+            pass
+        return not self._stop_event.is_set()
+
+    def _run(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            guard = self.guard
+            guarded = False
+            plan = None
+            try:
+                if job.prepare:
+                    # Taken off the queue early enough for both the pre-arm point and the window
+                    if self._stop_event.wait(max(0.0, job.deadline - self.pre_arm - self._now())):
+                        continue
+                    plan = job.prepare()
+                stopped = False
+                if guard is not None:
+                    # The window opens `guard.window` before the deadline, not when the group was dequeued
+                    stopped = self._stop_event.wait(max(0.0, job.deadline - guard.window - self._now()))
+                    if not stopped:
+                        guard.enter()
+                        guarded = True
+                if stopped or not self._wait_until(job.deadline):
+                    if plan is not None:
+                        plan.release()
+                    continue
+                job.started = self._now()
+                if guard is not None:
+                    job.guard_state = guard.state()
+                # Time spent due-but-waiting (behind the previous group or the OS wake-up)
+                job.queue_delay_ms = max(0.0, job.started - max(job.deadline, job.submitted, job.not_before)) * 1000
+                self.delays_ms.append(job.queue_delay_ms)
+                job.result = job.action(plan) if job.prepare else job.action()
+            except Exception as e:
+                job.result = False
+                job.error = e
+            finally:
+                if guarded:
+                    guard.exit()
+                job.done.set()
@@ -0,0 +1,370 @@
+"""
+Isolated input process (v2.3).
+
+With General/input_process enabled, mouse / keyboard / clipboard injection runs in a
+small child process instead of a thread of the GUI process, so a long repaint, a big
+log append or a GC pass on the GUI side can no longer hold the GIL at a deadline.
+
+Workers send a compiled, picklable plan plus its deadline over a multiprocessing pipe
+at the usual submit lead; the child queues it on its own InputExecutor (same ordering,
+pre-arm and spin-wait rules as in-process) and reports telemetry for every group.
+
+If the child fails to start or exits while the session runs, the executor fails over
+to an in-process InputExecutor running the same plans: groups not yet due are moved
+there, a group that may already have been running is reported as failed, and the
+owner is told once (`on_exit`) so the failure is logged instead of swallowed.
+
+Plans:
+    ("desktop",)                                   Win+D
+    ("macro", [(offset_ms, op, args), ...])        see core.macro.compile_plan
+    ("clicks", x, y, count, interval, paste_text)  drift-free clicks, paste after each
+
+`python -m core.input_process` benchmarks fire lateness in-process vs. isolated while
+the parent process is kept busy with synthetic GUI-like load.
+"""
+import sys
+import time
+import threading
+import multiprocessing
+
+from core.input_backend import (FakeInputBackend, default_input_backend, TextInjector, flush_clipboard_restores,
+                                VK_LWIN, VK_D)
+from core.input_executor import InputExecutor
+from core.critical_window import CriticalGuard
+from core.burst import run_burst
+from core.macro import run_plan
+
+
+def remote_plan(data):
+    """Picklable plan for one occurrence of a compiled task dict."""
+    if data['show_desktop']:
+        return ("desktop",)
+    if data.get('macro'):
+        return ("macro", data['macro'])
+    return ("clicks", data['x'], data['y'], data['clicks'], data['interval'], data['paste_text'])
+
+
+class _Staged:
+    """Pre-armed state in the child; release() restores the clipboard."""
+    __slots__ = ("injector", "error")
+
+    def __init__(self, injector=None, error=None):
+        self.injector = injector
+        self.error = error
+
+    def release(self):
+        if self.injector:
+            self.injector.end()
+            self.injector = None
+
+
+def _stage(plan, backend, paste_mode, cancel_event):
+    kind = plan[0]
+    if kind == "macro" and plan[1] and plan[1][0][:2] == (0, "move"):
+        backend.move(*plan[1][0][2])
+    elif kind == "clicks":
+        _, x, y, _, _, text = plan
+        backend.move(x, y)
+        if text:
+            injector = TextInjector(backend, paste_mode, cancel_event)
+            injector.begin(text)
+            return _Staged(injector)
+    return _Staged()
+
+
+def _fire(plan, staged, backend, cancel_event):
+    """Run one plan; returns the telemetry fields specific to its kind."""
+    kind = plan[0]
+    if kind == "desktop":
+        backend.key_down(VK_LWIN)
+        backend.key_down(VK_D)
+        cancel_event.wait(0.05)
+        backend.key_up(VK_D)
+        backend.key_up(VK_LWIN)
+        return {"count": 1}
+    if kind == "macro":
+        done, max_late_ms, cancelled = run_plan(plan[1], backend, cancel_event)
+        return {"count": done, "jitter_max_ms": max_late_ms, "cancelled": cancelled}
+    _, x, y, count, interval, _ = plan
+    injector = staged.injector
+
+    def fire_one():
+        backend.move(x, y)
+        backend.click()
+        return injector.paste() if injector else True
+
+    stats = run_burst(count, interval, fire_one, cancel_event)
+    return {"count": stats.count, "jitter_max_ms": stats.jitter_max_ms, "cancelled": stats.cancelled}
+
+
+def _plan_job(seq, deadline, plan, backend, paste_mode, cancel_event, guard, report):
+    """(prepare, action) for an InputExecutor; `report(fields)` receives the telemetry."""
+    def prepare():
+        try:
+            return _stage(plan, backend, paste_mode, cancel_event)
+        except Exception as e:
+            return _Staged(error=str(e))  # Reported when the group is due
+
+    def action(staged):
+        started = time.time()
+        fields = {"seq": seq, "ok": True, "late_ms": (started - deadline) * 1000,
+                  "guard": guard.state() if guard is not None else "off"}
+        try:
+            if staged.error:
+                raise RuntimeError(staged.error)
+            fields.update(_fire(plan, staged, backend, cancel_event))
+        except Exception as e:
+            fields.update(ok=False, error=str(e))
+        finally:
+            staged.release()
+        fields["elapsed_ms"] = (time.time() - started) * 1000
+        report(fields)
+        return fields["ok"]
+
+    return prepare, action
+
+
+def _child_main(conn, pre_arm, paste_mode, fake, critical_window=0.0):
+    """Entry point of the input process: receive plans, fire them on time, report back."""
+    backend = FakeInputBackend() if fake else default_input_backend()
+    cancel_event = threading.Event()
+    guard = CriticalGuard(critical_window) if critical_window > 0 else None
+    executor = InputExecutor(pre_arm=pre_arm, guard=guard)
+    executor.start()
+    send_lock = threading.Lock()
+
+    def report(fields):
+        with send_lock:
+            try:
+                conn.send(fields)
+            except (OSError, EOFError):
+                pass
+
+    while True:
+        try:
+            msg = conn.recv()
+        except (EOFError, OSError):
+            break
+        if msg[0] == "stop":
+            break
+        _, seq, deadline, timer_no, plan, not_before = msg
+        prepare, action = _plan_job(seq, deadline, plan, backend, paste_mode, cancel_event, guard, report)
+        executor.submit(deadline, timer_no, action, prepare, not_before)
+    cancel_event.set()
+    executor.stop()
+    flush_clipboard_restores()
+    conn.close()
+
+
+class RemoteJob:
+    """Parent-side handle mirroring InputJob: wait on `done`, then read the telemetry."""
+    __slots__ = ("seq", "deadline", "timer_no", "plan", "local_deadline", "local_not_before",
+                 "done", "result", "error", "started", "queue_delay_ms", "telemetry")
+
+    def __init__(self, seq, deadline, timer_no, plan=None, local_deadline=0.0, local_not_before=0.0):
+        self.seq = seq
+        self.deadline = deadline
+        self.timer_no = timer_no
+        self.plan = plan
+        self.local_deadline = local_deadline
+        self.local_not_before = local_not_before
+        self.done = threading.Event()
+        self.result = False
+        self.error = None  # Set when the group was lost with the input process
+        self.started = None
+        self.queue_delay_ms = 0.0
+        self.telemetry = {}
+
+
+class ProcessInputExecutor:
+    """
+    Drop-in for InputExecutor that hands plans to the input process (`remote` = True:
+    workers call submit_plan() instead of submit()). Deadlines are converted from the
+    engine clock to the child's local clock at submit time. `on_exit(reason)` is called
+    (from a background thread) if the child fails to start or dies; see the module docstring.
+    """
+    remote = True
+    SUBMIT_LEAD = InputExecutor.SUBMIT_LEAD
+    STOP_GRACE = 1.0
+
+    def __init__(self, pre_arm=0.0, clock=None, paste_mode="clipboard", fake=None, critical_window=0.0,
+                 on_exit=None):
+        self.pre_arm = max(0.0, pre_arm)
+        self.critical_window = max(0.0, critical_window)
+        self.submit_lead = max(self.SUBMIT_LEAD, max(self.pre_arm, self.critical_window) + 0.05)
+        self._now = clock.time if clock is not None else time.time
+        self.paste_mode = paste_mode
+        self.fake = fake if fake is not None else sys.platform != "win32"
+        self._jobs = {}
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._conn = None
+        self._proc = None
+        self.on_exit = on_exit
+        self._fallback = None  # In-process InputExecutor once the child is gone
+        self._backend = None
+        self._cancel = threading.Event()
+
+    def start(self):
+        # spawn everywhere: forking a process that runs Qt threads is not safe
+        ctx = multiprocessing.get_context("spawn")
+        try:
+            self._conn, child_conn = ctx.Pipe()
+            self._proc = ctx.Process(target=_child_main, name="FlowTrackInput", daemon=True,
+                                     args=(child_conn, self.pre_arm, self.paste_mode, self.fake, self.critical_window))
+            self._proc.start()
+        except Exception as e:
+            self._fail_over(f"{type(e).__name__}: {e}")
+            return
+        child_conn.close()
+        threading.Thread(target=self._read_telemetry, name="InputProcessReader", daemon=True).start()
+
+    def submit_plan(self, deadline, timer_no, plan, not_before=0.0):
+        """Queue `plan` for engine-clock epoch-seconds `deadline`; wait on the job's `done`."""
+        with self._lock:
+            self._seq += 1
+            skew = self._now() - time.time()
+            job = RemoteJob(self._seq, deadline, timer_no, plan, deadline - skew,
+                            not_before - skew if not_before else 0.0)
+            if self._stopped:
+                job.done.set()
+                return job
+            self._jobs[job.seq] = job
+            if self._fallback is None:
+                try:
+                    self._conn.send(("job", job.seq, job.local_deadline, timer_no, plan, job.local_not_before))
+                except (OSError, EOFError):
+                    pass  # The child is gone: the reader fails over, moving this job too
+                return job
+        self._submit_local(job)
+        return job
+
+    def stop(self):
+        """Drop pending groups (their waiters wake with result False) and end the process."""
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            self._cancel.set()
+            pending, self._jobs = self._jobs, {}
+            if self._fallback is not None:
+                self._fallback.stop()
+            else:
+                try:
+                    self._conn.send(("stop",))
+                except (OSError, EOFError, AttributeError):
+                    pass
+        for job in pending.values():
+            job.done.set()
+
+    def _complete(self, fields):
+        with self._lock:
+            job = self._jobs.pop(fields["seq"], None)
+        if job is None:
+            return
+        job.telemetry = fields
+        job.result = True  # Reported = executed (errors are in the telemetry)
+        if "late_ms" in fields:
+            job.started = job.deadline + fields["late_ms"] / 1000
+            job.queue_delay_ms = max(0.0, fields["late_ms"])
+        job.done.set()
+
+    def _read_telemetry(self):
+        while True:
+            try:
+                fields = self._conn.recv()
+            except (EOFError, OSError):
+                break
+            self._complete(fields)
+        self._conn.close()
+        self._proc.join(self.STOP_GRACE)
+        if self._proc.is_alive():
+            self._proc.terminate()
+        # Gone without stop(): crashed, killed or failed during start-up
+        self._fail_over(f"input process exited with code {self._proc.exitcode}")
+
+    def _fail_over(self, reason):
+        """Continue in-process: move the groups not yet due, fail the one that may have been running."""
+        with self._lock:
+            if self._stopped or self._fallback is not None:
+                return
+            self._backend = FakeInputBackend() if self.fake else default_input_backend()
+            guard = CriticalGuard(self.critical_window) if self.critical_window > 0 else None
+            self._fallback = InputExecutor(pre_arm=self.pre_arm, guard=guard)
+            self._fallback.start()
+            now = time.time()
+            moved = [job for job in self._jobs.values() if job.local_deadline > now]
+            lost = [job for job in self._jobs.values() if job.local_deadline <= now]
+            for job in lost:
+                del self._jobs[job.seq]
+        if self.on_exit is not None:
+            self.on_exit(reason)
+        for job in lost:
+            job.error = f"{reason}; this group was interrupted or lost"
+            job.done.set()
+        for job in sorted(moved, key=lambda job: job.seq):
+            self._submit_local(job)
+
+    def _submit_local(self, job):
+        prepare, action = _plan_job(job.seq, job.local_deadline, job.plan, self._backend, self.paste_mode,
+                                    self._cancel, self._fallback.guard, self._complete)
+        fallback_job = self._fallback.submit(job.local_deadline, job.timer_no, action, prepare, job.local_not_before)
+        if fallback_job.done.is_set() and not fallback_job.result:
+            # Fallback already stopped (stop() raced with the fail-over)
+            with self._lock:
+                self._jobs.pop(job.seq, None)
+            job.done.set()
+
+
+def _gui_load(stop_event):
+    """Synthetic GUI-side load: GIL-bound work with allocation churn (repaints, log appends, GC)."""
+    while not stop_event.is_set():
+        junk = [{"row": i, "text": str(i) * 8} for i in range(20000)]
+        "".join(item["text"] for item in junk)
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def benchmark(fires=40, spacing=0.05, load_threads=2):
+    """Fire lateness (ms) in-process vs. isolated while the parent runs `load_threads` busy threads."""
+    results = {}
+    for mode in ("in-process", "isolated"):
+        stop_load = threading.Event()
+        if mode == "in-process":
+            executor = InputExecutor()
+        else:
+            executor = ProcessInputExecutor(fake=True)
+        executor.start()
+        time.sleep(1.0 if mode == "isolated" else 0.0)  # Let the child finish importing
+        loaders = [threading.Thread(target=_gui_load, args=(stop_load,), daemon=True) for _ in range(load_threads)]
+        for loader in loaders:
+            loader.start()
+        base = time.time() + 0.5
+        jobs = []
+        backend = FakeInputBackend()
+        for i in range(fires):
+            deadline = base + i * spacing
+            if mode == "in-process":
+                jobs.append(executor.submit(deadline, i, backend.click))
+            else:
+                jobs.append(executor.submit_plan(deadline, i, ("clicks", 0, 0, 1, 1.0, "")))
+        for job in jobs:
+            job.done.wait(10)
+        stop_load.set()
+        executor.stop()
+        late = [(job.started - job.deadline) * 1000 for job in jobs if job.started is not None]
+        results[mode] = late
+    return results
+
+
+if __name__ == "__main__":
+    for mode, late in benchmark().items():
+        if late:
+            print(f"{mode:10s} fires={len(late)} avg={sum(late) / len(late):7.2f}ms "
+                  f"p95={_percentile(late, 0.95):7.2f}ms max={max(late):7.2f}ms")
+        else:
+            print(f"{mode:10s} no fires completed")
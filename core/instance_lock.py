@@ -0,0 +1,113 @@
+"""
+Single-instance lock (v2.3).
+
+Windows keeps the named kernel mutex of v2.2. Elsewhere an exclusive fcntl lock on a
+per-user lock file is used: the kernel drops it when the holder exits or crashes, so a
+leftover file never blocks a new launch. The holder's PID is written into the file;
+if the lock is found held but that PID is gone (the descriptor leaked into an orphaned
+child, or a network filesystem kept a dead lock), the file is replaced once. The file
+itself is never removed on release: a launcher may already have it open, and would
+lock the orphaned inode while another one locks a fresh file.
+
+Nothing Windows-specific is imported on the POSIX path and vice versa.
+"""
+import os
+import sys
+import tempfile
+
+LOCK_NAME = "FlowTrack_Instance_Mutex_9D2A3B4C-v2.2"
+
+
+class Win32MutexLock:
+    """Named kernel mutex; held until the process exits (or release())."""
+    def __init__(self, name=LOCK_NAME):
+        self.name = "Local\\" + name
+        self._handle = None
+
+    def acquire(self):
+        import win32event
+        import win32api
+        import winerror
+        # CreateMutex(security_attributes, initial_owner, name)
+        handle = win32event.CreateMutex(None, False, self.name)
+        if win32api.GetLastError() == winerror.ERROR_ALREADY_EXISTS:
+            win32api.CloseHandle(handle)
+            return False
+        self._handle = handle  # Keep the reference: the mutex lives as long as the handle
+        return True
+
+    def release(self):
+        if self._handle is not None:
+            import win32api
+            win32api.CloseHandle(self._handle)
+            self._handle = None
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by someone else
+    return True
+
+
+class PosixFileLock:
+    """Exclusive, non-blocking fcntl lock on a per-user file holding the owner's PID."""
+    def __init__(self, name=LOCK_NAME, path=None):
+        uid = os.getuid() if hasattr(os, "getuid") else 0
+        self.path = path or os.path.join(tempfile.gettempdir(), f"{name}-{uid}.lock")
+        self._fd = None
+
+    def _try_lock(self):
+        import fcntl
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return None
+        try:
+            same = os.fstat(fd).st_ino == os.stat(self.path).st_ino
+        except OSError:
+            same = False
+        if not same:
+            # Replaced by a stale-lock recovery between open and flock: this inode is orphaned
+            os.close(fd)
+            return None
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        return fd
+
+    def holder_pid(self):
+        try:
+            with open(self.path, encoding="ascii") as f:
+                return int(f.read().strip() or 0) or None
+        except (OSError, ValueError):
+            return None
+
+    def acquire(self):
+        self._fd = self._try_lock()
+        if self._fd is None:
+            pid = self.holder_pid()
+            if pid is not None and pid != os.getpid() and not _pid_alive(pid):
+                # Stale: the recorded owner is gone but the lock is still held
+                try:
+                    os.unlink(self.path)
+                except OSError:
+                    pass
+                self._fd = self._try_lock()
+        return self._fd is not None
+
+    def release(self):
+        if self._fd is not None:
+            # Closing drops the lock; the file stays (see the module docstring)
+            os.close(self._fd)
+            self._fd = None
+
+
+def default_instance_lock(name=LOCK_NAME):
+    if sys.platform == "win32":
+        return Win32MutexLock(name)
+    return PosixFileLock(name)
@@ -0,0 +1,249 @@
+"""
+Local control API (v2.3).
+
+The running instance hosts a QLocalServer (a named pipe on Windows, a Unix socket
+elsewhere). Later launches and scripts forward commands to it instead of starting
+a second Qt process. The protocol is one JSON value per line: a command object, or
+a list of them for bulk requests; the reply mirrors the request (object or list).
+
+    {"cmd": "status"}
+    {"cmd": "load", "path": "other.ini"}
+    {"cmd": "append", "rows": [{"time": "093000", "x": "640", "y": "360"}]}
+    {"cmd": "enable", "rows": [1, 2, 5]}       (1-based row numbers; "disable" likewise)
+    {"cmd": "start"}  {"cmd": "stop"}  {"cmd": "show"}
+
+Every reply carries "ok"; failures add "error". The client side is plain Python
+(socket / pipe file) so forwarding never imports Qt, and gives up after REPLY_TIMEOUT
+if the instance accepts the connection but never answers.
+"""
+import os
+import sys
+import json
+import time
+import socket
+import tempfile
+
+IPC_NAME = "FlowTrack_Control_9D2A3B4C-v2.3"
+CONNECT_TIMEOUT = 2.0
+REPLY_TIMEOUT = 10.0
+PIPE_POLL = 0.005
+
+
+def server_address():
+    """QLocalServer name: a pipe name on Windows, an absolute per-user socket path elsewhere."""
+    if sys.platform == "win32":
+        return IPC_NAME
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(tempfile.gettempdir(), f"{IPC_NAME}-{uid}.sock")
+
+
+def parse_command(text):
+    """CLI word or JSON -> command dict: 'status' -> {"cmd": "status"}."""
+    text = text.strip()
+    if text.startswith("{"):
+        return json.loads(text)
+    return {"cmd": text}
+
+
+ROW_DEFAULTS = {
+    "enabled": True, "x": "", "y": "", "time": "000000", "show_desktop": False,
+    "clicks": "1", "interval": "1", "paste_text": "", "time_ms": 0, "day_offset": 0,
+    "repeat": "", "date": "", "steps": "", "trigger": "", "late": "",
+}
+
+
+def row_from_command(row):
+    """A row dict from an append command, completed with the same fallbacks as config loading."""
+    if not isinstance(row, dict):
+        raise ValueError("each row must be an object")
+    row = dict(ROW_DEFAULTS, **row)
+    row["time"] = str(row["time"])
+    if len(row["time"]) != 6 or not row["time"].isdigit():
+        raise ValueError(f"time must be HHMMSS: {row['time']!r}")
+    for key in ("x", "y", "clicks", "interval"):
+        row[key] = str(row[key])
+    return row
+
+
+def _rows_arg(command):
+    rows = command.get("rows", [])
+    if not isinstance(rows, list):
+        raise ValueError("'rows' must be a list")
+    return rows
+
+
+def dispatch(target, command):
+    """
+    Run one command dict against `target`, which provides ipc_status(), ipc_load(path),
+    ipc_append(rows), ipc_set_enabled(row_numbers, enabled), ipc_start(), ipc_stop()
+    and ipc_show(). Returns the reply dict; never raises (it runs in a Qt slot, and the
+    client waits for a reply line).
+    """
+    try:
+        if not isinstance(command, dict):
+            raise ValueError("command must be an object")
+        cmd = command.get("cmd")
+        if cmd == "status":
+            return dict(target.ipc_status(), ok=True)
+        if cmd == "load":
+            target.ipc_load(command["path"])
+        elif cmd == "append":
+            rows = [row_from_command(row) for row in _rows_arg(command)]
+            return {"ok": True, "appended": target.ipc_append(rows)}
+        elif cmd in ("enable", "disable"):
+            return {"ok": True, "changed": target.ipc_set_enabled(_rows_arg(command), cmd == "enable")}
+        elif cmd == "start":
+            return {"ok": bool(target.ipc_start())}
+        elif cmd == "stop":
+            target.ipc_stop()
+        elif cmd == "show":
+            target.ipc_show()
+        else:
+            raise ValueError(f"unknown command: {cmd!r}")
+        return {"ok": True}
+    except Exception as e:
+        # e.g. configparser.Error from a malformed INI on load
+        return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+
+def handle_line(target, line):
+    """One request line -> one reply line (without the newline)."""
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        return json.dumps({"ok": False, "error": f"bad request: {e}"})
+    if isinstance(request, list):
+        return json.dumps([dispatch(target, command) for command in request], ensure_ascii=False)
+    return json.dumps(dispatch(target, request), ensure_ascii=False)
+
+
+class ControlServer:
+    """QLocalServer wrapper feeding request lines to `handle_line(target, ...)`."""
+    def __init__(self, target, name=None, parent=None):
+        from PySide6.QtNetwork import QLocalServer
+        self.target = target
+        self.name = name or server_address()
+        self.server = QLocalServer(parent)
+        self.server.newConnection.connect(self._on_connection)
+        self._buffers = {}
+
+    def listen(self):
+        from PySide6.QtNetwork import QLocalServer
+        # A crashed previous instance may have left its socket file behind; the caller
+        # already holds the single-instance lock, so nobody else can be serving it
+        QLocalServer.removeServer(self.name)
+        return self.server.listen(self.name)
+
+    def close(self):
+        self.server.close()
+
+    def _on_connection(self):
+        while self.server.hasPendingConnections():
+            conn = self.server.nextPendingConnection()
+            self._buffers[conn] = b""
+            conn.readyRead.connect(lambda c=conn: self._on_ready_read(c))
+            conn.disconnected.connect(lambda c=conn: self._forget(c))
+
+    def _forget(self, conn):
+        self._buffers.pop(conn, None)
+        conn.deleteLater()
+
+    def _on_ready_read(self, conn):
+        data = self._buffers.get(conn, b"") + bytes(conn.readAll())
+        *lines, rest = data.split(b"\n")
+        self._buffers[conn] = rest
+        for line in lines:
+            if line.strip():
+                # Invalid UTF-8 becomes a "bad request" reply instead of an exception here
+                reply = handle_line(self.target, line.decode("utf-8", "replace"))
+                conn.write((reply + "\n").encode("utf-8"))
+        conn.flush()
+
+
+def _connect(address, timeout, reply_timeout):
+    """Binary file-like channel to the server (Unix socket, or the named pipe on Windows)."""
+    if sys.platform == "win32":
+        return open("\\\\.\\pipe\\" + address, "r+b", buffering=0)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(address)
+        sock.settimeout(reply_timeout)
+        return sock.makefile("rwb")
+    finally:
+        # makefile() holds its own reference; the socket closes with the file
+        sock.close()
+
+
+def _read_pipe(channel, deadline):
+    """
+    Next chunk from the Windows pipe. A plain read() on it blocks without a timeout, so
+    PeekNamedPipe polls until data is there. b"" once the server has closed the pipe.
+    """
+    import ctypes
+    import msvcrt
+    from ctypes import wintypes
+    handle = msvcrt.get_osfhandle(channel.fileno())
+    available = wintypes.DWORD()
+    while True:
+        if not ctypes.windll.kernel32.PeekNamedPipe(handle, None, 0, None, ctypes.byref(available), None):
+            return b""  # Broken pipe: the server went away
+        if available.value:
+            return channel.read(available.value)
+        if time.monotonic() >= deadline:
+            raise TimeoutError("timed out")
+        time.sleep(PIPE_POLL)
+
+
+def send_commands(commands, address=None, timeout=CONNECT_TIMEOUT, reply_timeout=REPLY_TIMEOUT):
+    """
+    Send one command dict (or a list for a bulk request) to the running instance and
+    return its reply. Connecting is retried until `timeout` while the instance is still
+    starting up; the request itself is sent once. Raises OSError if nothing answers,
+    or if no reply arrives within `reply_timeout`.
+    """
+    address = address or server_address()
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            channel = _connect(address, timeout, reply_timeout)
+            break
+        except OSError as e:
+            if time.monotonic() >= deadline:
+                raise OSError(f"no running instance at {address}: {e}") from e
+            time.sleep(0.05)
+    with channel:
+        channel.write((json.dumps(commands, ensure_ascii=False) + "\n").encode("utf-8"))
+        channel.flush()
+        reply = b""
+        reply_deadline = time.monotonic() + reply_timeout
+        while not reply.endswith(b"\n"):
+            # Pipe: polled raw reads; socket: buffered line reads under the socket timeout
+            try:
+                chunk = _read_pipe(channel, reply_deadline) if sys.platform == "win32" else channel.readline()
+            except TimeoutError as e:
+                raise OSError(f"no reply from {address} within {reply_timeout:g}s") from e
+            if not chunk:
+                break
+            reply += chunk
+    try:
+        return json.loads(reply.decode("utf-8"))
+    except ValueError as e:
+        raise OSError(f"bad reply from {address}: {e}") from e
+
+
+def main(argv):
+    """`python -m core.ipc status '{"cmd": "enable", "rows": [2]}' ...`: one bulk request."""
+    commands = [parse_command(arg) for arg in argv] or [{"cmd": "status"}]
+    try:
+        reply = send_commands(commands if len(commands) > 1 else commands[0])
+    except OSError as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(json.dumps(reply, ensure_ascii=False, indent=2))
+    replies = reply if isinstance(reply, list) else [reply]
+    return 0 if all(r.get("ok") for r in replies) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
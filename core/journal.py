@@ -0,0 +1,162 @@
+"""
+Crash-safe execution journal (v2.3).
+
+config.ini is only written on a clean exit, so a crash or kill used to lose the armed
+session. While a schedule runs, every state change is appended to JOURNAL_FILE, one
+JSON array per line:
+
+    ["session", started_epoch, rows]     rows as in TimerCard.get_values()
+    ["arm", timer_no, deadline_epoch]    armed (recurring rows: each next occurrence)
+    ["fire", timer_no]                   handed to the input executor
+    ["done", timer_no]                   one-shot row finished (fired or skipped)
+    ["cancel", timer_no]                 dropped by Stop
+    ["end"]                              session over (all done, Stop or exit)
+
+The session header and initial arms are written and fsynced at Start; after that a
+writer thread batches appends and fsyncs at most every FSYNC_INTERVAL seconds.
+
+On startup a journal without "end" is replayed: its rows come back and only rows still
+pending are re-armed at their journaled deadlines (the GUI asks first). Deadlines passed
+in the meantime are skipped unless the row has its own late policy (see
+core.schedule.resume_tasks). Rows that fired but never finished are not re-armed, so a
+crash in the middle of an action cannot repeat its input.
+"""
+import os
+import json
+import time
+import threading
+
+JOURNAL_FILE = "config/session.journal"
+FSYNC_INTERVAL = 0.2
+STOP_GRACE = 2.0
+
+
+def _line(record):
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+class Journal:
+    """One session's append-only log; records after end() are ignored."""
+    def __init__(self, path=JOURNAL_FILE):
+        self.path = path
+        self._queue = []
+        self._cond = threading.Condition()
+        self._file = None
+        self._closing = False
+        self._thread = None
+
+    @property
+    def active(self):
+        return self._file is not None
+
+    def begin(self, rows, tasks):
+        """Start a fresh journal: session header plus one arm per task, on disk before returning."""
+        journal_dir = os.path.dirname(self.path)
+        if journal_dir:
+            os.makedirs(journal_dir, exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        lines = [_line(["session", time.time(), rows])]
+        lines.extend(_line(["arm", task['timer_no'], task['scheduled_time'].timestamp()]) for task in tasks)
+        self._write(lines)
+        self._thread = threading.Thread(target=self._run, name="Journal", daemon=True)
+        self._thread.start()
+
+    def record(self, kind, timer_no, deadline=None):
+        """Queue one event (any thread); written with the next batch."""
+        record = [kind, timer_no] if deadline is None else [kind, timer_no, deadline.timestamp()]
+        with self._cond:
+            if self._file is None or self._closing:
+                return
+            self._queue.append(_line(record))
+            self._cond.notify()
+
+    def end(self):
+        """Mark the session over (nothing to recover) and close the file."""
+        with self._cond:
+            if self._file is None or self._closing:
+                return
+            self._closing = True
+            self._cond.notify()
+        self._thread.join(STOP_GRACE)
+        with self._cond:
+            pending, self._queue = self._queue, []
+        pending.append(_line(["end"]))
+        try:
+            self._write(pending)
+        except OSError:
+            pass
+        self._file.close()
+        self._file = None
+
+    def _write(self, lines):
+        self._file.write("".join(lines))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closing:
+                    self._cond.wait()
+                if self._closing:
+                    return  # end() writes what is left
+                batch, self._queue = self._queue, []
+            try:
+                self._write(batch)
+            except (OSError, ValueError):
+                return  # Disk trouble: the session goes on unjournaled
+            with self._cond:
+                # Batch window: events arriving meanwhile share the next fsync
+                self._cond.wait_for(lambda: self._closing, FSYNC_INTERVAL)
+
+
+class Recovery:
+    """State of an unfinished session: `states` maps timer_no -> ("armed" | "fired", deadline_epoch)."""
+    __slots__ = ("rows", "started", "states")
+
+    def __init__(self, rows, started):
+        self.rows = rows
+        self.started = started
+        self.states = {}
+
+
+def replay(path=JOURNAL_FILE):
+    """Recovery of the journal at `path`, or None when there is nothing to resume."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    recovery = None
+    for raw in data.split(b"\n"):
+        if not raw:
+            continue
+        try:
+            record = json.loads(raw)
+        except ValueError:
+            break  # Torn last line of a crash mid-write
+        kind = record[0]
+        if kind == "session":
+            recovery = Recovery(record[2], record[1])
+            states = recovery.states
+        elif recovery is None:
+            continue
+        elif kind == "arm":
+            states[record[1]] = ("armed", record[2])
+        elif kind == "fire":
+            state = states.get(record[1])
+            if state is not None:
+                states[record[1]] = ("fired", state[1])
+        elif kind in ("done", "cancel"):
+            states.pop(record[1], None)
+        elif kind == "end":
+            return None
+    return recovery if recovery is not None and recovery.states else None
+
+
+def discard(path=JOURNAL_FILE):
+    """Forget a recovered journal that had nothing left to re-arm."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,110 @@
+"""
+Missed-deadline handling (v2.3).
+
+After sleep, hibernation or a long stall a worker wakes arbitrarily late. The wake
+time is compared with the deadline; beyond the row's tolerance a policy applies:
+
+    fire 5      fire anyway when more than 5s late (default; legacy behaviour)
+    skip 30     drop the occurrence when more than 30s late
+    shift 10    fire now and push the rest of the 'shift' rows back by the same lateness
+
+A row's optional `late` line overrides General/late_policy. Every lateness event is
+logged with its magnitude and kept on the engine (TimerEngine.late_events).
+
+Rows woken by the same resume reach the executor in arbitrary order, so late groups
+are held for CATCH_UP_SETTLE seconds: the executor then runs them in deadline order.
+"""
+import re
+import datetime
+import threading
+
+POLICIES = ("fire", "skip", "shift")
+DEFAULT_TOLERANCE = 5.0
+MIN_TOLERANCE = 0.5
+CATCH_UP_SETTLE = 0.2
+MAX_EVENTS = 1000
+
+_POLICY_RE = re.compile(r"^(fire|skip|shift)(?:\s+(\d+(?:\.\d+)?)\s*s?)?$")
+
+
+class LatePolicy:
+    __slots__ = ("policy", "tolerance")
+
+    def __init__(self, policy="fire", tolerance=DEFAULT_TOLERANCE):
+        self.policy = policy
+        self.tolerance = tolerance
+
+    @classmethod
+    def parse(cls, text):
+        """Return a LatePolicy, or None for rows without one. Raises ValueError on bad input."""
+        text = " ".join((text or "").strip().lower().split())
+        if not text:
+            return None
+        match = _POLICY_RE.match(text)
+        if not match:
+            raise ValueError(f"invalid late policy: {text!r}")
+        tolerance = float(match.group(2)) if match.group(2) else DEFAULT_TOLERANCE
+        if tolerance < MIN_TOLERANCE:
+            raise ValueError(f"late tolerance must be at least {MIN_TOLERANCE:g}s: {text!r}")
+        return cls(match.group(1), tolerance)
+
+    def __str__(self):
+        return f"{self.policy} {self.tolerance:g}"
+
+
+def normalize_late_policy(text):
+    """Editor text -> canonical config line (validates on the way)."""
+    policy = LatePolicy.parse(text)
+    return str(policy) if policy else ""
+
+
+class LateEvent:
+    """One occurrence that woke past its tolerance, and what was done about it."""
+    __slots__ = ("timer_no", "deadline", "woke", "late_ms", "policy", "tolerance")
+
+    def __init__(self, timer_no, deadline, woke, policy):
+        self.timer_no = timer_no
+        self.deadline = deadline
+        self.woke = woke
+        self.late_ms = (woke - deadline).total_seconds() * 1000
+        self.policy = policy.policy
+        self.tolerance = policy.tolerance
+
+
+class ScheduleShift:
+    """
+    Common offset of the pending one-shot rows with the 'shift' policy. On a late wake
+    the offset grows so that the earliest overdue row lands on "now"; the others keep
+    their spacing behind it, whichever row happened to notice first.
+    """
+    def __init__(self, tasks=(), fire_index=None):
+        self._lock = threading.Lock()
+        self._offset = datetime.timedelta(0)
+        self._pending = {task['timer_no']: task['scheduled_time'] for task in tasks}
+        self.fire_index = fire_index
+
+    def __contains__(self, timer_no):
+        with self._lock:
+            return timer_no in self._pending
+
+    def deadline(self, scheduled_time):
+        with self._lock:
+            return scheduled_time + self._offset
+
+    def catch_up(self, now):
+        """Shift so the earliest overdue row is due at `now`. Returns the added seconds."""
+        with self._lock:
+            overdue = [d for d in self._pending.values() if d + self._offset < now]
+            if not overdue:
+                return 0.0
+            delta = now - min(overdue) - self._offset
+            self._offset += delta
+            moved = [(timer_no, d + self._offset) for timer_no, d in self._pending.items()]
+        if self.fire_index is not None:
+            for timer_no, deadline in moved:
+                self.fire_index.set(timer_no, deadline)
+        return delta.total_seconds()
+
+    def done(self, timer_no):
+        with self._lock:
+            self._pending.pop(timer_no, None)
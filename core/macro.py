@@ -0,0 +1,206 @@
+"""
+Multi-step macro rows (v2.3).
+
+A row may carry an ordered list of steps instead of the single click/paste action.
+Steps are edited one per line and stored compactly on one config line, "; "-separated:
+
+    move 640 360; click; wait 150; keys ctrl+a; type "hello; world"; dclick 800 420
+
+  move X Y          move the cursor
+  click [X Y]       left click (optionally moving first)
+  dclick [X Y]      double click
+  keys a+b+c        key chord: pressed in order, released in reverse
+  type "text"       Unicode text (JSON-quoted, so ';' and quotes survive the config line)
+  wait MS           gap before the next step, in ms ("1.5s" also accepted)
+
+The steps compile into a single timed plan of (offset_ms, op, args) relative to the
+row's deadline and execute as one group with drift-free pacing.
+"""
+import json
+import time
+
+from core.burst import pace_until
+from core.input_backend import chunk_text, TYPE_CHUNK_GAP
+
+_NAMED_KEYS = {
+    "ctrl": 0x11, "control": 0x11, "shift": 0x10, "alt": 0x12, "win": 0x5B,
+    "enter": 0x0D, "return": 0x0D, "tab": 0x09, "esc": 0x1B, "escape": 0x1B,
+    "space": 0x20, "backspace": 0x08, "delete": 0x2E, "del": 0x2E, "insert": 0x2D,
+    "left": 0x25, "up": 0x26, "right": 0x27, "down": 0x28,
+    "home": 0x24, "end": 0x23, "pageup": 0x21, "pagedown": 0x22,
+}
+_NAMED_KEYS.update({f"f{i}": 0x6F + i for i in range(1, 13)})
+
+
+def key_code(name):
+    """Virtual-key code for a chord part ('ctrl', 'f5', 'a', '7')."""
+    name = name.strip().lower()
+    if name in _NAMED_KEYS:
+        return _NAMED_KEYS[name]
+    if len(name) == 1 and name.isalnum():
+        return ord(name.upper())
+    raise ValueError(f"unknown key: {name!r}")
+
+
+_KEY_NAMES = {}
+for _name, _vk in _NAMED_KEYS.items():
+    _KEY_NAMES.setdefault(_vk, _name)  # First spelling wins: "ctrl", "enter", "esc", ...
+
+
+def key_name(vk):
+    """Inverse of key_code: chord-part name for a virtual-key code, or None."""
+    if vk in _KEY_NAMES:
+        return _KEY_NAMES[vk]
+    if 0x30 <= vk <= 0x39 or 0x41 <= vk <= 0x5A:
+        return chr(vk).lower()
+    return None
+
+
+def _split_steps(text):
+    """Split on newlines and on ';' outside double quotes."""
+    parts, current, quoted, escaped = [], [], False, False
+    for ch in text:
+        if quoted:
+            current.append(ch)
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                quoted = False
+        elif ch in ";\n":
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+            quoted = ch == '"'
+    parts.append("".join(current))
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _parse_ms(text):
+    text = text.strip().lower()
+    if text.endswith("ms"):
+        value = float(text[:-2])
+    elif text.endswith("s"):
+        value = float(text[:-1]) * 1000
+    else:
+        value = float(text)
+    if value < 0:
+        raise ValueError(f"negative wait: {text!r}")
+    return int(round(value))
+
+
+def _parse_xy(args, op, required):
+    coords = args.replace(",", " ").split()
+    if not coords and not required:
+        return ()
+    if len(coords) != 2:
+        raise ValueError(f"{op} expects X Y")
+    return int(coords[0]), int(coords[1])
+
+
+def parse_steps(text):
+    """Parse the editor / config text into [(op, args)]. Raises ValueError on bad input."""
+    steps = []
+    for raw in _split_steps(text or ""):
+        op, _, args = raw.partition(" ")
+        op = op.lower()
+        args = args.strip()
+        if op == "move":
+            steps.append((op, _parse_xy(args, op, True)))
+        elif op in ("click", "dclick"):
+            steps.append((op, _parse_xy(args, op, False)))
+        elif op == "keys":
+            if not args:
+                raise ValueError("keys expects a chord, e.g. ctrl+v")
+            chord = "+".join(part.strip().lower() for part in args.split("+"))
+            for part in chord.split("+"):
+                key_code(part)  # Validate now, resolve in compile_plan
+            steps.append((op, chord))
+        elif op == "type":
+            text_arg = json.loads(args) if args.startswith('"') else args
+            if not isinstance(text_arg, str):
+                raise ValueError("type expects text")
+            steps.append((op, text_arg))
+        elif op == "wait":
+            steps.append((op, _parse_ms(args)))
+        else:
+            raise ValueError(f"unknown step: {op!r}")
+    return steps
+
+
+def format_steps(steps, separator="; "):
+    """Canonical text for parsed steps (one config line, or one step per line with '\\n')."""
+    parts = []
+    for op, args in steps:
+        if op in ("move", "click", "dclick"):
+            parts.append(" ".join([op] + [str(v) for v in args]))
+        elif op == "keys":
+            parts.append(f"keys {args}")
+        elif op == "type":
+            parts.append(f"type {json.dumps(args, ensure_ascii=False)}")
+        else:
+            parts.append(f"wait {args}")
+    return separator.join(parts)
+
+
+def normalize_steps(text):
+    """Editor text -> compact config line (validates on the way)."""
+    return format_steps(parse_steps(text))
+
+
+def compile_plan(steps):
+    """
+    [(op, args)] -> [(offset_ms, op, args)] relative to the deadline. Waits only move the
+    offset; coordinates on click/dclick become an explicit move at the same offset.
+    """
+    plan, offset = [], 0
+    for op, args in steps:
+        if op == "keys":
+            args = tuple(key_code(part) for part in args.split("+"))
+        if op == "wait":
+            offset += args
+            continue
+        if op in ("click", "dclick") and args:
+            plan.append((offset, "move", args))
+            args = ()
+        plan.append((offset, op, args))
+    return plan
+
+
+def plan_span_ms(plan):
+    return plan[-1][0] if plan else 0
+
+
+def run_plan(plan, backend, cancel_event):
+    """
+    Execute a compiled plan; step i is due at start + offset_i (drift-free).
+    Returns (steps_done, max_lateness_ms, cancelled).
+    """
+    start = time.perf_counter()
+    max_late = 0.0
+    for done, (offset_ms, op, args) in enumerate(plan):
+        target = start + offset_ms / 1000
+        if not pace_until(target, cancel_event):
+            return done, max_late * 1000, True
+        max_late = max(max_late, time.perf_counter() - target)
+        if op == "move":
+            backend.move(*args)
+        elif op == "click":
+            backend.click()
+        elif op == "dclick":
+            backend.click()
+            backend.click()
+        elif op == "keys":
+            for vk in args:
+                backend.key_down(vk)
+            for vk in reversed(args):
+                backend.key_up(vk)
+        elif op == "type":
+            chunks = chunk_text(args)
+            for i, chunk in enumerate(chunks):
+                backend.type_text(chunk)
+                if i < len(chunks) - 1 and cancel_event.wait(TYPE_CHUNK_GAP):
+                    return done, max_late * 1000, True
+    return len(plan), max_late * 1000, False
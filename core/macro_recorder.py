@@ -0,0 +1,377 @@
+"""
+Macro recorder (v2.3).
+
+Captures mouse clicks, keystrokes and their timing from a pluggable input-event
+source and turns them into a compact schedule instead of thousands of raw events:
+
+  * dense move streams are reduced with Ramer-Douglas-Peucker (a point is kept only
+    if the path deviates from the straight line by more than `epsilon` pixels);
+  * consecutive printable keystrokes merge into one `type "..."` step, modifier
+    chords become `keys ctrl+a`;
+  * two clicks close in time and space become a `dclick`;
+  * the gaps between the remaining actions become `wait` steps.
+
+The result is emitted either as macro steps (one row, see core.macro) or as one row
+per click with the text typed after it as that row's paste text.
+"""
+import sys
+import time
+import threading
+
+from core.macro import key_name, format_steps
+from core.pattern_fill import split_ms
+
+DEFAULT_EPSILON = 3.0      # Pixels a trajectory may deviate before a point is kept
+MIN_WAIT_MS = 10           # Shorter gaps are dropped (below input / scheduler resolution)
+DCLICK_MS = 500            # Two clicks within this gap ...
+DCLICK_DISTANCE = 4        # ... and this many pixels form a double click
+
+_MODIFIERS = {
+    0x10: "shift", 0xA0: "shift", 0xA1: "shift",
+    0x11: "ctrl", 0xA2: "ctrl", 0xA3: "ctrl",
+    0x12: "alt", 0xA4: "alt", 0xA5: "alt",
+    0x5B: "win", 0x5C: "win",
+}
+
+
+class InputEvent:
+    """One captured event. kind: "move" | "click" | "key_down" | "key_up"; t in seconds."""
+    __slots__ = ("kind", "t", "x", "y", "vk", "char")
+
+    def __init__(self, kind, t, x=0, y=0, vk=0, char=""):
+        self.kind = kind
+        self.t = t
+        self.x = x
+        self.y = y
+        self.vk = vk
+        self.char = char
+
+    def __repr__(self):
+        return f"InputEvent({self.kind!r}, {self.t:.3f}, {self.x}, {self.y}, {self.vk:#x}, {self.char!r})"
+
+
+class Win32EventSource:
+    """
+    Low-level mouse / keyboard hooks (WH_MOUSE_LL / WH_KEYBOARD_LL) on a dedicated
+    thread with its own message loop. Injected input (our own replays) is ignored.
+    """
+    WH_KEYBOARD_LL = 13
+    WH_MOUSE_LL = 14
+    WM_QUIT = 0x0012
+    WM_KEYDOWN, WM_KEYUP, WM_SYSKEYDOWN, WM_SYSKEYUP = 0x0100, 0x0101, 0x0104, 0x0105
+    WM_MOUSEMOVE, WM_LBUTTONDOWN = 0x0200, 0x0201
+    LLMHF_INJECTED = 0x01
+    LLKHF_INJECTED = 0x10
+
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+        self._ctypes = ctypes
+        self._wintypes = wintypes
+        self._user32 = ctypes.windll.user32
+        self._kernel32 = ctypes.windll.kernel32
+        self._thread = None
+        self._thread_id = None
+        self._ready = threading.Event()
+
+    def start(self, callback):
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, args=(callback,), name="InputRecorder", daemon=True)
+        self._thread.start()
+        self._ready.wait(1.0)
+
+    def stop(self):
+        if self._thread_id is not None:
+            self._user32.PostThreadMessageW(self._thread_id, self.WM_QUIT, 0, 0)
+        if self._thread is not None:
+            self._thread.join(1.0)
+        self._thread = None
+        self._thread_id = None
+
+    def _run(self, callback):
+        ctypes, wintypes, user32 = self._ctypes, self._wintypes, self._user32
+
+        class MSLLHOOKSTRUCT(ctypes.Structure):
+            _fields_ = [("x", wintypes.LONG), ("y", wintypes.LONG), ("mouseData", wintypes.DWORD),
+                        ("flags", wintypes.DWORD), ("time", wintypes.DWORD), ("extra", ctypes.c_size_t)]
+
+        class KBDLLHOOKSTRUCT(ctypes.Structure):
+            _fields_ = [("vkCode", wintypes.DWORD), ("scanCode", wintypes.DWORD), ("flags", wintypes.DWORD),
+                        ("time", wintypes.DWORD), ("extra", ctypes.c_size_t)]
+
+        HOOKPROC = ctypes.WINFUNCTYPE(ctypes.c_ssize_t, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+        user32.CallNextHookEx.argtypes = [wintypes.HHOOK, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM]
+        user32.CallNextHookEx.restype = ctypes.c_ssize_t
+        user32.SetWindowsHookExW.argtypes = [ctypes.c_int, HOOKPROC, wintypes.HINSTANCE, wintypes.DWORD]
+        user32.SetWindowsHookExW.restype = wintypes.HHOOK
+        shift = [False]
+        key_state = (ctypes.c_ubyte * 256)()
+        buf = ctypes.create_unicode_buffer(8)
+
+        def to_char(vk, scan):
+            key_state[0x10] = 0x80 if shift[0] else 0
+            # Flag 4: do not disturb the keyboard state (dead keys) of the focused app
+            n = user32.ToUnicodeEx(vk, scan, key_state, buf, 8, 4, user32.GetKeyboardLayout(0))
+            return buf.value[:n] if n == 1 and buf.value[:1].isprintable() else ""
+
+        def on_mouse(code, wparam, lparam):
+            if code >= 0:
+                info = ctypes.cast(lparam, ctypes.POINTER(MSLLHOOKSTRUCT)).contents
+                if not info.flags & self.LLMHF_INJECTED:
+                    if wparam == self.WM_MOUSEMOVE:
+                        callback(InputEvent("move", time.perf_counter(), info.x, info.y))
+                    elif wparam == self.WM_LBUTTONDOWN:
+                        callback(InputEvent("click", time.perf_counter(), info.x, info.y))
+            return user32.CallNextHookEx(None, code, wparam, lparam)
+
+        def on_key(code, wparam, lparam):
+            if code >= 0:
+                info = ctypes.cast(lparam, ctypes.POINTER(KBDLLHOOKSTRUCT)).contents
+                if not info.flags & self.LLKHF_INJECTED:
+                    down = wparam in (self.WM_KEYDOWN, self.WM_SYSKEYDOWN)
+                    if _MODIFIERS.get(info.vkCode) == "shift":
+                        shift[0] = down
+                    char = to_char(info.vkCode, info.scanCode) if down else ""
+                    callback(InputEvent("key_down" if down else "key_up", time.perf_counter(),
+                                        vk=info.vkCode, char=char))
+            return user32.CallNextHookEx(None, code, wparam, lparam)
+
+        # Keep the C callbacks referenced for the lifetime of the hooks
+        mouse_proc, key_proc = HOOKPROC(on_mouse), HOOKPROC(on_key)
+        module = self._kernel32.GetModuleHandleW(None)
+        hooks = [user32.SetWindowsHookExW(self.WH_MOUSE_LL, mouse_proc, module, 0),
+                 user32.SetWindowsHookExW(self.WH_KEYBOARD_LL, key_proc, module, 0)]
+        self._thread_id = self._kernel32.GetCurrentThreadId()
+        self._ready.set()
+        msg = wintypes.MSG()
+        try:
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            for hook in hooks:
+                if hook:
+                    user32.UnhookWindowsHookEx(hook)
+
+
+class FakeEventSource:
+    """Replays a list of synthetic InputEvents (non-Windows hosts and tests)."""
+    def __init__(self, events=()):
+        self.events = list(events)
+        self.running = False
+
+    def start(self, callback):
+        self.running = True
+        for event in self.events:
+            callback(event)
+
+    def stop(self):
+        self.running = False
+
+
+def default_event_source():
+    if sys.platform == "win32":
+        return Win32EventSource()
+    return FakeEventSource()
+
+
+def _segment_distance(p, a, b):
+    """Distance from point p to segment a-b."""
+    (px, py), (ax, ay), (bx, by) = p, a, b
+    dx, dy = bx - ax, by - ay
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        return ((px - ax) ** 2 + (py - ay) ** 2) ** 0.5
+    u = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / length_sq))
+    cx, cy = ax + u * dx, ay + u * dy
+    return ((px - cx) ** 2 + (py - cy) ** 2) ** 0.5
+
+
+def rdp_indices(points, epsilon):
+    """
+    Ramer-Douglas-Peucker over [(x, y)]: sorted indices of the points to keep
+    (always the first and the last). Iterative, so long trajectories cannot
+    exhaust the recursion limit.
+    """
+    n = len(points)
+    if n <= 2:
+        return list(range(n))
+    keep = [False] * n
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        best, index = 0.0, None
+        for i in range(first + 1, last):
+            d = _segment_distance(points[i], points[first], points[last])
+            if d > best:
+                best, index = d, i
+        if index is not None and best > epsilon:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return [i for i in range(n) if keep[i]]
+
+
+def timed_actions(events, epsilon=DEFAULT_EPSILON, keep_moves=True):
+    """
+    Raw events -> [(t, op, args, end)] in macro-step vocabulary, before waits are added;
+    `end` is when the action was over (a dclick's second click), else t.
+    Returns (actions, dropped) where `dropped` counts the raw events that were merged away.
+    """
+    events = sorted(events, key=lambda e: e.t)
+    actions, trajectory, held = [], [], []
+    text, text_t = [], None
+
+    def flush_text():
+        nonlocal text_t
+        if text:
+            actions.append((text_t, "type", "".join(text), text_t))
+            text.clear()
+            text_t = None
+
+    def flush_moves(end=None):
+        if trajectory and keep_moves:
+            kept = [trajectory[i] for i in rdp_indices([(x, y) for _, x, y in trajectory], epsilon)]
+            if end is not None and kept[-1][1:] == end:
+                kept.pop()  # The click step carries its own coordinates
+            actions.extend((t, "move", (x, y), t) for t, x, y in kept)
+        trajectory.clear()
+
+    for event in events:
+        if event.kind == "move":
+            if not trajectory or trajectory[-1][1:] != (event.x, event.y):
+                trajectory.append((event.t, event.x, event.y))
+        elif event.kind == "click":
+            flush_text()
+            flush_moves((event.x, event.y))
+            prev = actions[-1] if actions else None
+            if (prev and prev[1] == "click" and event.t - prev[0] <= DCLICK_MS / 1000
+                    and abs(prev[2][0] - event.x) <= DCLICK_DISTANCE and abs(prev[2][1] - event.y) <= DCLICK_DISTANCE):
+                # Starts with the first click; the next wait counts from the second
+                actions[-1] = (prev[0], "dclick", prev[2], event.t)
+            else:
+                actions.append((event.t, "click", (event.x, event.y), event.t))
+        elif event.kind == "key_down":
+            modifier = _MODIFIERS.get(event.vk)
+            if modifier:
+                if modifier not in held:
+                    held.append(modifier)
+                continue
+            chord_mods = [m for m in held if m != "shift"]
+            if event.char and not chord_mods:
+                flush_moves()
+                if text_t is None:
+                    text_t = event.t
+                text.append(event.char)
+                continue
+            name = key_name(event.vk)
+            if name is None:
+                continue
+            flush_text()
+            flush_moves()
+            actions.append((event.t, "keys", "+".join(held + [name]), event.t))
+        elif event.kind == "key_up":
+            modifier = _MODIFIERS.get(event.vk)
+            if modifier in held:
+                held.remove(modifier)
+    flush_text()
+    flush_moves()
+    return actions, len(events) - len(actions)
+
+
+def actions_to_steps(actions, min_wait_ms=MIN_WAIT_MS):
+    """[(t, op, args, end)] -> [(op, args)] with the gaps as wait steps."""
+    steps, last_end = [], None
+    for t, op, args, end in actions:
+        if last_end is not None:
+            gap = int(round((t - last_end) * 1000))
+            if gap >= min_wait_ms:
+                steps.append(("wait", gap))
+        steps.append((op, args))
+        last_end = end
+    return steps
+
+
+def trim_own_window(events, inside):
+    """
+    Drop input aimed at Flow Track itself. `inside(x, y)` tests a screen point against
+    its window. Clicks inside the window are dropped wherever they are. If the recording
+    ends with the pointer inside the window (going for the stop button), everything
+    from when it entered is dropped too: moves, clicks and keystrokes. So are the bare
+    moves that led there.
+    """
+    events = sorted(events, key=lambda e: e.t)
+    cut = len(events)
+    for i in range(len(events) - 1, -1, -1):
+        event = events[i]
+        if event.kind in ("move", "click"):
+            if not inside(event.x, event.y):
+                break
+            cut = i
+    if cut < len(events):
+        while cut > 0 and events[cut - 1].kind == "move":
+            cut -= 1
+    return [e for e in events[:cut] if e.kind != "click" or not inside(e.x, e.y)]
+
+
+def recording_to_steps(events, epsilon=DEFAULT_EPSILON, keep_moves=True):
+    """Compact config line for a recording (see core.macro)."""
+    actions, _ = timed_actions(events, epsilon, keep_moves)
+    return format_steps(actions_to_steps(actions))
+
+
+def recording_to_rows(events, start_ms, template=None):
+    """
+    One row per click (a dclick becomes 2 clicks), scheduled at `start_ms` plus its
+    offset in the recording; text typed after a click becomes that row's paste text.
+    Moves and key chords have no row equivalent and are left out.
+    """
+    actions, _ = timed_actions(events, keep_moves=False)
+    template = dict(template or {})
+    rows, origin = [], None
+    for t, op, args, _end in actions:
+        if op in ("click", "dclick"):
+            if origin is None:
+                origin = t
+            time_str, ms, day = split_ms(start_ms + int(round((t - origin) * 1000)))
+            rows.append(dict(template, enabled=True, show_desktop=False, x=str(args[0]), y=str(args[1]),
+                             time=time_str, time_ms=ms, day_offset=day,
+                             clicks="2" if op == "dclick" else "1",
+                             interval="0.1" if op == "dclick" else "1", paste_text=""))
+        elif op == "type" and rows:
+            rows[-1]["paste_text"] += args
+    return rows
+
+
+def recording_to_macro_row(events, start_ms, template=None, epsilon=DEFAULT_EPSILON):
+    """A single row at `start_ms` whose steps replay the whole recording."""
+    first = next((e for e in events if e.kind == "click"), None)
+    time_str, ms, day = split_ms(start_ms)
+    return dict(template or {}, enabled=True, show_desktop=False,
+                x=str(first.x) if first else "", y=str(first.y) if first else "",
+                time=time_str, time_ms=ms, day_offset=day, clicks="1", interval="1", paste_text="",
+                steps=recording_to_steps(events, epsilon))
+
+
+class MacroRecorder:
+    """Collects events from `source` between start() and stop()."""
+    def __init__(self, source=None):
+        self.source = source if source is not None else default_event_source()
+        self.events = []
+        self.recording = False
+
+    def start(self):
+        self.events = []
+        self.recording = True
+        self.source.start(self._on_event)
+
+    def _on_event(self, event):
+        # Runs on the hook thread: keep it to a single append
+        self.events.append(event)
+
+    def stop(self):
+        if self.recording:
+            self.source.stop()
+            self.recording = False
+        return list(self.events)
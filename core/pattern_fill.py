@@ -0,0 +1,66 @@
+"""
+Pattern fill (v2.3): generate evenly spaced timer rows in one pass.
+
+Times are handled as integer milliseconds since the start day's midnight, so
+seconds carry into minutes, minutes into hours and hours into following days.
+Each field is computed as a column first and the row dicts are assembled last.
+"""
+
+STEP_UNITS_MS = {"ms": 1, "s": 1000, "min": 60000}
+DAY_MS = 86400000
+
+
+def time_to_ms(time_str, time_ms=0, day_offset=0):
+    """'HHMMSS' (+ optional milliseconds / day offset) -> absolute milliseconds."""
+    h, m, s = int(time_str[0:2]), int(time_str[2:4]), int(time_str[4:6])
+    return ((day_offset * 24 + h) * 60 + m) * 60000 + s * 1000 + int(time_ms)
+
+
+def split_ms(total_ms):
+    """Absolute milliseconds -> ('HHMMSS', milliseconds, day_offset)."""
+    day_offset, rem = divmod(total_ms, DAY_MS)
+    seconds, ms = divmod(rem, 1000)
+    h, rem_s = divmod(seconds, 3600)
+    m, s = divmod(rem_s, 60)
+    return f"{h:02d}{m:02d}{s:02d}", ms, day_offset
+
+
+def fill_stamps(start_ms, step_ms, count):
+    """Absolute millisecond stamps of `count` rows (a lazy range, no per-row arithmetic)."""
+    if step_ms <= 0:
+        raise ValueError("step must be positive")
+    return range(start_ms, start_ms + step_ms * count, step_ms)
+
+
+def _int_or_none(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def generate_fill_rows(template, start_ms, step, unit, count, dx=0, dy=0):
+    """
+    Build `count` row dicts from `template` (a TimerCard.get_values() dict).
+    start_ms: first row's absolute time (see time_to_ms).
+    step/unit: spacing between rows, unit in STEP_UNITS_MS.
+    dx/dy: per-row coordinate increments applied to the template's X/Y.
+    """
+    step_ms = int(round(float(step) * STEP_UNITS_MS[unit]))
+    stamps = fill_stamps(start_ms, step_ms, count)
+
+    # Column pass: every field is derived from the stamp/ordinal ranges at once
+    days, rems = zip(*(divmod(t, DAY_MS) for t in stamps)) if count else ((), ())
+    secs, millis = zip(*(divmod(r, 1000) for r in rems)) if count else ((), ())
+    times = [f"{s // 3600:02d}{s // 60 % 60:02d}{s % 60:02d}" for s in secs]
+
+    base_x, base_y = _int_or_none(template.get("x")), _int_or_none(template.get("y"))
+    xs = [str(base_x + i * dx) for i in range(count)] if base_x is not None else [template.get("x", "")] * count
+    ys = [str(base_y + i * dy) for i in range(count)] if base_y is not None else [template.get("y", "")] * count
+
+    shared = {key: template.get(key) for key in
+              ("enabled", "show_desktop", "clicks", "interval", "paste_text", "repeat", "date", "steps", "trigger", "late")}
+    return [
+        dict(shared, x=x, y=y, time=t, time_ms=ms, day_offset=day)
+        for x, y, t, ms, day in zip(xs, ys, times, millis, days)
+    ]
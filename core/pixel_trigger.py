@@ -0,0 +1,272 @@
+"""
+Pixel / region wait-condition triggers (v2.3).
+
+A row may carry a trigger; from its deadline on, the engine polls a screen region and
+fires the row as soon as the condition holds instead of relying on padded delays:
+
+    until 100,200,40,20 #00C853          region's mean colour matches (tolerance 16)
+    until 100,200,40,20 hash:8f0c... tol 4   region's 64-bit average hash within 4 bits
+    while 100,200,40,20 #FFFFFF          ... stops matching the reference
+    while 100,200,40,20                  ... changes from how it looked when armed
+                                         (its hash or its mean colour moves; tol is
+                                         the hash's, the colour keeps 16)
+    optional suffix: timeout 30          give up after 30s (default 60)
+
+Regions are compared on a downsampled grid (at most GRID x GRID samples), with NumPy
+when it is importable and a pure-Python path otherwise (the frozen build excludes
+NumPy). NumPy is imported on the first comparison, not with this module, so a start
+without trigger rows does not pay for it. Polling is capped by a maximum rate and by
+a CPU budget: if a capture plus compare costs c seconds, the next poll is at least
+c / budget away.
+"""
+import re
+import sys
+import time
+
+_np = False  # NumPy module once imported, None if unavailable, False before the first try
+
+GRID = 16
+DEFAULT_COLOR_TOLERANCE = 16
+DEFAULT_HASH_TOLERANCE = 5
+DEFAULT_TIMEOUT = 60.0
+MAX_POLL_HZ = 60
+CPU_BUDGET = 0.25
+
+_TRIGGER_RE = re.compile(
+    r"^(until|while)\s+(-?\d+)\s*,\s*(-?\d+)\s*,\s*(\d+)\s*,\s*(\d+)"
+    r"(?:\s+(#[0-9a-f]{6}|hash:[0-9a-f]{16}))?"
+    r"(?:\s+tol\s+(\d+))?(?:\s+timeout\s+(\d+(?:\.\d+)?))?$")
+
+
+class Frame:
+    """A captured region: BGRA bytes, row-major, `width` x `height`."""
+    __slots__ = ("width", "height", "data")
+
+    def __init__(self, width, height, data):
+        self.width = width
+        self.height = height
+        self.data = data
+
+
+def _numpy():
+    global _np
+    if _np is False:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = None
+    return _np
+
+
+def _grid_steps(width, height):
+    return max(1, width // GRID), max(1, height // GRID)
+
+
+def sample_rgb(frame):
+    """Downsampled RGB samples: (n, 3) ndarray with NumPy, else a list of (r, g, b)."""
+    sx, sy = _grid_steps(frame.width, frame.height)
+    np = _numpy()
+    if np is not None:
+        arr = np.frombuffer(frame.data, dtype=np.uint8).reshape(frame.height, frame.width, 4)
+        return arr[::sy, ::sx, 2::-1].reshape(-1, 3).astype(np.int16)
+    data, stride = frame.data, frame.width * 4
+    samples = []
+    for y in range(0, frame.height, sy):
+        row = y * stride
+        for x in range(0, frame.width, sx):
+            i = row + x * 4
+            samples.append((data[i + 2], data[i + 1], data[i]))
+    return samples
+
+
+def mean_color(frame):
+    samples = sample_rgb(frame)
+    if not isinstance(samples, list):
+        return tuple(int(v) for v in samples.mean(axis=0).round())
+    n = len(samples)
+    return tuple(round(sum(s[c] for s in samples) / n) for c in range(3))
+
+
+def average_hash(frame):
+    """64-bit average hash over an 8x8 grid of luma samples."""
+    sx, sy = max(1, frame.width // 8), max(1, frame.height // 8)
+    np = _numpy()
+    if np is not None:
+        arr = np.frombuffer(frame.data, dtype=np.uint8).reshape(frame.height, frame.width, 4)
+        grid = arr[::sy, ::sx][:8, :8].astype(np.float32)
+        luma = (grid[..., 2] * 299 + grid[..., 1] * 587 + grid[..., 0] * 114).ravel()
+        bits = luma > luma.mean()
+        return int("".join("1" if b else "0" for b in bits) or "0", 2)
+    data, stride = frame.data, frame.width * 4
+    luma = []
+    for y in list(range(0, frame.height, sy))[:8]:
+        for x in list(range(0, frame.width, sx))[:8]:
+            i = y * stride + x * 4
+            luma.append(data[i + 2] * 299 + data[i + 1] * 587 + data[i] * 114)
+    mean = sum(luma) / len(luma)
+    return int("".join("1" if v > mean else "0" for v in luma) or "0", 2)
+
+
+class Trigger:
+    def __init__(self, mode, region, kind=None, reference=None, tolerance=None, timeout=DEFAULT_TIMEOUT):
+        self.mode = mode            # "until" | "while"
+        self.region = region        # (x, y, w, h)
+        self.kind = kind            # "color" | "hash" | "snapshot" (armed copy) | None
+        self.reference = reference  # (r, g, b) | int hash | (int hash, (r, g, b)) | None
+        self.tolerance = tolerance
+        self.timeout = timeout
+
+    @classmethod
+    def parse(cls, text):
+        """Return a Trigger, or None for rows without one. Raises ValueError on bad input."""
+        text = " ".join((text or "").strip().lower().split())
+        if not text:
+            return None
+        match = _TRIGGER_RE.match(text)
+        if not match:
+            raise ValueError(f"invalid trigger: {text!r}")
+        mode, x, y, w, h, ref, tol, timeout = match.groups()
+        if int(w) <= 0 or int(h) <= 0:
+            raise ValueError(f"empty trigger region: {text!r}")
+        if ref is None and mode == "until":
+            raise ValueError("'until' needs a #RRGGBB colour or hash:HEX reference")
+        kind, reference = None, None
+        if ref and ref.startswith("#"):
+            kind, reference = "color", tuple(int(ref[i:i + 2], 16) for i in (1, 3, 5))
+        elif ref:
+            kind, reference = "hash", int(ref[5:], 16)
+        return cls(mode, (int(x), int(y), int(w), int(h)), kind, reference,
+                   int(tol) if tol is not None else None,
+                   float(timeout) if timeout is not None else DEFAULT_TIMEOUT)
+
+    def __str__(self):
+        parts = [self.mode, ",".join(str(v) for v in self.region)]
+        if self.kind == "color":
+            parts.append("#%02x%02x%02x" % self.reference)
+        elif self.kind == "hash":
+            parts.append(f"hash:{self.reference:016x}")
+        if self.tolerance is not None:
+            parts.append(f"tol {self.tolerance}")
+        if self.timeout != DEFAULT_TIMEOUT:
+            parts.append(f"timeout {self.timeout:g}")
+        return " ".join(parts)
+
+    def armed(self, frame):
+        """
+        Copy with the reference snapshotted from `frame` (reference-less 'while': wait for
+        any change). The mean colour is kept next to the hash: a uniform region hashes to
+        0 whatever its colour, and the hash ignores uniform colour / brightness shifts.
+        """
+        return Trigger(self.mode, self.region, "snapshot", (average_hash(frame), mean_color(frame)),
+                       self.tolerance, self.timeout)
+
+    def similar(self, frame):
+        hash_tol = self.tolerance if self.tolerance is not None else DEFAULT_HASH_TOLERANCE
+        if self.kind == "color":
+            tol = self.tolerance if self.tolerance is not None else DEFAULT_COLOR_TOLERANCE
+            return max(abs(a - b) for a, b in zip(mean_color(frame), self.reference)) <= tol
+        if self.kind == "snapshot":
+            ref_hash, ref_color = self.reference
+            return (bin(average_hash(frame) ^ ref_hash).count("1") <= hash_tol
+                    and max(abs(a - b) for a, b in zip(mean_color(frame), ref_color)) <= DEFAULT_COLOR_TOLERANCE)
+        return bin(average_hash(frame) ^ self.reference).count("1") <= hash_tol
+
+    def satisfied(self, frame):
+        return self.similar(frame) == (self.mode == "until")
+
+
+class Win32ScreenSource:
+    """Grabs screen regions with GDI BitBlt (virtual-screen coordinates)."""
+    def __init__(self):
+        import win32gui
+        import win32ui
+        import win32con
+        self._gui = win32gui
+        self._ui = win32ui
+        self._srccopy = win32con.SRCCOPY
+
+    def grab(self, x, y, w, h):
+        hdc = self._gui.GetDC(0)
+        src = self._ui.CreateDCFromHandle(hdc)
+        mem = src.CreateCompatibleDC()
+        bmp = self._ui.CreateBitmap()
+        try:
+            bmp.CreateCompatibleBitmap(src, w, h)
+            mem.SelectObject(bmp)
+            mem.BitBlt((0, 0), (w, h), src, (x, y), self._srccopy)
+            return Frame(w, h, bmp.GetBitmapBits(True))
+        finally:
+            mem.DeleteDC()
+            src.DeleteDC()
+            self._gui.ReleaseDC(0, hdc)
+            self._gui.DeleteObject(bmp.GetHandle())
+
+
+class FakeFrameSource:
+    """
+    Synthetic frames for non-Windows hosts and tests: `color` (r, g, b) fills every
+    grab; assign `frame_fn(x, y, w, h) -> Frame` for anything more elaborate.
+    """
+    def __init__(self, color=(0, 0, 0)):
+        self.color = color
+        self.frame_fn = None
+        self.grabs = 0
+
+    def grab(self, x, y, w, h):
+        self.grabs += 1
+        if self.frame_fn:
+            return self.frame_fn(x, y, w, h)
+        r, g, b = self.color
+        return Frame(w, h, bytes((b, g, r, 255)) * (w * h))
+
+
+def default_capture_source():
+    if sys.platform == "win32":
+        return Win32ScreenSource()
+    return FakeFrameSource()
+
+
+class TriggerResult:
+    __slots__ = ("fired", "cancelled", "elapsed", "polls", "avg_cost_ms")
+
+    def __init__(self, fired, cancelled, elapsed, polls, avg_cost_ms):
+        self.fired = fired
+        self.cancelled = cancelled
+        self.elapsed = elapsed
+        self.polls = polls
+        self.avg_cost_ms = avg_cost_ms
+
+
+def wait_for_trigger(trigger, source, cancel_event, max_hz=MAX_POLL_HZ, cpu_budget=CPU_BUDGET):
+    """Poll until the trigger holds, the timeout passes or `cancel_event` is set."""
+    start = time.perf_counter()
+    deadline = start + trigger.timeout
+    min_period = 1.0 / max_hz
+    polls, total_cost = 0, 0.0
+    active = trigger if trigger.kind is not None else None
+    while True:
+        t0 = time.perf_counter()
+        frame = source.grab(*trigger.region)
+        if active is None:
+            # The rule object is shared across occurrences: snapshot into a copy
+            active = trigger.armed(frame)
+            fired = False
+        else:
+            fired = active.satisfied(frame)
+        cost = time.perf_counter() - t0
+        polls += 1
+        total_cost += cost
+        now = time.perf_counter()
+        if fired or now >= deadline:
+            return TriggerResult(fired, False, now - start, polls, total_cost / polls * 1000)
+        # Rate cap, and keep capture + compare within `cpu_budget` of one core
+        period = max(min_period, cost / cpu_budget)
+        if cancel_event.wait(max(0.0, min(t0 + period, deadline) - now)):
+            return TriggerResult(False, True, time.perf_counter() - start, polls, total_cost / polls * 1000)
+
+
+def normalize_trigger(text):
+    """Editor text -> canonical config line (validates on the way)."""
+    trigger = Trigger.parse(text)
+    return str(trigger) if trigger else ""
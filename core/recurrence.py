@@ -0,0 +1,77 @@
+import re
+import datetime
+
+_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600}
+_EVERY_RE = re.compile(r"^(?:every\s*)?(\d+)\s*([smh]?)$")
+
+
+class Recurrence:
+    """
+    Per-row recurrence rule (v2.3), stored in the config as a short string:
+      "every 30s" / "every 5m" / "every 2h"  -> fixed period
+      "daily"                               -> every day at the row's time
+      "weekdays"                            -> Monday-Friday at the row's time
+    Occurrences are computed incrementally from the previous deadline, never by
+    re-scanning the calendar.
+    """
+    def __init__(self, kind, period_seconds=0):
+        self.kind = kind
+        self.period_seconds = period_seconds
+
+    @classmethod
+    def parse(cls, text):
+        """Return a Recurrence, or None for one-shot rows. Raises ValueError on bad input."""
+        text = (text or "").strip().lower()
+        if text in ("", "once"):
+            return None
+        if text in ("daily", "weekdays"):
+            return cls(text)
+        match = _EVERY_RE.match(text)
+        if not match:
+            raise ValueError(f"invalid repeat rule: {text!r}")
+        seconds = int(match.group(1)) * _UNIT_SECONDS[match.group(2) or "s"]
+        if seconds <= 0:
+            raise ValueError(f"invalid repeat period: {text!r}")
+        return cls("every", seconds)
+
+    def __str__(self):
+        if self.kind != "every":
+            return self.kind
+        for unit in ("h", "m"):
+            if self.period_seconds % _UNIT_SECONDS[unit] == 0:
+                return f"every {self.period_seconds // _UNIT_SECONDS[unit]}{unit}"
+        return f"every {self.period_seconds}s"
+
+    def _valid_day(self, dt):
+        return self.kind != "weekdays" or dt.weekday() < 5
+
+    def first_at_or_after(self, anchor, now):
+        """First occurrence >= now, given the row's configured time `anchor` (today)."""
+        if self.kind == "every":
+            if anchor >= now:
+                return anchor
+            period = datetime.timedelta(seconds=self.period_seconds)
+            # Jump straight to the first slot >= now (no per-occurrence loop)
+            steps = -((anchor - now) // period)
+            return anchor + steps * period
+        candidate = anchor
+        if candidate < now:
+            # Jump whole days straight to the first slot >= now (a past date, a multi-day suspend)
+            day = datetime.timedelta(days=1)
+            candidate += -((candidate - now) // day) * day
+        while not self._valid_day(candidate):
+            candidate += datetime.timedelta(days=1)
+        return candidate
+
+    def next_after(self, previous, now=None):
+        """Next occurrence after `previous`; skips occurrences already behind `now` (e.g. after sleep)."""
+        if self.kind == "every":
+            nxt = previous + datetime.timedelta(seconds=self.period_seconds)
+        else:
+            nxt = previous + datetime.timedelta(days=1)
+            # Friday -> Monday: at most two extra hops for the weekend
+            while not self._valid_day(nxt):
+                nxt += datetime.timedelta(days=1)
+        if now is not None and nxt < now:
+            return self.first_at_or_after(nxt, now)
+        return nxt
@@ -0,0 +1,228 @@
+"""
+Reference clock (v2.3).
+
+Deadlines are meant in the time of an external authoritative clock rather than the
+local one, which may drift by hundreds of milliseconds. An SNTP source is sampled
+repeatedly; the sample with the smallest round-trip wins (its offset is the least
+affected by asymmetric network delay) and half that round-trip is the uncertainty.
+Successive rounds give the drift. The engine reads "now" through ReferenceClock so
+the correction applies to every deadline.
+"""
+import time
+import socket
+import struct
+import datetime
+import threading
+from PySide6.QtCore import QObject, Signal
+
+NTP_EPOCH_DELTA = 2208988800  # 1900-01-01 -> 1970-01-01
+NTP_PORT = 123
+_PACKET = struct.Struct("!B B b b 11I")
+
+
+def _to_ntp(ts):
+    seconds = int(ts)
+    return seconds + NTP_EPOCH_DELTA, int((ts - seconds) * 2 ** 32) & 0xFFFFFFFF
+
+
+def _from_ntp(seconds, fraction):
+    return seconds - NTP_EPOCH_DELTA + fraction / 2 ** 32
+
+
+def parse_server(text):
+    """'host' / 'host:port' -> (host, port)."""
+    host, _, port = text.strip().rpartition(":")
+    if host and port.isdigit():
+        return host, int(port)
+    return text.strip(), NTP_PORT
+
+
+class SntpSource:
+    """One SNTP request per sample; returns (offset, round_trip) in seconds."""
+    def __init__(self, host, port=NTP_PORT, timeout=1.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+    def __str__(self):
+        return f"{self.host}:{self.port}"
+
+    def sample(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.settimeout(self.timeout)
+            t1 = time.time()
+            tx_sec, tx_frac = _to_ntp(t1)
+            # LI=0, VN=4, Mode=3 (client); our transmit time comes back as the originate time
+            request = _PACKET.pack(0x23, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, tx_sec, tx_frac)
+            sock.sendto(request, (self.host, self.port))
+            while True:
+                data, _ = sock.recvfrom(512)
+                t4 = time.time()
+                if len(data) < _PACKET.size:
+                    continue
+                fields = _PACKET.unpack(data[:_PACKET.size])
+                if (fields[9], fields[10]) == (tx_sec, tx_frac):
+                    break  # Anything else is a stale reply to an earlier request
+        t2 = _from_ntp(fields[11], fields[12])
+        t3 = _from_ntp(fields[13], fields[14])
+        offset = ((t2 - t1) + (t3 - t4)) / 2
+        round_trip = (t4 - t1) - (t3 - t2)
+        return offset, max(round_trip, 0.0)
+
+
+class LocalSntpServer:
+    """
+    Minimal SNTP responder for local use and tests: answers with the local clock
+    shifted by `offset` seconds (plus an optional artificial `delay` before replying).
+    """
+    def __init__(self, host="127.0.0.1", port=0, offset=0.0, delay=0.0):
+        self.offset = offset
+        self.delay = delay
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind((host, port))
+        self._sock.settimeout(0.2)
+        self.address = self._sock.getsockname()
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, name="LocalSntpServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        if self._thread:
+            self._thread.join()
+        self._sock.close()
+
+    def _serve(self):
+        while self._running:
+            try:
+                data, peer = self._sock.recvfrom(512)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            if len(data) < _PACKET.size:
+                continue
+            request = _PACKET.unpack(data[:_PACKET.size])
+            recv_sec, recv_frac = _to_ntp(time.time() + self.offset)
+            if self.delay:
+                time.sleep(self.delay)
+            tx_sec, tx_frac = _to_ntp(time.time() + self.offset)
+            # LI=0, VN=4, Mode=4 (server), stratum 1
+            reply = _PACKET.pack(0x24, 1, 0, -20, 0, 0, 0, recv_sec, recv_frac,
+                                 request[13], request[14], recv_sec, recv_frac, tx_sec, tx_frac)
+            self._sock.sendto(reply, peer)
+
+
+class ReferenceClock:
+    """Local clock corrected by the latest offset / drift estimate (zero until synced)."""
+    HISTORY = 8
+
+    def __init__(self):
+        self.offset = 0.0        # Reference minus local, seconds, at `anchor`
+        self.drift = 0.0         # Seconds of offset change per local second
+        self.uncertainty = None  # Half the best round-trip, seconds
+        self.anchor = time.time()
+        self.history = []        # [(local_ts, offset)] one per sync round
+        self._lock = threading.Lock()
+
+    @property
+    def synced(self):
+        return self.uncertainty is not None
+
+    def offset_at(self, local_ts):
+        with self._lock:
+            return self.offset + self.drift * (local_ts - self.anchor)
+
+    def time(self):
+        local = time.time()
+        return local + self.offset_at(local)
+
+    def now(self):
+        return datetime.datetime.fromtimestamp(self.time())
+
+    def update(self, local_ts, offset, uncertainty):
+        """Fold one sync round in; drift is the least-squares slope over recent rounds."""
+        with self._lock:
+            self.history = (self.history + [(local_ts, offset)])[-self.HISTORY:]
+            if len(self.history) >= 2:
+                mean_t = sum(t for t, _ in self.history) / len(self.history)
+                mean_o = sum(o for _, o in self.history) / len(self.history)
+                var = sum((t - mean_t) ** 2 for t, _ in self.history)
+                if var > 0:
+                    self.drift = sum((t - mean_t) * (o - mean_o) for t, o in self.history) / var
+            self.offset = offset
+            self.anchor = local_ts
+            self.uncertainty = uncertainty
+
+
+def estimate_offset(source, samples=8):
+    """Min-RTT filter: (local_ts, offset, uncertainty) from the best of `samples` exchanges."""
+    best = None
+    errors = []
+    for _ in range(samples):
+        try:
+            offset, round_trip = source.sample()
+        except OSError as e:
+            errors.append(e)
+            continue
+        if best is None or round_trip < best[1]:
+            best = (offset, round_trip, time.time())
+    if best is None:
+        raise OSError(str(errors[-1]) if errors else "no samples")
+    offset, round_trip, local_ts = best
+    return local_ts, offset, round_trip / 2
+
+
+class ClockSync(QObject):
+    """Re-estimates the reference offset off the GUI thread every `interval` seconds."""
+    synced = Signal(str, float, float, float)  # source, offset_ms, uncertainty_ms, drift_ppm
+    failed = Signal(str, str)                  # source, error
+
+    def __init__(self, clock, source, interval=900, samples=8):
+        super().__init__()
+        self.clock = clock
+        self.source = source
+        self.interval = interval
+        self.samples = samples
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="ClockSync", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def sync_once(self):
+        local_ts, offset, uncertainty = estimate_offset(self.source, self.samples)
+        self.clock.update(local_ts, offset, uncertainty)
+        return offset, uncertainty
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                offset, uncertainty = self.sync_once()
+                self.synced.emit(str(self.source), offset * 1000, uncertainty * 1000, self.clock.drift * 1e6)
+            except OSError as e:
+                self.failed.emit(str(self.source), str(e))
+            self._stop.wait(self.interval)
+
+
+def start_clock_sync(config, clock, log):
+    """Start periodic syncing if General/reference_clock is set; returns the ClockSync or None."""
+    if not config.reference_clock:
+        return None
+    host, port = parse_server(config.reference_clock)
+    sync = ClockSync(clock, SntpSource(host, port), interval=config.clock_sync_interval)
+    sync.synced.connect(lambda source, offset, unc, drift: log(config.get_message(
+        "log_clock_synced", source=source, offset=f"{offset:+.1f}", uncertainty=f"{unc:.1f}", drift=f"{drift:+.1f}")))
+    sync.failed.connect(lambda source, error: log(config.get_message(
+        "log_clock_sync_failed", source=source, error=error)))
+    sync.start()
+    return sync
@@ -0,0 +1,235 @@
+import bisect
+import datetime
+import threading
+
+from core.recurrence import Recurrence
+from core.macro import parse_steps, compile_plan
+from core.pixel_trigger import Trigger
+from core.late_policy import LatePolicy
+
+
+def resolve_base_date(spec, now):
+    """
+    Row date target (v2.3):
+      "" / "today"  -> the day Start is pressed (legacy)
+      "tomorrow"    -> the next day
+      "+N"          -> N days after today
+      "YYYY-MM-DD"  -> an explicit date
+    ("next" is resolved in row_deadline since it depends on the time of day.)
+    """
+    spec = (spec or "").strip().lower()
+    today = now.date()
+    if spec in ("", "today", "next"):
+        return today
+    if spec == "tomorrow":
+        return today + datetime.timedelta(days=1)
+    if spec.startswith("+"):
+        return today + datetime.timedelta(days=int(spec[1:]))
+    return datetime.date.fromisoformat(spec)
+
+
+def row_deadline(vals, now):
+    """Absolute deadline of a row dict ('time' HHMMSS + optional time_ms / day_offset / date)."""
+    t = vals['time']
+    if len(t) != 6 or not t.isdigit():
+        raise ValueError(f"time data {t!r} does not match format HHMMSS")
+    # Sliced rather than strptime: the timeline runs this for every row
+    time_of_day = datetime.time(int(t[0:2]), int(t[2:4]), int(t[4:6]), int(vals.get('time_ms', 0) or 0) * 1000)
+    spec = (vals.get('date') or "").strip().lower()
+    base = resolve_base_date(spec, now)
+    scheduled_time = datetime.datetime.combine(base, time_of_day)
+    # v2.3: Rows generated past midnight by pattern fill carry a day offset
+    scheduled_time += datetime.timedelta(days=int(vals.get('day_offset', 0) or 0))
+    if spec == "next" and scheduled_time < now:
+        # "next": today if still ahead, otherwise the same time tomorrow (cross-midnight arming)
+        scheduled_time += datetime.timedelta(days=1)
+    return scheduled_time
+
+
+class FireIndex:
+    """
+    Sorted index of pending fires keyed by absolute deadline (v2.3).
+    Deadlines are full datetimes, so ordering survives day rollover and multi-day
+    schedules. Thread-safe: the recurring scheduler updates it from its own thread.
+    `version` changes whenever the index does (cheap staleness check for readers).
+    """
+    def __init__(self, tasks=()):
+        self._lock = threading.Lock()
+        self.version = 0
+        self._keys = sorted((task['scheduled_time'], task['timer_no']) for task in tasks)
+        self._by_timer = {timer_no: deadline for deadline, timer_no in self._keys}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def set(self, timer_no, deadline):
+        with self._lock:
+            self._remove_locked(timer_no)
+            bisect.insort(self._keys, (deadline, timer_no))
+            self._by_timer[timer_no] = deadline
+
+    def discard(self, timer_no):
+        with self._lock:
+            self._remove_locked(timer_no)
+
+    def _remove_locked(self, timer_no):
+        self.version += 1
+        deadline = self._by_timer.pop(timer_no, None)
+        if deadline is None:
+            return
+        i = bisect.bisect_left(self._keys, (deadline, timer_no))
+        if i < len(self._keys) and self._keys[i] == (deadline, timer_no):
+            del self._keys[i]
+
+    def next_fire(self):
+        """(deadline, timer_no) of the earliest pending fire, or None."""
+        with self._lock:
+            return self._keys[0] if self._keys else None
+
+    def deadline_of(self, timer_no):
+        with self._lock:
+            return self._by_timer.get(timer_no)
+
+    def snapshot(self):
+        with self._lock:
+            return list(self._keys)
+
+    def deadline_array(self, size):
+        """Epoch-seconds deadline per row (index timer_no - 1), None where nothing is pending."""
+        deadlines = [None] * size
+        with self._lock:
+            for timer_no, deadline in self._by_timer.items():
+                if 0 < timer_no <= size:
+                    deadlines[timer_no - 1] = deadline.timestamp()
+        return deadlines
+
+
+def format_remaining(seconds):
+    """Countdown text (v2.3): "4:05", "1:02:03", "3d 04:05"."""
+    seconds = max(0, int(seconds + 0.999))  # Round up: "0:00" only once due
+    days, rest = divmod(seconds, 86400)
+    hours, rest = divmod(rest, 3600)
+    minutes, secs = divmod(rest, 60)
+    if days:
+        return f"{days}d {hours:02d}:{minutes:02d}"
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
+
+
+def parse_interval(text):
+    """Click interval in seconds; a "ms" suffix is accepted for burst rows (v2.3)."""
+    text = str(text).strip().lower()
+    if text.endswith("ms"):
+        return float(text[:-2]) / 1000
+    return float(text)
+
+
+def build_task(timer_no, vals, scheduled_time):
+    """Translate a row dict into the task dict consumed by TimerWorker."""
+    show_desktop = vals['show_desktop']
+    task = {
+        "timer_no": timer_no,
+        "scheduled_time": scheduled_time,
+        "show_desktop": show_desktop,
+        "x": int(vals['x']) if vals['x'] and not show_desktop else 0,
+        "y": int(vals['y']) if vals['y'] and not show_desktop else 0,
+        "clicks": int(vals['clicks']) if vals['clicks'] and not show_desktop else 1,
+        "interval": parse_interval(vals['interval']) if vals['interval'] and not show_desktop else 1.0,
+        "paste_text": vals['paste_text'] if not show_desktop else "",
+        "is_last": False
+    }
+    if vals.get('steps') and not show_desktop:
+        # v2.3: Multi-step row: the compiled plan replaces the single click/paste action
+        task["macro"] = compile_plan(parse_steps(vals['steps']))
+    if vals.get('trigger'):
+        # v2.3: Fire once the screen region condition holds (polled from the deadline on)
+        task["trigger"] = Trigger.parse(vals['trigger'])
+    if vals.get('late'):
+        # v2.3: Own missed-deadline policy (otherwise General/late_policy applies)
+        task["late"] = LatePolicy.parse(vals['late'])
+    return task
+
+
+def compile_tasks(rows, config, log, now=None):
+    """
+    Compile enabled row dicts (TimerCard.get_values() / ConfigManager.timers_data)
+    into engine tasks. Shared by the GUI Start button and the headless runner (v2.3).
+    Skipped rows are reported through `log` with the legacy message keys.
+    """
+    now = now or datetime.datetime.now()
+    tasks_info = []
+    for idx, vals in enumerate(rows):
+        if not vals['enabled']:
+            continue
+        try:
+            scheduled_time = row_deadline(vals, now)
+            recurrence = Recurrence.parse(vals.get('repeat'))
+            if recurrence:
+                # v2.3: Recurring rows are never "passed", they start at the next occurrence
+                task = build_task(idx + 1, vals, recurrence.first_at_or_after(scheduled_time, now))
+                task['recurrence'] = recurrence
+                tasks_info.append(task)
+                continue
+            if scheduled_time < now:
+                # Exact legacy message key: log_timer_time_passed
+                log(config.get_message("log_timer_time_passed", timer_no=idx + 1))
+                continue
+            tasks_info.append(build_task(idx + 1, vals, scheduled_time))
+        except Exception as e:
+            log(config.get_message("error_timer_generic", timer_no=idx + 1, error=str(e)))
+    mark_last(tasks_info)
+    return tasks_info
+
+
+def resume_tasks(rows, states, config, log, now=None):
+    """
+    Rebuild the tasks of a recovered session (v2.3, see core.journal): only rows still
+    pending, at their journaled deadlines. `states` maps timer_no -> (state, deadline_epoch).
+    A one-shot row that fired but never finished is reported and left alone; a recurring
+    one moves on to its next occurrence.
+    Deadlines that passed while the app was down are not caught up on: without its own
+    late policy a one-shot row gets 'skip' (not General/late_policy) and a recurring
+    row moves on to its next occurrence, so a recovered session cannot burst at startup.
+    """
+    now = now or datetime.datetime.now()
+    tasks_info = []
+    for timer_no, (state, deadline) in sorted(states.items()):
+        if not 0 < timer_no <= len(rows):
+            continue
+        vals = rows[timer_no - 1]
+        try:
+            scheduled_time = datetime.datetime.fromtimestamp(deadline)
+            recurrence = Recurrence.parse(vals.get('repeat'))
+            if state == "fired":
+                if not recurrence:
+                    log(config.get_message("log_journal_interrupted", timer_no=timer_no))
+                    continue
+                scheduled_time = recurrence.next_after(scheduled_time, now)
+            elif scheduled_time < now and recurrence and not vals.get('late'):
+                missed = scheduled_time
+                scheduled_time = recurrence.first_at_or_after(scheduled_time, now)
+                log(config.get_message("log_journal_missed", timer_no=timer_no,
+                                       time=missed.strftime("%Y-%m-%d %H:%M:%S"),
+                                       next=scheduled_time.strftime("%Y-%m-%d %H:%M:%S")))
+            task = build_task(timer_no, vals, scheduled_time)
+            if scheduled_time < now and 'late' not in task:
+                task['late'] = LatePolicy("skip")
+            if recurrence:
+                task['recurrence'] = recurrence
+            tasks_info.append(task)
+        except Exception as e:
+            log(config.get_message("error_timer_generic", timer_no=timer_no, error=str(e)))
+    mark_last(tasks_info)
+    return tasks_info
+
+
+def mark_last(tasks_info):
+    """
+    Figure out which is the last timer to execute based on scheduled time.
+    A schedule with recurring rows never has a "last" task (no auto-close).
+    """
+    if tasks_info and not any(task.get('recurrence') for task in tasks_info):
+        last_scheduled = max(task['scheduled_time'] for task in tasks_info)
+        for task in tasks_info:
+            task['is_last'] = task['scheduled_time'] == last_scheduled
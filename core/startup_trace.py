@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+# Captured as early as possible: main.py imports this module before anything heavy
+PROCESS_T0 = time.perf_counter()
+
+
+class StartupTrace:
+    """
+    Startup profiling switch (v2.3).
+    Enabled with `--trace-startup` or FLOW_TRACK_TRACE_STARTUP=1. Records how long each
+    startup phase takes (imports, config load, card construction, theme, first paint)
+    and reports the breakdown once the first frame has been painted.
+    """
+    LOG_FILE = "config/startup_trace.log"
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.phases = []  # [(name, ms)]
+        self.reported = False
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, (time.perf_counter() - t0) * 1000))
+
+    def mark(self, name):
+        """Record a milestone measured from process start (e.g. first_paint)."""
+        if self.enabled:
+            self.phases.append((name, (time.perf_counter() - PROCESS_T0) * 1000))
+
+    def format_report(self):
+        parts = [f"{name}={ms:.1f}ms" for name, ms in self.phases]
+        return "startup: " + ", ".join(parts)
+
+    def report(self):
+        """Write the breakdown to stderr (source runs) and the trace log (windowed EXE)."""
+        if not self.enabled or self.reported:
+            return None
+        self.reported = True
+        line = self.format_report()
+        if sys.stderr:
+            print(line, file=sys.stderr)
+        try:
+            log_dir = os.path.dirname(self.LOG_FILE)
+            if log_dir:
+                os.makedirs(log_dir, exist_ok=True)
+            with open(self.LOG_FILE, "a", encoding="utf-8") as f:
+                f.write(time.strftime("%Y-%m-%d %H:%M:%S ") + line + "\n")
+        except OSError:
+            pass
+        return line
+
+
+TRACE = StartupTrace(
+    enabled="--trace-startup" in sys.argv or os.environ.get("FLOW_TRACK_TRACE_STARTUP") == "1"
+)
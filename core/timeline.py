@@ -0,0 +1,94 @@
+"""
+Schedule timeline index (v2.3).
+
+Every row's deadline as seconds from midnight of the day the index was built (rows
+on later days simply land beyond 86400), kept in one sorted array. The timeline view
+only ever asks range questions, each answered with bisect:
+
+    span(t0, t1)        index range of the tasks inside [t0, t1)
+    bins(t0, width, n)  task counts of n consecutive bins (density when zoomed out)
+    nearest(t)          the task closest to t (double-click to jump to a row)
+
+so a paint costs O(visible bins * log N) however many tasks the schedule holds.
+"""
+import bisect
+import datetime
+
+from core.schedule import row_deadline, resolve_base_date
+
+
+def row_seconds(vals, now, day_of):
+    """
+    A row's deadline as seconds from midnight of `now`'s day, or None if it does not
+    parse. Same result as row_deadline(); `day_of` caches the date resolution per date
+    spec (a schedule has a handful), so no datetime is built per row.
+    """
+    try:
+        spec = (vals.get('date') or "").strip().lower()
+        if spec == "next":
+            # Depends on the time of day: the full rule
+            midnight = datetime.datetime.combine(now.date(), datetime.time())
+            return (row_deadline(vals, now) - midnight).total_seconds()
+        days = day_of.get(spec)
+        if days is None:
+            days = day_of[spec] = (resolve_base_date(spec, now) - now.date()).days
+        t = vals['time']
+        if len(t) != 6 or not t.isdigit():
+            return None
+        h, m, s = int(t[0:2]), int(t[2:4]), int(t[4:6])
+        if h > 23 or m > 59 or s > 59:
+            return None
+        return ((days + int(vals.get('day_offset', 0) or 0)) * 86400
+                + h * 3600 + m * 60 + s + int(vals.get('time_ms', 0) or 0) / 1000)
+    except (KeyError, ValueError, TypeError):
+        return None
+
+
+class TimelineIndex:
+    __slots__ = ("times", "rows", "enabled")
+
+    def __init__(self, entries=()):
+        """`entries`: (seconds, row_number, enabled) in any order."""
+        entries = sorted(entries)
+        self.times = [entry[0] for entry in entries]
+        self.rows = [entry[1] for entry in entries]
+        self.enabled = [entry[2] for entry in entries]
+
+    @classmethod
+    def from_rows(cls, rows, now=None):
+        """Index row dicts (TimerCard.get_values()); rows that do not parse are left out."""
+        now = now or datetime.datetime.now()
+        day_of = {}
+        entries = []
+        for idx, vals in enumerate(rows):
+            seconds = row_seconds(vals, now, day_of)
+            if seconds is not None:
+                entries.append((seconds, idx + 1, bool(vals.get('enabled', True))))
+        return cls(entries)
+
+    def __len__(self):
+        return len(self.times)
+
+    def extent(self):
+        """(first, last) task time, or None when empty."""
+        return (self.times[0], self.times[-1]) if self.times else None
+
+    def span(self, t0, t1):
+        """[lo, hi) positions of the tasks with t0 <= time < t1."""
+        return bisect.bisect_left(self.times, t0), bisect.bisect_left(self.times, t1)
+
+    def bins(self, t0, width, n):
+        """Task counts of the n bins [t0 + k*width, t0 + (k+1)*width)."""
+        times = self.times
+        edges = [bisect.bisect_left(times, t0 + k * width) for k in range(n + 1)]
+        return [edges[k + 1] - edges[k] for k in range(n)]
+
+    def nearest(self, t):
+        """Position of the task closest to t, or None when empty."""
+        times = self.times
+        if not times:
+            return None
+        i = bisect.bisect_left(times, t)
+        if i == len(times) or (i > 0 and t - times[i - 1] <= times[i] - t):
+            return i - 1
+        return i
@@ -1,20 +1,64 @@
-import time
-import datetime
 import threading
-import win32api
-import win32con
-import pyperclip
+from collections import deque
 from PySide6.QtCore import QObject, Signal, QThread
 
+from core.timer_wheel import TimerWheel
+from core.schedule import FireIndex
+from core.input_backend import (default_input_backend, TextInjector,
+                                VK_LWIN, VK_D)
+from core.input_executor import InputExecutor
+from core.input_process import ProcessInputExecutor, remote_plan
+from core.critical_window import CriticalGuard
+from core.burst import is_burst, run_burst
+from core.reference_clock import ReferenceClock
+from core.macro import run_plan, plan_span_ms
+from core.pixel_trigger import default_capture_source, wait_for_trigger
+from core.late_policy import LatePolicy, LateEvent, ScheduleShift, CATCH_UP_SETTLE, MAX_EVENTS
+from core.journal import Journal, JOURNAL_FILE
+
+QUEUE_DELAY_LOG_MS = 20  # Report groups that started this much after becoming due
+WHEEL_MAX_WAIT = 30.0  # Longest the recurring scheduler sleeps between wheel checks
+
+
+class FirePlan:
+    """Input state staged for one occurrence, built in the pre-arm window (v2.3)."""
+    __slots__ = ("injector", "burst", "failed")
+
+    def __init__(self, injector=None, burst=False, failed=False):
+        self.injector = injector
+        self.burst = burst
+        self.failed = failed
+
+    def release(self):
+        """Undo staging (restores the clipboard) if the occurrence never fires or has finished."""
+        if self.injector:
+            self.injector.end()
+            self.injector = None
+
+
 class TimerWorker(QObject):
     finished = Signal(int, bool)  # timer_no, is_last
     log = Signal(str)
     error = Signal(int, str) # timer_no, error_msg
+    late = Signal(object)  # v2.3: LateEvent
+    fired = Signal(int)  # v2.3: timer_no handed to the executor (journal)
+    armed = Signal(int, object)  # v2.3: timer_no, next deadline of a recurring row (journal)
 
-    def __init__(self, timer_data, config=None):
+    def __init__(self, timer_data, config=None, backend=None, executor=None, clock=None, capture=None,
+                 shift=None):
         super().__init__()
         self.data = timer_data
         self.config = config
+        # v2.3: Mouse / keyboard / clipboard go through a swappable backend
+        self.backend = backend if backend is not None else default_input_backend()
+        # v2.3: Shared single-thread executor that serializes input across rows
+        self.executor = executor
+        # v2.3: "now" as seen by the reference clock (plain local time until synced)
+        self.clock = clock if clock is not None else ReferenceClock()
+        # v2.3: Screen capture for rows with a pixel / region trigger (created on first use)
+        self.capture = capture
+        # v2.3: Shared offset of 'shift' rows (None unless this row uses that late policy)
+        self.shift = shift
         self._is_running = True
         self.cancel_event = threading.Event()
 
@@ -38,13 +82,25 @@ class TimerWorker(QObject):
         mode_log_key = "log_timer_mode_desktop" if show_desktop else "log_timer_mode_clickpaste"
         self.log.emit(self.get_msg(mode_log_key, timer_no=timer_no))
 
+        # With an executor the group is handed over slightly early; the executor fires it on time
+        lead = self.submit_lead()
+        policy = self.late_policy(self.data)
+        caught_up = False
         while not self.cancel_event.is_set():
-            now = datetime.datetime.now()
+            if self.shift is not None:
+                scheduled_time = self.shift.deadline(self.data['scheduled_time'])
+            now = self.clock.now()
             wait_seconds = (scheduled_time - now).total_seconds()
-            if wait_seconds <= 0:
+            if wait_seconds <= lead:
+                if self.shift is not None and not caught_up and -wait_seconds > policy.tolerance:
+                    # v2.3: Woke late (sleep / suspend): slide the pending 'shift' rows, then re-check
+                    delta = self.shift.catch_up(now)
+                    self.report_late(timer_no, scheduled_time, now, policy, shift=f"{delta:.1f}")
+                    caught_up = True
+                    continue
                 break
-            
-            self.log.emit(self.get_msg("log_timer_wait", timer_no=timer_no, seconds=int(wait_seconds)))
+            caught_up = False
+            # v2.3: No per-wait log line; the countdown column shows the remaining time
             
             # Legacy adaptive sleep algorithm
             sleep_duration = 0.5
@@ -52,7 +108,31 @@ class TimerWorker(QObject):
             if wait_seconds > 60: sleep_duration = 30
             if wait_seconds > 660: sleep_duration = max(int(wait_seconds / 10) - 60, 600)
             
-            self.cancel_event.wait(min(sleep_duration, wait_seconds))
+            self.cancel_event.wait(min(sleep_duration, wait_seconds - lead))
+
+        fire_data = self.data
+        not_before = 0.0
+        if self.shift is not None:
+            self.shift.done(timer_no)
+            if scheduled_time != self.data['scheduled_time']:
+                fire_data = dict(self.data, scheduled_time=scheduled_time)
+                if scheduled_time <= self.clock.now():
+                    # Shifted onto "now" together with others woken by the same resume
+                    not_before = self.clock.time() + CATCH_UP_SETTLE
+        elif not self.cancel_event.is_set():
+            now = self.clock.now()
+            if (now - scheduled_time).total_seconds() > policy.tolerance:
+                self.report_late(timer_no, scheduled_time, now, policy)
+                if policy.policy == "skip":
+                    self.finished.emit(timer_no, is_last)
+                    return
+                not_before = self.clock.time() + CATCH_UP_SETTLE
+        if self.data.get('trigger') and not self.cancel_event.is_set():
+            fire_data = self.await_trigger(fire_data)
+            if fire_data is None and not self.cancel_event.is_set():
+                # Timed out: the occurrence is skipped, the row is done
+                self.finished.emit(timer_no, is_last)
+                return
 
         if self.cancel_event.is_set():
             # 方案 C: 削减冗余跨线程信号，防止死锁
@@ -61,104 +141,493 @@ class TimerWorker(QObject):
             self.finished.emit(timer_no, False)
             return
 
+        if not self.run_serialized(fire_data, not_before) and self.cancel_event.is_set():
+            return  # Cancelled mid-action
+        # Also after a failed group: the fire index, journal and UI wait for this
+        self.finished.emit(timer_no, is_last)
+
+    def late_policy(self, data):
+        """The row's missed-deadline policy, else General/late_policy (v2.3)."""
+        if data.get('late'):
+            return data['late']
+        if self.config:
+            return LatePolicy.parse(self.config.late_policy) or LatePolicy()
+        return LatePolicy()
+
+    def report_late(self, timer_no, deadline, woke, policy, **fields):
+        """Record a lateness event and log what the policy did about it."""
+        event = LateEvent(timer_no, deadline, woke, policy)
+        self.late.emit(event)
+        self.log.emit(self.get_msg(f"log_timer_late_{policy.policy}", timer_no=timer_no,
+                                   ms=int(event.late_ms), tolerance=f"{policy.tolerance:g}", **fields))
+
+    def await_trigger(self, data):
+        """
+        v2.3: From the deadline on, poll the row's screen region until its trigger holds.
+        Returns the data to fire with (deadline = the moment it held), or None on
+        timeout / cancel.
+        """
+        timer_no = data['timer_no']
+        trigger = data['trigger']
+        remaining = (data['scheduled_time'] - self.clock.now()).total_seconds()
+        if remaining > 0 and self.cancel_event.wait(remaining):
+            return None
+        if self.capture is None:
+            self.capture = default_capture_source()
+        self.log.emit(self.get_msg("log_timer_trigger_armed", timer_no=timer_no, rule=str(trigger)))
+        try:
+            result = wait_for_trigger(trigger, self.capture, self.cancel_event)
+        except Exception as e:
+            self.error.emit(timer_no, str(e))
+            return None
+        if result.cancelled:
+            return None
+        if not result.fired:
+            self.log.emit(self.get_msg("log_timer_trigger_timeout", timer_no=timer_no,
+                                       seconds=f"{trigger.timeout:g}", polls=result.polls))
+            return None
+        self.log.emit(self.get_msg("log_timer_trigger_fired", timer_no=timer_no,
+                                   ms=int(result.elapsed * 1000), polls=result.polls,
+                                   cost=f"{result.avg_cost_ms:.2f}"))
+        return dict(data, scheduled_time=self.clock.now())
+
+    def prepare(self, data):
+        """
+        Pre-arm (v2.3): stage everything that does not have to happen at the deadline
+        (log line, cursor move, clipboard load, burst decision). Returns a FirePlan.
+        """
+        if data['show_desktop']:
+            return FirePlan()
+        try:
+            macro = data.get('macro')
+            if macro:
+                self.post_log(self.get_msg("log_timer_macro_begin", timer_no=data['timer_no'],
+                                           steps=len(macro), ms=plan_span_ms(macro)))
+                if macro[0][:2] == (0, "move"):
+                    # Pre-position for the opening move; it is re-issued on time anyway
+                    self.backend.move(*macro[0][2])
+                return FirePlan()
+            self.post_log(self.get_msg("log_timer_begin", timer_no=data['timer_no']))
+            self.backend.move(data['x'], data['y'])
+            paste_text = data['paste_text']
+            # v2.3: Clipboard set once per task (or typed directly), restored afterwards
+            injector = TextInjector(self.backend, self.paste_mode(), self.cancel_event) if paste_text else None
+            if injector:
+                injector.begin(paste_text)
+            return FirePlan(injector, is_burst(data['clicks'], data['interval']))
+        except Exception as e:
+            self.error.emit(data['timer_no'], str(e))
+            return FirePlan(failed=True)
+
+    def execute(self, data, plan=None):
+        """
+        Perform one occurrence of a task (v2.3: split out of run_task so the
+        recurring scheduler can reuse it). Returns False if cancelled mid-action.
+        `plan` is the pre-armed FirePlan; without one the task is staged inline.
+        """
+        timer_no = data['timer_no']
+        show_desktop = data['show_desktop']
+        fired_at = self.clock.time()
+        guard_state = self.guard_state()
+
         # --- Execution logic (Legacy Parity) ---
         try:
             if show_desktop:
-                self.log.emit(self.get_msg("log_timer_show_desktop", timer_no=timer_no))
-                win32api.keybd_event(win32con.VK_LWIN, 0, 0, 0)
-                win32api.keybd_event(ord('D'), 0, 0, 0)
+                self.post_log(self.get_msg("log_timer_show_desktop", timer_no=timer_no))
+                self.backend.key_down(VK_LWIN)
+                self.backend.key_down(VK_D)
                 
                 # 方案 C: 将微秒级 time.sleep 也替换为等效的 wait(), 并允许一键击穿
-                if self.cancel_event.wait(0.05): return
+                if self.cancel_event.wait(0.05): return False
                 
-                win32api.keybd_event(ord('D'), 0, win32con.KEYEVENTF_KEYUP, 0)
-                win32api.keybd_event(win32con.VK_LWIN, 0, win32con.KEYEVENTF_KEYUP, 0)
+                self.backend.key_up(VK_D)
+                self.backend.key_up(VK_LWIN)
                 
-                if self.cancel_event.wait(0.5): return
+                if self.cancel_event.wait(0.5): return False
                 
-                self.log.emit(self.get_msg("log_timer_show_desktop_done", timer_no=timer_no))
+                self.post_log(self.get_msg("log_timer_show_desktop_done", timer_no=timer_no))
+            elif data.get('macro'):
+                if plan is None:
+                    plan = self.prepare(data)
+                    fired_at = self.clock.time()
+                    guard_state = self.guard_state()
+                if plan.failed:
+                    return True
+                self.execute_macro(timer_no, data['macro'])
             else:
-                self.log.emit(self.get_msg("log_timer_begin", timer_no=timer_no))
-                x, y = self.data['x'], self.data['y']
-                clicks = self.data['clicks']
-                interval = self.data['interval']
-                paste_text = self.data['paste_text']
-                
-                for i in range(clicks):
-                    if self.cancel_event.is_set(): 
-                        self.log.emit(self.get_msg("error_timer_click_interrupt", timer_no=timer_no))
-                        break
-                    
-                    win32api.SetCursorPos((x, y))
-                    win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, 0, 0)
-                    win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, 0, 0)
-                    self.log.emit(self.get_msg("log_timer_click", timer_no=timer_no, count=i + 1))
-                    
-                    if paste_text:
-                        self.log.emit(self.get_msg("log_timer_paste_begin", timer_no=timer_no))
-                        pyperclip.copy(paste_text)
+                if plan is None:
+                    plan = self.prepare(data)
+                    fired_at = self.clock.time()
+                    guard_state = self.guard_state()
+                if plan.failed:
+                    return True
+                x, y = data['x'], data['y']
+                clicks = data['clicks']
+                interval = data['interval']
+                injector = plan.injector
+                try:
+                    if plan.burst:
+                        self.execute_burst(timer_no, x, y, clicks, interval, injector)
+                        clicks = 0  # Skip the per-click legacy loop below
+                    for i in range(clicks):
+                        if self.cancel_event.is_set(): 
+                            self.post_log(self.get_msg("error_timer_click_interrupt", timer_no=timer_no))
+                            break
                         
-                        # 微步休眠
-                        if self.cancel_event.wait(0.1): break
+                        self.backend.move(x, y)
+                        self.backend.click()
+                        self.post_log(self.get_msg("log_timer_click", timer_no=timer_no, count=i + 1))
                         
-                        win32api.keybd_event(win32con.VK_CONTROL, 0, 0, 0)
-                        win32api.keybd_event(ord('V'), 0, 0, 0)
-                        win32api.keybd_event(ord('V'), 0, win32con.KEYEVENTF_KEYUP, 0)
-                        win32api.keybd_event(win32con.VK_CONTROL, 0, win32con.KEYEVENTF_KEYUP, 0)
-                        self.log.emit(self.get_msg("log_timer_paste_completed", timer_no=timer_no))
-                    
-                    if i < clicks - 1:
-                        # 方案 C 核心：将致命的 time.sleep(interval) 升级为可瞬间打断的微步轮询
-                        if self.cancel_event.wait(interval):
-                            self.log.emit(self.get_msg("log_timer_cancel", timer_no=timer_no))
-                            break
+                        if injector:
+                            self.post_log(self.get_msg("log_timer_paste_begin", timer_no=timer_no))
+                            if not injector.paste(): break
+                            self.post_log(self.get_msg("log_timer_paste_completed", timer_no=timer_no))
+                        
+                        if i < clicks - 1:
+                            # 方案 C 核心：将致命的 time.sleep(interval) 升级为可瞬间打断的微步轮询
+                            if self.cancel_event.wait(interval):
+                                self.post_log(self.get_msg("log_timer_cancel", timer_no=timer_no))
+                                break
+                finally:
+                    plan.release()
+                if injector and injector.latencies_ms:
+                    samples = injector.latencies_ms
+                    self.post_log(self.get_msg("log_timer_paste_latency", timer_no=timer_no, count=len(samples),
+                                               avg=f"{sum(samples) / len(samples):.1f}", max=f"{max(samples):.1f}"))
                 
-                self.log.emit(self.get_msg("log_timer_completed", timer_no=timer_no))
+                self.post_log(self.get_msg("log_timer_completed", timer_no=timer_no))
+            # Deadline-to-first-input latency, reported after the fact (off the hot path)
+            self.post_log(self.get_msg("log_timer_fire_latency", timer_no=timer_no,
+                                       ms=f"{(fired_at - data['scheduled_time'].timestamp()) * 1000:.1f}",
+                                       guard=guard_state))
         except Exception as e:
             self.error.emit(timer_no, str(e))
-        
-        self.finished.emit(timer_no, is_last)
+        return True
+
+    def execute_burst(self, timer_no, x, y, clicks, interval, injector):
+        """v2.3: Thousands of clicks at ms intervals; no per-click logging, one report at the end."""
+        backend = self.backend
+
+        def fire():
+            backend.move(x, y)
+            backend.click()
+            return injector.paste() if injector else True
+
+        self.post_log(self.get_msg("log_timer_burst_begin", timer_no=timer_no, clicks=clicks,
+                                   interval=f"{interval * 1000:g}"))
+        stats = run_burst(clicks, interval, fire, self.cancel_event)
+        if stats.cancelled:
+            self.post_log(self.get_msg("error_timer_click_interrupt", timer_no=timer_no))
+        self.post_log(self.get_msg("log_timer_burst_done", timer_no=timer_no, count=stats.count,
+                                   seconds=f"{stats.elapsed:.3f}", rate=f"{stats.rate:.1f}",
+                                   target=f"{stats.target_rate:.1f}",
+                                   jitter_avg=f"{stats.jitter_avg_ms:.2f}", jitter_max=f"{stats.jitter_max_ms:.2f}"))
+
+    def execute_macro(self, timer_no, macro):
+        """v2.3: Run a compiled multi-step plan as one timed group (ms gaps, drift-free)."""
+        done, max_late_ms, cancelled = run_plan(macro, self.backend, self.cancel_event)
+        if cancelled:
+            self.post_log(self.get_msg("error_timer_click_interrupt", timer_no=timer_no))
+        self.post_log(self.get_msg("log_timer_macro_done", timer_no=timer_no, done=done,
+                                   steps=len(macro), late=f"{max_late_ms:.2f}"))
+
+    def guard(self):
+        return getattr(self.executor, "guard", None)
+
+    def guard_state(self):
+        guard = self.guard()
+        return guard.state() if guard is not None else "off"
+
+    def post_log(self, message):
+        """Log from the fire path: deferred until the critical window closes (v2.3)."""
+        guard = self.guard()
+        if guard is None:
+            self.log.emit(message)
+        else:
+            guard.defer(lambda: self.log.emit(message))
+
+    def submit_lead(self):
+        return self.executor.submit_lead if self.executor else 0
+
+    def run_serialized(self, data, not_before=0.0):
+        """
+        Execute `data` as one atomic group on the executor (inline when there is none).
+        `not_before` (late groups) lets groups due earlier overtake it.
+        """
+        self.fired.emit(data['timer_no'])
+        if self.executor is None:
+            return self.execute(data)
+        if getattr(self.executor, "remote", False):
+            return self.run_remote(data, not_before)
+        if self.executor.pre_arm:
+            job = self.executor.submit(data['scheduled_time'].timestamp(), data['timer_no'],
+                                       lambda plan: self.execute(data, plan), lambda: self.prepare(data),
+                                       not_before)
+        else:
+            job = self.executor.submit(data['scheduled_time'].timestamp(), data['timer_no'],
+                                       lambda: self.execute(data), not_before=not_before)
+        job.done.wait()
+        if job.error is not None:
+            self.error.emit(data['timer_no'], str(job.error) or type(job.error).__name__)
+        if job.started is not None and job.queue_delay_ms >= QUEUE_DELAY_LOG_MS:
+            self.log.emit(self.get_msg("log_timer_queue_delay", timer_no=data['timer_no'],
+                                       ms=int(job.queue_delay_ms)))
+        return bool(job.result)
+
+    def run_remote(self, data, not_before=0.0):
+        """v2.3: Hand the occurrence to the isolated input process; log its telemetry afterwards."""
+        timer_no = data['timer_no']
+        key = "log_timer_show_desktop" if data['show_desktop'] else "log_timer_begin"
+        self.log.emit(self.get_msg(key, timer_no=timer_no))
+        job = self.executor.submit_plan(data['scheduled_time'].timestamp(), timer_no, remote_plan(data), not_before)
+        job.done.wait()
+        if not job.result:
+            if job.error:
+                self.error.emit(timer_no, job.error)  # Lost with the input process
+            return False  # Else dropped by stop_all
+        info = job.telemetry
+        if info.get("error"):
+            self.error.emit(timer_no, info["error"])
+        elif info.get("cancelled"):
+            self.log.emit(self.get_msg("error_timer_click_interrupt", timer_no=timer_no))
+        self.log.emit(self.get_msg("log_timer_remote_done", timer_no=timer_no, count=info.get("count", 0),
+                                   late=f"{info.get('late_ms', 0.0):.2f}",
+                                   jitter=f"{info.get('jitter_max_ms', 0.0):.2f}",
+                                   ms=f"{info.get('elapsed_ms', 0.0):.1f}", guard=info.get("guard", "off")))
+        return True
+
+    def paste_mode(self):
+        return self.config.paste_mode if self.config else "clipboard"
+
+class RecurringScheduler(TimerWorker):
+    """
+    Recurring tasks (v2.3): one thread drives every recurring row through a
+    hierarchical timer wheel instead of one thread per row/occurrence.
+    The thread sleeps until the wheel's next non-empty slot; on expiry the task is
+    executed and its next occurrence (computed incrementally) is re-inserted.
+    An occurrence with a trigger polls on a helper thread of its own, so the wheel keeps
+    serving the other rows; the task is handed back (`_rearm`) once it has fired or timed
+    out, and re-inserted by the scheduler thread, which alone touches the wheel.
+    """
+    def __init__(self, tasks, config=None, fire_index=None, backend=None, executor=None, clock=None, capture=None):
+        super().__init__(None, config, backend, executor, clock, capture)
+        self.tasks = tasks
+        self.fire_index = fire_index
+        self.wheel = TimerWheel(start_ms=self._now_ms())
+        for task in tasks:
+            self.wheel.insert(task['scheduled_time'].timestamp() * 1000, task)
+        self._rearm = deque()  # Tasks back from their trigger thread
+        self._waiting = 0  # Occurrences still on a trigger thread
+        self._wake = threading.Event()
+
+    def stop(self):
+        super().stop()
+        self._wake.set()
+
+    def _now_ms(self):
+        return self.clock.time() * 1000
+
+    def run_task(self):
+        for task in self.tasks:
+            self.log.emit(self.get_msg("log_timer_recurring_armed", timer_no=task['timer_no'],
+                                       rule=str(task['recurrence']),
+                                       time=task['scheduled_time'].strftime("%Y-%m-%d %H:%M:%S")))
+        lead_ms = self.submit_lead() * 1000
+        while not self.cancel_event.is_set():
+            while self._rearm:
+                self._waiting -= 1
+                self.schedule_next(self._rearm.popleft())
+            for entry in self.wheel.advance(self._now_ms() + lead_ms):
+                if self.executor is None:
+                    # The wheel resolves to one tick; finish the last few ms precisely
+                    remaining = (entry.deadline_ms - self._now_ms()) / 1000
+                    if remaining > 0 and self.cancel_event.wait(remaining):
+                        break
+                task = entry.payload
+                fire_data = task
+                not_before = 0.0
+                now = self.clock.now()
+                policy = self.late_policy(task)
+                if (now - task['scheduled_time']).total_seconds() > policy.tolerance:
+                    # v2.3: Missed after sleep / suspend. 'shift' re-anchors "every" rules on now;
+                    # daily / weekday rules keep their time of day (next_after skips the backlog)
+                    shift = (now - task['scheduled_time']).total_seconds() if policy.policy == "shift" else 0.0
+                    self.report_late(task['timer_no'], task['scheduled_time'], now, policy, shift=f"{shift:.1f}")
+                    if policy.policy == "skip":
+                        fire_data = None
+                    else:
+                        not_before = self.clock.time() + CATCH_UP_SETTLE
+                        if policy.policy == "shift" and task['recurrence'].kind == "every":
+                            task['scheduled_time'] = now
+                if fire_data is not None and task.get('trigger'):
+                    self._waiting += 1
+                    threading.Thread(target=self.trigger_occurrence, args=(task, not_before),
+                                     name=f"Trigger-{task['timer_no']}", daemon=True).start()
+                    continue
+                if fire_data is not None and not self.run_serialized(fire_data, not_before) \
+                        and self.cancel_event.is_set():
+                    break
+                self.schedule_next(task)
+            wakeup_ms = self.wheel.next_wakeup_ms()
+            if wakeup_ms is None and not self._waiting:
+                break
+            # Capped so the wall clock is re-read now and then (a suspend does not advance the wait)
+            wait = WHEEL_MAX_WAIT if wakeup_ms is None else (wakeup_ms - lead_ms - self._now_ms()) / 1000
+            self._wake.wait(min(WHEEL_MAX_WAIT, max(0.0, wait)))
+            self._wake.clear()
+        # Recurring tasks never finish on their own: report completion only when stopped
+        self.finished.emit(0, False)
+
+    def trigger_occurrence(self, task, not_before):
+        """Helper thread: wait for the task's trigger (a timeout skips the occurrence), fire, hand back."""
+        fire_data = self.await_trigger(task)
+        if fire_data is not None and not self.cancel_event.is_set():
+            self.run_serialized(fire_data, not_before)
+        self._rearm.append(task)
+        self._wake.set()
+
+    def schedule_next(self, task):
+        """Re-insert `task` at its next occurrence (scheduler thread only)."""
+        guard = self.guard()
+        if guard is not None:
+            # Bookkeeping waits until the executor leaves its critical window
+            guard.wait_clear()
+        nxt = task['recurrence'].next_after(task['scheduled_time'], self.clock.now())
+        task['scheduled_time'] = nxt
+        self.wheel.insert(nxt.timestamp() * 1000, task)
+        self.armed.emit(task['timer_no'], nxt)
+        if self.fire_index is not None:
+            self.fire_index.set(task['timer_no'], nxt)
+        self.log.emit(self.get_msg("log_timer_recurring_next", timer_no=task['timer_no'],
+                                   time=nxt.strftime("%Y-%m-%d %H:%M:%S")))
 
 class TimerEngine(QObject):
     log_signal = Signal(str)
     task_finished = Signal(int, bool) # timer_no, is_last
 
-    def __init__(self, config=None):
+    def __init__(self, config=None, input_backend=None, clock=None):
         super().__init__()
         self.config = config
+        self.input_backend = input_backend
+        # v2.3: Shared with ClockSync, which keeps the offset / drift estimate current
+        self.clock = clock if clock is not None else ReferenceClock()
         self.threads = []
         self.workers = []
+        self._scheduler = None
+        self.executor = None
+        self.capture = None
+        # v2.3: Absolute-deadline index of everything still pending (status / countdown)
+        self.fire_index = FireIndex()
+        # v2.3: Occurrences that woke past their tolerance (sleep / suspend / stalls)
+        self.late_events = deque(maxlen=MAX_EVENTS)
+        self.shift = None
+        # v2.3: Crash-safe journal of the running session (see core/journal.py)
+        self.journal = None
         # 方案 C: 废弃线程接管池 (Zombie Trap Safe-house)
         # 引用保留，以免底层 C++ QThread 被 Python GC 过早误杀，引发 Fatal Crash
         self._zombie_pool = []
         self._pool_lock = threading.Lock()
 
-    def start_tasks(self, tasks_info):
+    @property
+    def recurring_active(self):
+        return self._scheduler is not None
+
+    def next_fire(self):
+        """(deadline, timer_no) of the earliest pending fire across days, or None."""
+        return self.fire_index.next_fire()
+
+    def start_tasks(self, tasks_info, rows=None):
+        """Arm `tasks_info`; with the session's `rows` the run is journaled for crash recovery."""
         self.stop_all()
         
         if not tasks_info:
             return
 
+        self.fire_index = FireIndex(tasks_info)
+        if rows is not None and self.config and self.config.journal:
+            self.journal = Journal(JOURNAL_FILE)
+            try:
+                self.journal.begin(rows, tasks_info)
+            except OSError as e:
+                self.journal = None
+                self.log_signal.emit(self.config.get_message("error_journal", error=str(e)))
+        if self.input_backend is None:
+            self.input_backend = default_input_backend()
+        pre_arm = self.config.pre_arm_ms / 1000 if self.config else 0
+        window = self.config.critical_window_ms / 1000 if self.config else 0
+        if self.config and self.config.input_process:
+            # v2.3: Injection in a separate process, isolated from GUI-side GIL / GC stalls
+            self.executor = ProcessInputExecutor(pre_arm=pre_arm, clock=self.clock,
+                                                 paste_mode=self.config.paste_mode, critical_window=window,
+                                                 on_exit=self._on_input_process_exit)
+        else:
+            # v2.3: Priority / GC / housekeeping guard around each deadline (0 = off)
+            guard = CriticalGuard(window) if window > 0 else None
+            self.executor = InputExecutor(pre_arm=pre_arm, clock=self.clock, guard=guard)
+        self.executor.start()
+        if self.capture is None and any(info.get('trigger') for info in tasks_info):
+            self.capture = default_capture_source()
+
+        # v2.3: Rows without their own late policy follow General/late_policy
+        default_late = (LatePolicy.parse(self.config.late_policy) if self.config else None) or LatePolicy()
         for info in tasks_info:
-            thread = QThread()
-            worker = TimerWorker(info, self.config)
-            worker.moveToThread(thread)
-            
-            thread.started.connect(worker.run_task)
-            worker.finished.connect(thread.quit)
+            info['late'] = info.get('late') or default_late
+        self.shift = ScheduleShift([info for info in tasks_info
+                                    if info['late'].policy == "shift" and not info.get('recurrence')],
+                                   self.fire_index)
+
+        # v2.3: Recurring rows share one wheel-driven scheduler thread
+        recurring = [info for info in tasks_info if info.get('recurrence')]
+        if recurring:
+            self._scheduler = RecurringScheduler(recurring, self.config, self.fire_index,
+                                                 self.input_backend, self.executor, self.clock,
+                                                 self.capture)
+            self._start_worker(self._scheduler, report_finished=False)
+
+        for info in tasks_info:
+            if not info.get('recurrence'):
+                shift = self.shift if info['timer_no'] in self.shift else None
+                self._start_worker(TimerWorker(info, self.config, self.input_backend, self.executor,
+                                               self.clock, self.capture, shift))
+
+    def _start_worker(self, worker, report_finished=True):
+        thread = QThread()
+        worker.moveToThread(thread)
+        
+        thread.started.connect(worker.run_task)
+        worker.finished.connect(thread.quit)
+        journal = self.journal
+        if report_finished:
+            index = self.fire_index
+            worker.finished.connect(lambda t_no, _last, index=index: index.discard(t_no))
+            if journal is not None:
+                worker.finished.connect(lambda t_no, _last, index=index: self._journal_done(journal, index, t_no))
             worker.finished.connect(self.task_finished.emit)
-            worker.finished.connect(worker.deleteLater)
-            
-            # 方案 C: 在真正终结时，从废弃池中安全移除引用
-            thread.finished.connect(thread.deleteLater)
-            thread.finished.connect(lambda t=thread: self._clean_zombie(t))
-            
-            worker.log.connect(self.log_signal.emit)
-            worker.error.connect(lambda t_no, msg: self.log_signal.emit(self.config.get_message("error_timer_generic", timer_no=t_no, error=msg)))
-            
-            self.threads.append(thread)
-            self.workers.append(worker)
-            thread.start()
+        if journal is not None:
+            worker.fired.connect(lambda t_no: journal.record("fire", t_no))
+            worker.armed.connect(lambda t_no, deadline: journal.record("arm", t_no, deadline))
+        worker.finished.connect(worker.deleteLater)
+        
+        # 方案 C: 在真正终结时，从废弃池中安全移除引用
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(lambda t=thread: self._clean_zombie(t))
+        
+        worker.log.connect(self.log_signal.emit)
+        worker.late.connect(self.late_events.append)
+        worker.error.connect(lambda t_no, msg: self.log_signal.emit(self.config.get_message("error_timer_generic", timer_no=t_no, error=msg)))
+        
+        self.threads.append(thread)
+        self.workers.append(worker)
+        thread.start()
+
+    def _on_input_process_exit(self, reason):
+        """The input process is gone; the executor carries on in-process (any thread)."""
+        self.log_signal.emit(self.config.get_message("error_input_process_exit", reason=reason))
+
+    def _journal_done(self, journal, index, timer_no):
+        journal.record("done", timer_no)
+        if not len(index) and self._scheduler is None:
+            journal.end()  # Everything ran: nothing left to recover
 
     def _clean_zombie(self, thread):
         """线程确实完结后做最终的引用释放"""
@@ -177,6 +646,14 @@ class TimerEngine(QObject):
                 worker.stop()
             except RuntimeError:
                 pass
+        if self.executor is not None:
+            # Pending groups are dropped; workers blocked on them wake up and exit
+            self.executor.stop()
+        if self.journal is not None:
+            for _deadline, timer_no in self.fire_index.snapshot():
+                self.journal.record("cancel", timer_no)
+            self.journal.end()
+            self.journal = None
             
         with self._pool_lock:
             for thread in self.threads:
@@ -191,4 +668,8 @@ class TimerEngine(QObject):
                 
         self.threads = []
         self.workers = []
+        self._scheduler = None
+        self.executor = None
+        self.shift = None
+        self.fire_index = FireIndex()
 
@@ -0,0 +1,138 @@
+"""
+Hierarchical timer wheel (v2.3).
+
+Deadlines are bucketed by absolute tick into `levels` wheels of `slots` slots each.
+Insert and cancel are O(1); each processed tick touches one level-0 slot and, on
+wheel wrap, cascades a single slot of the next level down. While level 0 is empty,
+time jumps straight to the next occupied higher-level slot, so neither the
+scheduler's wakeups nor catching up after a long sleep walk the idle rotations.
+"""
+
+
+class WheelEntry:
+    __slots__ = ("tick", "deadline_ms", "payload", "cancelled")
+
+    def __init__(self, tick, deadline_ms, payload):
+        self.tick = tick
+        self.deadline_ms = deadline_ms
+        self.payload = payload
+        self.cancelled = False
+
+    def cancel(self):
+        """Lazy removal: the entry is dropped when its slot is processed."""
+        self.cancelled = True
+
+
+class TimerWheel:
+    def __init__(self, start_ms, tick_ms=10, slot_bits=6, levels=4):
+        self.tick_ms = tick_ms
+        self.slot_bits = slot_bits
+        self.slots = 1 << slot_bits
+        self.mask = self.slots - 1
+        self.levels = levels
+        self.current_tick = int(start_ms // tick_ms)  # Ticks are ints: the slot maths uses & and >>
+        self.wheels = [[[] for _ in range(self.slots)] for _ in range(levels)]
+        self.level_counts = [0] * levels
+        self.overflow = []  # Beyond the top level's span; re-placed on top-level wrap
+
+    def __len__(self):
+        return sum(self.level_counts) + len(self.overflow)
+
+    def insert(self, deadline_ms, payload):
+        entry = WheelEntry(int(deadline_ms // self.tick_ms), deadline_ms, payload)
+        # Anything already due fires on the next processed tick
+        self._place(entry, self.current_tick + 1)
+        return entry
+
+    def _place(self, entry, floor_tick):
+        tick = max(entry.tick, floor_tick)
+        delta = tick - self.current_tick
+        for level in range(self.levels):
+            if delta < 1 << (self.slot_bits * (level + 1)):
+                idx = (tick >> (self.slot_bits * level)) & self.mask
+                self.wheels[level][idx].append(entry)
+                self.level_counts[level] += 1
+                return
+        self.overflow.append(entry)
+
+    def _cascade(self, level):
+        """Move one slot of `level` down into the lower levels."""
+        idx = (self.current_tick >> (self.slot_bits * level)) & self.mask
+        bucket = self.wheels[level][idx]
+        if not bucket:
+            return
+        self.wheels[level][idx] = []
+        self.level_counts[level] -= len(bucket)
+        for entry in bucket:
+            if not entry.cancelled:
+                # The current tick's level-0 slot is processed right after cascading
+                self._place(entry, self.current_tick)
+
+    def advance(self, now_ms):
+        """Process every tick up to now_ms and return the expired, non-cancelled payload entries."""
+        target = int(now_ms // self.tick_ms)
+        expired = []
+        while self.current_tick < target:
+            if self.level_counts[0] == 0:
+                # Nothing in level 0: jump to the tick before the next cascade that brings something down
+                cascade = self._next_cascade_tick()
+                skip_to = target if cascade is None else min(cascade - 1, target)
+                if skip_to > self.current_tick:
+                    self.current_tick = skip_to
+                    continue
+            self.current_tick += 1
+            tick = self.current_tick
+            if tick & self.mask == 0:
+                for level in range(1, self.levels):
+                    self._cascade(level)
+                    if (tick >> (self.slot_bits * level)) & self.mask:
+                        break
+                else:
+                    pending, self.overflow = self.overflow, []
+                    for entry in pending:
+                        if not entry.cancelled:
+                            self._place(entry, tick)
+            bucket = self.wheels[0][tick & self.mask]
+            if bucket:
+                self.wheels[0][tick & self.mask] = []
+                self.level_counts[0] -= len(bucket)
+                expired.extend(entry for entry in bucket if not entry.cancelled)
+        return expired
+
+    def _next_cascade_tick(self):
+        """Start tick of the earliest occupied slot above level 0 (or the overflow's re-placement), or None."""
+        best = None
+        for level in range(1, self.levels):
+            if not self.level_counts[level]:
+                continue
+            shift = self.slot_bits * level
+            base = self.current_tick >> shift
+            for step in range(1, self.slots + 1):
+                if self.wheels[level][(base + step) & self.mask]:
+                    tick = (base + step) << shift
+                    if best is None or tick < best:
+                        best = tick
+                    break
+        if self.overflow:
+            shift = self.slot_bits * self.levels
+            tick = ((self.current_tick >> shift) + 1) << shift
+            if best is None or tick < best:
+                best = tick
+        return best
+
+    def next_wakeup_ms(self):
+        """
+        Earliest time worth waking for: the next non-empty level-0 slot, or the start
+        of the earliest occupied higher-level slot if that comes first. None when empty.
+        """
+        wake = None
+        if self.level_counts[0]:
+            for step in range(1, self.slots + 1):
+                tick = self.current_tick + step
+                if self.wheels[0][tick & self.mask]:
+                    wake = tick
+                    break
+        cascade = self._next_cascade_tick()
+        if cascade is not None and (wake is None or cascade < wake):
+            wake = cascade
+        return wake * self.tick_ms if wake is not None else None
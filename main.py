@@ -1,42 +1,92 @@
+# v2.3: Imported first so the startup trace clock starts before anything heavy
+from core.startup_trace import TRACE
 import sys
 import os
-from PySide6.QtWidgets import QApplication
-from ui.main_window import MainWindow
+import argparse
 
-# [v2.2] Single Instance Mechanism (Lead Architect Design)
-import win32event
-import win32api
-import winerror
+# [v2.2] Single Instance Mechanism (v2.3: portable, no Windows imports off Windows)
+from core.instance_lock import default_instance_lock
 
-# Global mutex reference to prevent GC
-_app_mutex = None
+# Global lock reference to prevent GC
+_app_lock = None
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="flow_track", add_help=False)
+    parser.add_argument("--headless", action="store_true", help="Run the saved schedule without the GUI")
+    parser.add_argument("--log", default=None, help="Headless log file (default: stdout)")
+    parser.add_argument("--no-lazy", action="store_true", help="Build every row before the first paint")
+    parser.add_argument("--trace-startup", action="store_true", help="Report startup phase timings")
+    parser.add_argument("--cmd", action="append", default=[],
+                        help="Control command for the running instance: a word (status, start, stop, show) "
+                             "or a JSON object; repeat for a bulk request")
+    # Unknown arguments are left for Qt (e.g. -platform)
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+def forward_commands(texts):
+    """v2.3: Hand the command(s) to the running instance and print its reply. Returns the exit code."""
+    import json
+    from core.ipc import parse_command, send_commands
+    try:
+        commands = [parse_command(text) for text in texts] or [{"cmd": "show"}]
+        reply = send_commands(commands if len(commands) > 1 else commands[0])
+    except (OSError, ValueError) as e:
+        if sys.stderr:
+            print(e, file=sys.stderr)
+        return 1
+    if texts and sys.stdout:
+        print(json.dumps(reply, ensure_ascii=False))
+    replies = reply if isinstance(reply, list) else [reply]
+    return 0 if all(r.get("ok") for r in replies) else 1
 
 def main():
-    global _app_mutex
-    
-    # 1. Critical: Create Named Mutex before any UI loading
-    # GUID ensures global uniqueness: {9D2A3B4C-FlowTrack-Mutex-v2.2}
-    mutex_name = "Local\\FlowTrack_Instance_Mutex_9D2A3B4C-v2.2"
+    global _app_lock
+    # v2.3: The optional input process (core/input_process.py) is spawned from the frozen EXE
+    import multiprocessing
+    multiprocessing.freeze_support()
+    args = parse_args(sys.argv[1:])
     
-    # CreateMutex(security_attributes, initial_owner, name)
-    _app_mutex = win32event.CreateMutex(None, False, mutex_name)
-    last_error = win32api.GetLastError()
+    # 1. Critical: Take the instance lock before any UI loading
+    # (named mutex on Windows, fcntl-locked file elsewhere; see core/instance_lock.py)
+    _app_lock = default_instance_lock()
     
-    # 2. Check: If mutex already exists, an instance is running
-    if last_error == winerror.ERROR_ALREADY_EXISTS:
-        # Silent exit: prevent multiple windows from piling up
-        sys.exit(0)
+    # 2. Check: If the lock is held, an instance is running
+    if not _app_lock.acquire():
+        # v2.3: Forward to the running instance (default: bring its window up) instead of
+        # silently exiting; no second Qt process is started either way
+        sys.exit(forward_commands(args.cmd))
+    if args.cmd:
+        # Nothing to forward to
+        if sys.stderr:
+            print("no running instance", file=sys.stderr)
+        sys.exit(1)
 
     # 3. Handle DPI Scaling for Windows
     if os.name == 'nt':
         from ctypes import windll
         windll.shcore.SetProcessDpiAwareness(1)
         
+    # 4. Headless: engine only, no widgets / stylesheet / qtawesome (v2.3)
+    if args.headless:
+        from core.headless import run_headless
+        sys.exit(run_headless(args.log))
+
+    # 5. Heavy imports only after the single-instance check (a second launch exits cheaply)
+    with TRACE.phase("imports"):
+        from PySide6.QtWidgets import QApplication
+        from ui.main_window import MainWindow
+
     app = QApplication(sys.argv)
     app.setApplicationName("Flow Track")
     
-    window = MainWindow()
+    # --no-lazy: build every row before the first paint (legacy behaviour)
+    window = MainWindow(lazy_rows=not args.no_lazy)
     window.show()
+
+    # v2.3: Local control API for later launches and scripts (see core/ipc.py)
+    from core.ipc import ControlServer
+    window.control_server = ControlServer(window, parent=window)
+    window.control_server.listen()
     
     sys.exit(app.exec())
 
@@ -6,10 +6,12 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('assets', 'assets'), ('ui/styles', 'ui/styles')],
-    hiddenimports=['PySide6.QtCore', 'PySide6.QtWidgets', 'PySide6.QtGui', 'qtawesome'],
+    hiddenimports=['PySide6.QtCore', 'PySide6.QtWidgets', 'PySide6.QtGui', 'PySide6.QtNetwork', 'qtawesome'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
+    # numpy stays out on purpose: pixel triggers sample at most a 16x16 grid and fall back to
+    # pure Python (core/pixel_trigger.py), which is not worth ~30MB and a slower onefile start
     excludes=['pandas', 'numpy', 'PIL', 'cv2', 'pyautogui', 'pyscreeze', 'PyQt5', 'win32com', 'tkinter'],
     noarchive=False,
     optimize=0,
@@ -0,0 +1,68 @@
+import random
+
+from core.conflicts import ConflictIndex
+
+
+def overlap(a, b):
+    return a[0] < b[1] and b[0] < a[1]
+
+
+def expected_conflicts(windows):
+    live = {k: w for k, w in windows.items() if w is not None}
+    return {k for k, w in live.items() if any(j != k and overlap(w, v) for j, v in live.items())}
+
+
+def check(index, windows):
+    assert set(index.conflicts) == expected_conflicts(windows)
+    for key, partner in index.conflicts.items():
+        assert overlap(index.windows[key], index.windows[partner])
+
+
+def random_window(rng):
+    start = rng.uniform(0, 600)
+    return start, start + rng.choice((0.02, 0.5, 3.0, rng.uniform(0, 40)))
+
+
+def test_rebuild_flags_overlapping_pairs():
+    index = ConflictIndex()
+    flagged = index.rebuild({1: (0, 5), 2: (4, 6), 3: (6, 7), 4: None, 5: (10, 30), 6: (12, 13)})
+    assert flagged == {1, 2, 5, 6}
+    assert index.delay_seconds(2) == 1
+    assert index.delay_seconds(3) == 0
+    assert len(index) == 5
+
+
+def test_touching_windows_do_not_conflict():
+    index = ConflictIndex()
+    assert index.rebuild({1: (0, 1), 2: (1, 2)}) == set()
+
+
+def test_update_matches_rebuild():
+    rng = random.Random(32)
+    windows = {key: random_window(rng) for key in range(60)}
+    index = ConflictIndex()
+    index.rebuild(windows)
+    check(index, windows)
+    for _ in range(400):
+        key = rng.randrange(70)
+        window = None if rng.random() < 0.15 else random_window(rng)
+        before = dict(index.conflicts)
+        changed = index.update(key, window)
+        windows[key] = window
+        check(index, windows)
+        # Reported changes cover every row whose flag or partner changed
+        for k in set(before) | set(index.conflicts):
+            if before.get(k) != index.conflicts.get(k):
+                assert k in changed
+
+        fresh = ConflictIndex()
+        assert fresh.rebuild(windows) == set(index.conflicts)
+
+
+def test_moving_a_row_away_clears_both_flags():
+    index = ConflictIndex()
+    index.rebuild({"a": (0, 5), "b": (3, 4)})
+    assert index.update("b", (10, 11)) == {"a", "b"}
+    assert index.conflicts == {}
+    assert index.update("b", None) == set()
+    assert len(index) == 1
@@ -0,0 +1,109 @@
+import time
+import threading
+
+import pytest
+
+from core import input_backend
+from core.input_backend import FakeInputBackend, TextInjector, chunk_text, flush_clipboard_restores
+
+RESTORE_DELAY = 0.05
+
+
+@pytest.fixture(autouse=True)
+def short_restore(monkeypatch):
+    monkeypatch.setattr(input_backend, "CLIPBOARD_RESTORE_DELAY", RESTORE_DELAY)
+    yield
+    flush_clipboard_restores()
+
+
+def run_task(backend, text, pastes=2, mode="clipboard", cancel_event=None):
+    injector = TextInjector(backend, mode, cancel_event or threading.Event())
+    assert injector.begin(text)
+    for _ in range(pastes):
+        assert injector.paste()
+    injector.end()
+    return injector
+
+
+def wait_restored():
+    time.sleep(RESTORE_DELAY * 4)
+
+
+def test_clipboard_set_once_and_restored_after_the_delay():
+    backend = FakeInputBackend(clipboard="user text")
+    run_task(backend, "task", pastes=3)
+    assert backend.events[:4] == [("clipboard", "task")] + [("paste", "task")] * 3
+    assert backend.get_clipboard() == "task"  # Ctrl+V may still be pending in the target
+    wait_restored()
+    assert backend.get_clipboard() == "user text"
+
+
+def test_back_to_back_tasks_restore_the_user_text_once():
+    backend = FakeInputBackend(clipboard="user text")
+    run_task(backend, "first")
+    run_task(backend, "second")
+    wait_restored()
+    assert backend.get_clipboard() == "user text"
+    assert [e for e in backend.events if e[0] == "clipboard"] == [
+        ("clipboard", "first"), ("clipboard", "second"), ("clipboard", "user text")]
+
+
+class UnreadableClipboard(FakeInputBackend):
+    """The user's clipboard holds something that is not text (the first read fails)."""
+    def __init__(self):
+        super().__init__(clipboard="<image>")
+        self.reads = 0
+
+    def get_clipboard(self):
+        self.reads += 1
+        return None if self.reads == 1 else super().get_clipboard()
+
+
+@pytest.mark.parametrize("backend_factory", [lambda: FakeInputBackend(clipboard=""), UnreadableClipboard])
+def test_empty_or_non_text_clipboard_is_cleared(backend_factory):
+    backend = backend_factory()
+    run_task(backend, "task")
+    wait_restored()
+    assert backend.events[-1] == ("clipboard", None)
+    assert backend.get_clipboard() == ""
+
+
+def test_cancelled_task_restores_immediately():
+    backend = FakeInputBackend(clipboard="user text")
+    cancel = threading.Event()
+    injector = TextInjector(backend, "clipboard", cancel)
+    injector.begin("task")
+    cancel.set()
+    injector.end()
+    assert backend.get_clipboard() == "user text"
+
+
+def test_flush_runs_pending_restores():
+    backend = FakeInputBackend(clipboard="user text")
+    run_task(backend, "task")
+    flush_clipboard_restores()
+    assert backend.get_clipboard() == "user text"
+
+
+def test_type_mode_never_touches_the_clipboard():
+    backend = FakeInputBackend(clipboard="user text")
+    text = "x" * 70
+    run_task(backend, text, pastes=1, mode="type")
+    assert [e[0] for e in backend.events] == ["type"] * 3
+    assert "".join(e[1] for e in backend.events) == text
+    assert backend.get_clipboard() == "user text"
+
+
+def test_clipboard_readiness_is_polled():
+    backend = FakeInputBackend(clipboard="user text", clipboard_delay=0.03)
+    injector = run_task(backend, "task", pastes=1)
+    assert backend.events[1] == ("paste", "task")
+    assert len(injector.latencies_ms) == 1
+
+
+def test_chunk_text_keeps_surrogate_pairs():
+    text = "a😀" * 20
+    chunks = chunk_text(text, 7)
+    assert "".join(chunks) == text
+    assert all(len(c) <= 7 for c in chunks)
+    assert chunk_text("") == [""]
@@ -0,0 +1,98 @@
+import gc
+import time
+import threading
+
+import pytest
+
+from core.critical_window import CriticalGuard
+from core.input_executor import InputExecutor
+
+
+@pytest.fixture
+def executor():
+    ex = InputExecutor()
+    ex.start()
+    yield ex
+    ex.stop()
+
+
+def test_groups_run_in_deadline_then_row_order(executor):
+    ran = []
+    deadline = time.time() + 0.3
+    jobs = [executor.submit(deadline + offset, timer_no, lambda n=timer_no: ran.append(n) or True)
+            for offset, timer_no in ((0.05, 1), (0.0, 3), (0.0, 2))]
+    for job in jobs:
+        assert job.done.wait(2)
+    assert ran == [2, 3, 1]
+    assert all(job.result for job in jobs)
+    assert jobs[1].started >= deadline
+
+
+def test_failing_group_reports_its_error_and_the_next_one_runs(executor):
+    def boom():
+        raise RuntimeError("backend gone")
+    deadline = time.time() + 0.1
+    failed = executor.submit(deadline, 1, boom)
+    ok = executor.submit(deadline, 2, lambda: True)
+    assert failed.done.wait(2) and ok.done.wait(2)
+    assert failed.result is False and str(failed.error) == "backend gone"
+    assert ok.result is True and ok.error is None
+
+
+def test_stop_drops_pending_groups_and_releases_their_plans():
+    executor = InputExecutor(pre_arm=0.05)
+    executor.start()
+    released = threading.Event()
+
+    class Plan:
+        def release(self):
+            released.set()
+
+    job = executor.submit(time.time() + 0.3, 1, lambda plan: True, prepare=Plan)
+    time.sleep(0.28)  # Prepared, waiting for its deadline
+    executor.stop()
+    assert job.done.wait(2)
+    assert job.result is False
+    assert released.wait(1)
+
+
+def test_guard_opens_at_the_window_after_pre_arm():
+    guard = CriticalGuard(0.1)
+    executor = InputExecutor(pre_arm=0.2, guard=guard)
+    executor.start()
+    seen = {}
+    deadline = time.time() + 0.5
+
+    def prepare():
+        seen["prepared"] = time.time() - deadline
+        seen["gc_at_prepare"] = gc.isenabled()
+
+    def action(plan):
+        seen["state"] = guard.state()
+        return True
+
+    try:
+        job = executor.submit(deadline, 1, action, prepare=prepare)
+        assert job.done.wait(2)
+    finally:
+        executor.stop()
+    assert job.result
+    assert seen["prepared"] == pytest.approx(-0.2, abs=0.05)
+    assert seen["gc_at_prepare"] is gc.isenabled()  # Not yet inside the window
+    assert "window" in seen["state"]
+
+
+def test_gc_pause_is_capped_within_a_long_group(monkeypatch):
+    from core import critical_window
+    monkeypatch.setattr(critical_window, "GC_HOLD_AFTER", 0.05)
+    if not gc.isenabled():
+        pytest.skip("GC disabled by the test runner")
+    guard = CriticalGuard(0.05, boost=False)
+    guard.enter()
+    try:
+        assert not gc.isenabled()
+        time.sleep(0.3)  # A burst running well past its deadline
+        assert gc.isenabled()
+    finally:
+        guard.exit()
+    assert gc.isenabled()
@@ -0,0 +1,81 @@
+import time
+import datetime
+
+from core.journal import Journal, replay, discard, FSYNC_INTERVAL
+
+
+def task(timer_no, deadline):
+    return {"timer_no": timer_no, "scheduled_time": deadline}
+
+
+ROWS = [{"x": "1"}, {"x": "2"}, {"x": "3"}]
+BASE = datetime.datetime(2026, 3, 2, 9, 0)
+
+
+def armed_journal(path):
+    journal = Journal(str(path))
+    journal.begin(ROWS, [task(n, BASE + datetime.timedelta(minutes=n)) for n in (1, 2, 3)])
+    return journal
+
+
+def test_clean_end_leaves_nothing_to_recover(tmp_path):
+    path = tmp_path / "session.journal"
+    journal = armed_journal(path)
+    journal.record("fire", 1)
+    journal.end()
+    assert not journal.active
+    assert replay(str(path)) is None
+
+
+def test_unfinished_session_is_replayed(tmp_path):
+    path = tmp_path / "session.journal"
+    journal = armed_journal(path)
+    journal.record("fire", 1)
+    journal.record("done", 2)
+    journal.record("fire", 3)
+    journal.record("arm", 3, BASE + datetime.timedelta(hours=1))
+    # Simulated crash: no end(); wait for the writer thread's batch to reach the file
+    expected = {1: "fired", 3: "armed"}
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline:
+        recovery = replay(str(path))
+        if recovery and {k: v[0] for k, v in recovery.states.items()} == expected:
+            break
+        time.sleep(FSYNC_INTERVAL / 4)
+    journal._file.close()
+
+    recovery = replay(str(path))
+    assert recovery.rows == ROWS
+    assert recovery.states == {
+        1: ("fired", (BASE + datetime.timedelta(minutes=1)).timestamp()),
+        3: ("armed", (BASE + datetime.timedelta(hours=1)).timestamp()),
+    }
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    path = tmp_path / "session.journal"
+    journal = armed_journal(path)
+    journal._file.close()
+    with open(path, "ab") as f:
+        f.write(b'["done",1]\n["cancel",2]\n["do')  # Crash mid-write
+    recovery = replay(str(path))
+    assert set(recovery.states) == {3}
+
+
+def test_torn_line_stops_the_replay(tmp_path):
+    path = tmp_path / "session.journal"
+    journal = armed_journal(path)
+    journal._file.close()
+    with open(path, "ab") as f:
+        f.write(b'["done",1\n["done",2]\n')
+    assert set(replay(str(path)).states) == {1, 2, 3}
+
+
+def test_missing_or_empty_journal(tmp_path):
+    assert replay(str(tmp_path / "absent.journal")) is None
+    path = tmp_path / "session.journal"
+    path.write_bytes(b"")
+    assert replay(str(path)) is None
+    discard(str(path))
+    assert not path.exists()
+    discard(str(path))  # Already gone: no error
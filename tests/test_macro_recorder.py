@@ -0,0 +1,72 @@
+from core.macro import parse_steps
+from core.macro_recorder import (InputEvent, FakeEventSource, MacroRecorder, timed_actions, actions_to_steps,
+                                 trim_own_window, recording_to_rows, recording_to_steps)
+
+VK_A = 0x41
+VK_CONTROL = 0x11
+
+WINDOW = (800, 0, 1200, 400)  # Flow Track's frame: x0, y0, x1, y1
+
+
+def inside(x, y):
+    return WINDOW[0] <= x < WINDOW[2] and WINDOW[1] <= y < WINDOW[3]
+
+
+def record(events):
+    recorder = MacroRecorder(FakeEventSource(events))
+    recorder.start()
+    return recorder.stop()
+
+
+def test_recorder_collects_source_events():
+    events = [InputEvent("move", 0.0, 1, 1), InputEvent("click", 0.1, 1, 1)]
+    assert record(events) == events
+
+
+def test_dclick_wait_counts_from_the_second_click():
+    events = [InputEvent("click", 1.0, 10, 10), InputEvent("click", 1.3, 11, 10),
+              InputEvent("click", 2.3, 300, 300)]
+    actions, dropped = timed_actions(events, keep_moves=False)
+    assert [(op, t, end) for t, op, _, end in actions] == [("dclick", 1.0, 1.3), ("click", 2.3, 2.3)]
+    assert dropped == 1
+    assert actions_to_steps(actions) == [("dclick", (10, 10)), ("wait", 1000), ("click", (300, 300))]
+
+
+def test_text_and_chords():
+    events = [InputEvent("click", 0.0, 5, 5), InputEvent("key_down", 0.5, vk=VK_A, char="h"),
+              InputEvent("key_down", 0.6, vk=VK_A, char="i"), InputEvent("key_down", 1.0, vk=VK_CONTROL),
+              InputEvent("key_down", 1.1, vk=VK_A, char="a"), InputEvent("key_up", 1.2, vk=VK_CONTROL)]
+    actions, _ = timed_actions(events)
+    assert [(op, args) for _, op, args, _ in actions] == [("click", (5, 5)), ("type", "hi"), ("keys", "ctrl+a")]
+    rows = recording_to_rows(events, 9 * 3600 * 1000)
+    assert len(rows) == 1 and rows[0]["paste_text"] == "hi"
+
+
+def test_trailing_trip_to_the_stop_button_is_trimmed():
+    events = [InputEvent("click", 0.0, 100, 100),
+              InputEvent("key_down", 0.2, vk=VK_A, char="x"),
+              InputEvent("move", 0.5, 400, 200), InputEvent("move", 0.6, 700, 200),
+              InputEvent("move", 0.7, 850, 100), InputEvent("key_down", 0.75, vk=VK_A, char="y"),
+              InputEvent("move", 0.8, 900, 50), InputEvent("click", 0.9, 900, 50)]
+    kept = trim_own_window(events, inside)
+    assert [(e.kind, e.t) for e in kept] == [("click", 0.0), ("key_down", 0.2)]
+
+
+def test_clicks_inside_the_window_are_dropped_anywhere():
+    events = [InputEvent("click", 0.0, 900, 10), InputEvent("click", 0.5, 100, 100),
+              InputEvent("move", 0.6, 150, 150)]
+    kept = trim_own_window(events, inside)
+    assert [(e.kind, e.x) for e in kept] == [("click", 100), ("move", 150)]
+
+
+def test_recording_ending_outside_is_kept():
+    events = [InputEvent("move", 0.0, 900, 10), InputEvent("move", 0.1, 100, 100),
+              InputEvent("click", 0.2, 100, 100)]
+    assert trim_own_window(events, inside) == events
+
+
+def test_steps_line_round_trips():
+    events = [InputEvent("click", 0.0, 10, 10), InputEvent("click", 0.8, 20, 20)]
+    line = recording_to_steps(events)
+    assert line == "click 10 10; wait 800; click 20 20"
+    assert parse_steps(line) == [("click", (10, 10)), ("wait", 800), ("click", (20, 20))]
@@ -0,0 +1,97 @@
+import threading
+
+import pytest
+
+from core.pixel_trigger import (Trigger, Frame, FakeFrameSource, average_hash, mean_color,
+                                normalize_trigger, wait_for_trigger)
+
+REGION = (100, 200, 40, 20)
+
+
+def uniform(color, w=40, h=20):
+    return FakeFrameSource(color).grab(0, 0, w, h)
+
+
+def split_frame(left, right, w=40, h=20):
+    rows = []
+    for _ in range(h):
+        for x in range(w):
+            r, g, b = left if x < w // 2 else right
+            rows.append(bytes((b, g, r, 255)))
+    return Frame(w, h, b"".join(rows))
+
+
+@pytest.mark.parametrize("text", [
+    "until 100,200,40,20 #00c853",
+    "until 100,200,40,20 hash:8f0c000000000001 tol 4",
+    "while 100,200,40,20 #ffffff timeout 30",
+    "while 100,200,40,20",
+])
+def test_round_trip(text):
+    assert str(Trigger.parse(text)) == text
+
+
+@pytest.mark.parametrize("text", ["until 1,2,3,4", "until 1,2,0,4 #000000", "when 1,2,3,4 #000000"])
+def test_parse_rejects(text):
+    with pytest.raises(ValueError):
+        Trigger.parse(text)
+
+
+def test_normalize():
+    assert normalize_trigger("  UNTIL 100, 200, 40, 20   #00C853 ") == "until 100,200,40,20 #00c853"
+    assert normalize_trigger("") == ""
+
+
+def test_mean_color_and_hash():
+    assert mean_color(uniform((10, 20, 30))) == pytest.approx((10, 20, 30), abs=1)
+    assert average_hash(uniform((10, 20, 30))) == 0
+    assert average_hash(split_frame((0, 0, 0), (255, 255, 255))) != 0
+
+
+def test_until_color_within_tolerance():
+    trigger = Trigger.parse("until 100,200,40,20 #00c853")
+    assert trigger.satisfied(uniform((0, 200, 83)))
+    assert trigger.satisfied(uniform((10, 190, 90)))
+    assert not trigger.satisfied(uniform((255, 255, 255)))
+
+
+@pytest.mark.parametrize("before, after", [((0, 0, 0), (255, 255, 255)), ((40, 40, 40), (40, 90, 40))])
+def test_while_without_reference_fires_when_a_uniform_region_changes(before, after):
+    armed = Trigger.parse("while 100,200,40,20").armed(uniform(before))
+    assert not armed.satisfied(uniform(before))
+    assert armed.satisfied(uniform(after))
+
+
+def test_while_without_reference_fires_when_the_pattern_changes():
+    armed = Trigger.parse("while 100,200,40,20").armed(split_frame((0, 0, 0), (255, 255, 255)))
+    assert not armed.satisfied(split_frame((0, 0, 0), (255, 255, 255)))
+    assert armed.satisfied(split_frame((255, 255, 255), (0, 0, 0)))
+
+
+def test_wait_fires_once_the_region_changes():
+    source = FakeFrameSource((0, 0, 0))
+    trigger = Trigger.parse("while 100,200,40,20 timeout 5")
+    timer = threading.Timer(0.1, lambda: setattr(source, "color", (255, 255, 255)))
+    timer.start()
+    try:
+        result = wait_for_trigger(trigger, source, threading.Event())
+    finally:
+        timer.cancel()
+    assert result.fired and not result.cancelled
+    assert 0.05 < result.elapsed < 2
+
+
+def test_wait_times_out_and_respects_the_rate_cap():
+    source = FakeFrameSource((0, 0, 0))
+    result = wait_for_trigger(Trigger.parse("until 100,200,40,20 #ffffff timeout 0.3"), source,
+                              threading.Event(), max_hz=20)
+    assert not result.fired and not result.cancelled
+    assert result.polls == source.grabs <= 0.3 * 20 + 2
+
+
+def test_wait_cancelled():
+    cancel = threading.Event()
+    cancel.set()
+    result = wait_for_trigger(Trigger.parse("until 100,200,40,20 #ffffff"), FakeFrameSource(), cancel)
+    assert result.cancelled and not result.fired
+    assert result.polls == 1
@@ -0,0 +1,73 @@
+import datetime
+
+import pytest
+
+from core.recurrence import Recurrence
+
+
+def dt(*args):
+    return datetime.datetime(*args)
+
+
+@pytest.mark.parametrize("text, kind, seconds, canonical", [
+    ("every 30s", "every", 30, "every 30s"),
+    ("every 90", "every", 90, "every 90s"),
+    ("EVERY 5m", "every", 300, "every 5m"),
+    ("120m", "every", 7200, "every 2h"),
+    ("daily", "daily", 0, "daily"),
+    (" weekdays ", "weekdays", 0, "weekdays"),
+])
+def test_parse(text, kind, seconds, canonical):
+    rule = Recurrence.parse(text)
+    assert (rule.kind, rule.period_seconds, str(rule)) == (kind, seconds, canonical)
+
+
+@pytest.mark.parametrize("text", ["", "once", None])
+def test_one_shot(text):
+    assert Recurrence.parse(text) is None
+
+
+@pytest.mark.parametrize("text", ["every 0s", "hourly", "every -5m", "every 5d"])
+def test_parse_rejects(text):
+    with pytest.raises(ValueError):
+        Recurrence.parse(text)
+
+
+def test_every_after_multi_day_gap_stays_on_the_grid():
+    rule = Recurrence.parse("every 7m")
+    anchor = dt(2026, 3, 2, 9, 0, 0)
+    now = dt(2026, 3, 5, 17, 31, 12)
+    first = rule.first_at_or_after(anchor, now)
+    assert first >= now
+    assert first - now < datetime.timedelta(minutes=7)
+    assert (first - anchor).total_seconds() % 420 == 0
+
+
+def test_every_anchor_in_the_future_is_kept():
+    rule = Recurrence.parse("every 5m")
+    anchor = dt(2026, 3, 2, 9, 0)
+    assert rule.first_at_or_after(anchor, dt(2026, 3, 2, 8, 0)) == anchor
+    assert rule.first_at_or_after(anchor, anchor) == anchor
+
+
+def test_daily_after_multi_day_gap_keeps_the_time_of_day():
+    rule = Recurrence.parse("daily")
+    first = rule.first_at_or_after(dt(2026, 3, 2, 9, 30), dt(2026, 3, 6, 10, 0))
+    assert first == dt(2026, 3, 7, 9, 30)
+    assert rule.first_at_or_after(dt(2026, 3, 2, 9, 30), dt(2026, 3, 6, 9, 0)) == dt(2026, 3, 6, 9, 30)
+
+
+def test_weekdays_after_gap_into_a_weekend_lands_on_monday():
+    rule = Recurrence.parse("weekdays")
+    # 2026-03-06 is a Friday; the gap ends on Saturday afternoon
+    first = rule.first_at_or_after(dt(2026, 2, 23, 8, 0), dt(2026, 3, 7, 15, 0))
+    assert first == dt(2026, 3, 9, 8, 0)
+    assert first.weekday() == 0
+
+
+def test_next_after_skips_occurrences_missed_while_asleep():
+    rule = Recurrence.parse("every 10m")
+    previous = dt(2026, 3, 2, 9, 0)
+    assert rule.next_after(previous) == dt(2026, 3, 2, 9, 10)
+    assert rule.next_after(previous, dt(2026, 3, 4, 11, 3)) == dt(2026, 3, 4, 11, 10)
+    assert Recurrence.parse("weekdays").next_after(dt(2026, 3, 6, 8, 0)) == dt(2026, 3, 9, 8, 0)
@@ -0,0 +1,39 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+from core.reference_clock import LocalSntpServer, SntpSource, parse_server  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    srv = LocalSntpServer(offset=2.5).start()
+    yield srv
+    srv.stop()
+
+
+def test_sample_measures_the_server_offset(server):
+    host, port = server.address
+    offset, round_trip = SntpSource(host, port).sample()
+    assert offset == pytest.approx(2.5, abs=0.05)
+    assert 0.0 <= round_trip < 0.5
+
+
+def test_server_delay_is_not_counted_as_offset():
+    srv = LocalSntpServer(offset=-1.0, delay=0.05).start()
+    try:
+        offset, round_trip = SntpSource(*srv.address).sample()
+    finally:
+        srv.stop()
+    # The delay sits between the receive and transmit stamps: it is not network round-trip
+    assert offset == pytest.approx(-1.0, abs=0.05)
+    assert round_trip < 0.05
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("pool.ntp.org", ("pool.ntp.org", 123)),
+    ("127.0.0.1:1123", ("127.0.0.1", 1123)),
+    (" time.example ", ("time.example", 123)),
+])
+def test_parse_server(text, expected):
+    assert parse_server(text) == expected
@@ -0,0 +1,58 @@
+import datetime
+
+from core.late_policy import LatePolicy
+from core.schedule import resume_tasks
+
+NOW = datetime.datetime(2026, 3, 4, 12, 0, 0)
+ROW = dict(enabled=True, show_desktop=False, x="10", y="20", clicks="1", interval="1", paste_text="")
+
+
+class Config:
+    def get_message(self, key, **kwargs):
+        return key
+
+
+def at(**delta):
+    return (NOW + datetime.timedelta(**delta)).timestamp()
+
+
+def resume(rows, states):
+    logs = []
+    tasks = {task["timer_no"]: task for task in resume_tasks(rows, states, Config(), logs.append, now=NOW)}
+    return tasks, logs
+
+
+def test_pending_rows_come_back_at_their_deadlines():
+    tasks, logs = resume([ROW, ROW], {1: ("armed", at(minutes=5)), 2: ("armed", at(minutes=9))})
+    assert tasks[1]["scheduled_time"] == NOW + datetime.timedelta(minutes=5)
+    assert "late" not in tasks[1]
+    assert tasks[2]["is_last"] and not tasks[1]["is_last"]
+    assert logs == []
+
+
+def test_one_shot_row_interrupted_mid_action_is_not_repeated():
+    tasks, logs = resume([ROW], {1: ("fired", at(seconds=-2))})
+    assert tasks == {}
+    assert logs == ["log_journal_interrupted"]
+
+
+def test_overdue_one_shot_rows_are_skipped_unless_they_have_a_policy():
+    rows = [ROW, dict(ROW, late="fire 60")]
+    tasks, _ = resume(rows, {1: ("armed", at(hours=-3)), 2: ("armed", at(hours=-3))})
+    assert str(tasks[1]["late"]) == str(LatePolicy("skip"))
+    assert str(tasks[2]["late"]) == "fire 60"
+
+
+def test_overdue_recurring_row_moves_to_its_next_occurrence():
+    rows = [dict(ROW, repeat="every 7m"), dict(ROW, repeat="daily")]
+    tasks, logs = resume(rows, {1: ("armed", at(days=-2, minutes=-3)), 2: ("fired", at(days=-1))})
+    first = tasks[1]["scheduled_time"]
+    assert NOW <= first < NOW + datetime.timedelta(minutes=7)
+    assert tasks[2]["scheduled_time"] == NOW  # The occurrence after the interrupted one
+    assert "late" not in tasks[1]
+    assert logs == ["log_journal_missed"]
+
+
+def test_rows_outside_the_table_are_ignored():
+    tasks, _ = resume([ROW], {5: ("armed", at(minutes=1))})
+    assert tasks == {}
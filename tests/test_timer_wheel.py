@@ -0,0 +1,86 @@
+import random
+
+from core.timer_wheel import TimerWheel
+
+TICK = 10
+
+
+def drain(wheel, limit=100000):
+    """Advance from wakeup to wakeup until empty: [(now_ms, payload)] in firing order."""
+    fired = []
+    for _ in range(limit):
+        wake = wheel.next_wakeup_ms()
+        if wake is None:
+            return fired
+        fired.extend((wake, entry.payload) for entry in wheel.advance(wake))
+    raise AssertionError("wheel never emptied")
+
+
+def test_fires_in_deadline_order_across_levels():
+    wheel = TimerWheel(0, tick_ms=TICK)
+    rng = random.Random(7)
+    # Level 0 spans 640ms, level 1 ~41s, level 2 ~44min, level 3 ~47h; the rest overflows
+    deadlines = [rng.randrange(10, span) for span in (640, 40_000, 2_600_000, 160_000_000, 400_000_000)
+                 for _ in range(40)]
+    for deadline in deadlines:
+        wheel.insert(deadline, deadline)
+    assert len(wheel) == len(deadlines)
+
+    fired = drain(wheel)
+    payloads = [payload for _, payload in fired]
+    assert sorted(payloads) == sorted(deadlines)
+    assert [p // TICK for p in payloads] == sorted(p // TICK for p in payloads)
+    for now, payload in fired:
+        # Never early, and never later than the tick after its own
+        assert payload // TICK <= now // TICK <= payload // TICK + 1
+    assert len(wheel) == 0
+
+
+def test_next_wakeup_never_overshoots_the_earliest_deadline():
+    wheel = TimerWheel(0, tick_ms=TICK)
+    for deadline in (90_000, 5_000_000, 700):
+        wheel.insert(deadline, deadline)
+    pending = {90_000, 5_000_000, 700}
+    while pending:
+        wake = wheel.next_wakeup_ms()
+        assert wake is not None and wake <= min(pending) // TICK * TICK + TICK
+        for entry in wheel.advance(wake):
+            pending.discard(entry.payload)
+    assert wheel.next_wakeup_ms() is None
+
+
+def test_idle_rotations_are_skipped():
+    wheel = TimerWheel(0, tick_ms=TICK)
+    wheel.insert(3_600_000, "hour")
+    wakeups = 0
+    while wheel.next_wakeup_ms() is not None:
+        wheel.advance(wheel.next_wakeup_ms())
+        wakeups += 1
+    # One wakeup per cascade level, not one per idle level-0 rotation
+    assert wakeups <= wheel.levels + 1
+
+
+def test_catch_up_after_a_long_sleep_returns_everything_due():
+    wheel = TimerWheel(1_000, tick_ms=TICK)
+    for deadline in (1_500, 50_000, 9_000_000):
+        wheel.insert(deadline, deadline)
+    expired = wheel.advance(10_000_000)
+    assert sorted(entry.payload for entry in expired) == [1_500, 50_000, 9_000_000]
+
+
+def test_cancelled_and_overdue_entries():
+    wheel = TimerWheel(5_000, tick_ms=TICK)
+    dropped = wheel.insert(80_000, "dropped")
+    wheel.insert(1_000, "overdue")
+    wheel.insert(80_000, "kept")
+    dropped.cancel()
+    # Already due on insert: fires on the next tick
+    assert [e.payload for e in wheel.advance(5_000 + TICK)] == ["overdue"]
+    assert [payload for _, payload in drain(wheel)] == ["kept"]
+
+
+def test_fractional_start_and_now():
+    wheel = TimerWheel(1234.5678, tick_ms=TICK)
+    wheel.insert(1500.25, "a")
+    assert isinstance(wheel.current_tick, int)
+    assert [e.payload for e in wheel.advance(1510.9)] == ["a"]
@@ -10,13 +10,16 @@ class NotesEditorDialog(QDialog):
     """
     Modal dialog for editing long notes.
     Redesigned (v16.0) with Elevated Card & Action Buttons.
+    v2.3: Also edits macro steps; `validator(text)` returns the text to keep or raises ValueError.
     """
-    def __init__(self, current_text, config, parent=None):
+    def __init__(self, current_text, config, parent=None, title_key="title_edit_note",
+                 placeholder_key="placeholder_notes", validator=None):
         super().__init__(parent)
         self.config = config
         self.result_text = current_text
+        self.validator = validator
         
-        self.setWindowTitle(self.config.get_message("title_edit_note"))
+        self.setWindowTitle(self.config.get_message(title_key))
         self.setFixedSize(520, 380) # Increased slightly for shadow margin
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
         self.setObjectName("NotesEditorDialog")
@@ -48,7 +51,7 @@ class NotesEditorDialog(QDialog):
         self.editor = QTextEdit()
         self.editor.setObjectName("NotesEditorField")
         self.editor.setPlainText(current_text)
-        self.editor.setPlaceholderText(self.config.get_message("placeholder_notes") + "...")
+        self.editor.setPlaceholderText(self.config.get_message(placeholder_key) + "...")
         card_layout.addWidget(self.editor)
         
         layout.addWidget(self.card_frame)
@@ -75,7 +78,14 @@ class NotesEditorDialog(QDialog):
         layout.addLayout(btn_layout)
 
     def save(self):
-        self.result_text = self.editor.toPlainText()
+        text = self.editor.toPlainText()
+        if self.validator:
+            try:
+                text = self.validator(text)
+            except ValueError as e:
+                QMessageBox.warning(self, self.windowTitle(), str(e))
+                return
+        self.result_text = text
         self.accept()
 
     def get_text(self):
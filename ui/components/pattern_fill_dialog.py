@@ -0,0 +1,116 @@
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
+                             QPushButton, QLabel, QSpinBox, QComboBox, QFrame)
+from PySide6.QtCore import Qt
+
+from core.pattern_fill import STEP_UNITS_MS, time_to_ms
+
+
+class PatternFillDialog(QDialog):
+    """
+    Pattern fill editor (v2.3).
+    Generates `count` rows from the source row's settings, starting at a given time
+    and spaced by a fixed step. Values are read back via get_params().
+    """
+    def __init__(self, source_values, config, parent=None):
+        super().__init__(parent)
+        self.config = config
+
+        self.setWindowTitle(self.config.get_message("title_pattern_fill"))
+        self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
+        self.setObjectName("PatternFillDialog")
+
+        from ui.styles.theme_config import ThemeManager
+        tm = ThemeManager()
+        ThemeManager.set_title_bar_theme(self.winId(), tm.current_theme == "Dark")
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(20)
+
+        self.card_frame = QFrame()
+        self.card_frame.setObjectName("NotesEditorCard")  # Reuse the raised editor card style
+        grid = QGridLayout(self.card_frame)
+        grid.setContentsMargins(15, 15, 15, 15)
+        grid.setHorizontalSpacing(10)
+        grid.setVerticalSpacing(8)
+
+        # 1. Start time (defaults to one second after the source row)
+        t_str = source_values.get("time", "000000")
+        start = time_to_ms(t_str, source_values.get("time_ms", 0)) + 1000
+        start_s, start_ms = divmod(start % 86400000, 1000)
+        self.spin_h = self._spin(0, 23, start_s // 3600)
+        self.spin_m = self._spin(0, 59, start_s // 60 % 60)
+        self.spin_s = self._spin(0, 59, start_s % 60)
+        self.spin_ms = self._spin(0, 999, start_ms)
+        self._start_day = source_values.get("day_offset", 0) + start // 86400000
+        time_row = QHBoxLayout()
+        time_row.setSpacing(4)
+        for w in (self.spin_h, self.spin_m, self.spin_s, self.spin_ms):
+            time_row.addWidget(w)
+        grid.addWidget(QLabel(self.config.get_message("label_fill_start")), 0, 0)
+        grid.addLayout(time_row, 0, 1)
+
+        # 2. Step + unit
+        self.spin_step = self._spin(1, 3600000, 1)
+        self.combo_unit = QComboBox()
+        self.combo_unit.addItems(list(STEP_UNITS_MS))
+        self.combo_unit.setCurrentText("s")
+        step_row = QHBoxLayout()
+        step_row.addWidget(self.spin_step)
+        step_row.addWidget(self.combo_unit)
+        grid.addWidget(QLabel(self.config.get_message("label_fill_step")), 1, 0)
+        grid.addLayout(step_row, 1, 1)
+
+        # 3. Row count (no longer capped by the 1-10 copy range)
+        self.spin_count = self._spin(1, 100000, self.config.copy_range)
+        grid.addWidget(QLabel(self.config.get_message("label_fill_count")), 2, 0)
+        grid.addWidget(self.spin_count, 2, 1)
+
+        # 4. Coordinate template increments
+        self.spin_dx = self._spin(-9999, 9999, 0)
+        self.spin_dy = self._spin(-9999, 9999, 0)
+        delta_row = QHBoxLayout()
+        delta_row.addWidget(self.spin_dx)
+        delta_row.addWidget(self.spin_dy)
+        grid.addWidget(QLabel(self.config.get_message("label_fill_delta")), 3, 0)
+        grid.addLayout(delta_row, 3, 1)
+
+        layout.addWidget(self.card_frame)
+
+        # 5. Action Buttons (Reusing ActionButton styles)
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+
+        self.btn_cancel = QPushButton(self.config.get_message("btn_cancel"))
+        self.btn_cancel.setObjectName("ActionButton")
+        self.btn_cancel.setProperty("type", "cancel")
+        self.btn_cancel.setFixedSize(120, 42)
+        self.btn_cancel.clicked.connect(self.reject)
+
+        self.btn_fill = QPushButton(self.config.get_message("btn_fill"))
+        self.btn_fill.setObjectName("ActionButton")
+        self.btn_fill.setProperty("type", "start")
+        self.btn_fill.setFixedSize(120, 42)
+        self.btn_fill.clicked.connect(self.accept)
+
+        btn_layout.addWidget(self.btn_cancel)
+        btn_layout.addWidget(self.btn_fill)
+        layout.addLayout(btn_layout)
+
+    def _spin(self, lo, hi, value):
+        spin = QSpinBox()
+        spin.setRange(lo, hi)
+        spin.setValue(value)
+        spin.setAlignment(Qt.AlignCenter)
+        return spin
+
+    def get_params(self):
+        t_str = f"{self.spin_h.value():02d}{self.spin_m.value():02d}{self.spin_s.value():02d}"
+        return {
+            "start_ms": time_to_ms(t_str, self.spin_ms.value(), self._start_day),
+            "step": self.spin_step.value(),
+            "unit": self.combo_unit.currentText(),
+            "count": self.spin_count.value(),
+            "dx": self.spin_dx.value(),
+            "dy": self.spin_dy.value(),
+        }
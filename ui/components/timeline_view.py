@@ -0,0 +1,188 @@
+"""
+Schedule timeline (v2.3): every row as a mark on one custom-painted strip.
+
+Time runs left to right (seconds from today's midnight, see core.timeline). Zoomed
+out, tasks are aggregated into density bins of BIN_PX pixels; once the visible tasks
+fit (MARK_PX apart on average) each one is drawn as its own mark. Every query goes
+through the sorted TimelineIndex, and only the region Qt asks for is painted: a drag
+scrolls the existing pixels and paints just the exposed strip.
+
+Wheel zooms around the cursor, drag pans, double-click jumps to the nearest row.
+"""
+import math
+
+from PySide6.QtWidgets import QWidget
+from PySide6.QtGui import QPainter, QColor, QPen
+from PySide6.QtCore import Qt, Signal, QRectF, QLineF
+
+from core.timeline import TimelineIndex
+from ui.styles.theme_config import ThemeManager
+
+DAY = 86400.0
+# Axis steps in seconds; the first one at least TICK_MIN_PX wide is used
+TICK_STEPS = (1, 2, 5, 10, 15, 30, 60, 120, 300, 600, 900, 1800, 3600, 7200,
+              10800, 21600, 43200, 86400, 172800, 604800)
+
+
+def tick_label(seconds, step):
+    """'08:30', '08:30:15' for sub-minute steps, '+1d 08:30' past today."""
+    day, rest = divmod(int(math.floor(seconds)), int(DAY))
+    h, rem = divmod(rest, 3600)
+    m, s = divmod(rem, 60)
+    text = f"{h:02d}:{m:02d}:{s:02d}" if step < 60 else f"{h:02d}:{m:02d}"
+    return f"{day:+d}d {text}" if day else text
+
+
+class TimelineView(QWidget):
+    row_activated = Signal(int)  # 1-based row number
+
+    BIN_PX = 2
+    MARK_PX = 3
+    AXIS_HEIGHT = 18
+    TICK_MIN_PX = 80
+    PICK_PX = 6
+    MIN_SPAN = 10.0
+    MAX_SPAN = 14 * DAY
+    ZOOM_STEP = 0.8  # Span factor per wheel notch
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.theme_manager = ThemeManager()
+        self.index = TimelineIndex()
+        self.t0 = 0.0
+        self.span = DAY  # Seconds across the full width
+        self._fitted = False
+        self._peak = 1  # Largest bin of the last full paint; strips reuse it so heights match
+        self._drag_x = None
+        self.setAttribute(Qt.WA_OpaquePaintEvent)  # Every exposed pixel is painted below
+        self.setMinimumHeight(72)
+        self.setCursor(Qt.OpenHandCursor)
+
+    def set_index(self, index):
+        """Show a rebuilt index; the view is kept, except the first time (fit to the tasks)."""
+        self.index = index
+        if not self._fitted and len(index):
+            self.fit()
+        self.update()
+
+    def fit(self):
+        first, last = self.index.extent() or (0.0, DAY)
+        margin = max((last - first) * 0.05, self.MIN_SPAN / 2)
+        self.t0 = first - margin
+        self.span = min(self.MAX_SPAN, max(self.MIN_SPAN, last - first + 2 * margin))
+        self._fitted = True
+        self.update()
+
+    def seconds_per_px(self):
+        return self.span / max(1, self.width())
+
+    # --- Painting ---
+
+    def paintEvent(self, event):
+        rect = event.rect()
+        painter = QPainter(self)
+        color = self.theme_manager.get_color
+        painter.fillRect(rect, QColor(color("BG_ITEM")))
+        spp = self.seconds_per_px()
+        x0, x1 = rect.left(), rect.right() + 1
+        t_a, t_b = self.t0 + x0 * spp, self.t0 + x1 * spp
+        plot_h = self.height() - self.AXIS_HEIGHT
+
+        # Level of detail is decided for the whole view, so a repainted strip matches the rest
+        lo, hi = self.index.span(self.t0, self.t0 + self.span)
+        if (hi - lo) * self.MARK_PX > self.width():
+            self._paint_bins(painter, t_a, t_b, spp, plot_h, rect.width() >= self.width(), color)
+        else:
+            lo, hi = self.index.span(t_a - spp, t_b + spp)
+            self._paint_marks(painter, lo, hi, spp, plot_h, color)
+        self._paint_axis(painter, t_a, t_b, spp, plot_h, color)
+        painter.end()
+
+    def _paint_bins(self, painter, t_a, t_b, spp, plot_h, full, color):
+        # Bins are anchored to absolute time so a strip painted after a scroll lines up
+        width = self.BIN_PX * spp
+        k0 = math.floor(t_a / width)
+        n = math.ceil(t_b / width) - k0
+        counts = self.index.bins(k0 * width, width, n)
+        if full:
+            self._peak = max(counts) or 1
+        scale = plot_h / self._peak
+        rects = []
+        for k, count in enumerate(counts):
+            if count:
+                h = max(1.0, min(plot_h, count * scale))
+                x = ((k0 + k) * width - self.t0) / spp
+                rects.append(QRectF(x, plot_h - h, self.BIN_PX, h))
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(color("ACCENT_GREEN")))
+        painter.drawRects(rects)
+
+    def _paint_marks(self, painter, lo, hi, spp, plot_h, color):
+        times, enabled = self.index.times, self.index.enabled
+        on, off = [], []
+        top = plot_h * 0.15
+        for i in range(lo, hi):
+            x = (times[i] - self.t0) / spp
+            (on if enabled[i] else off).append(QLineF(x, top, x, plot_h))
+        painter.setPen(QPen(QColor(color("ACCENT_GREEN")), 2))
+        painter.drawLines(on)
+        painter.setPen(QPen(QColor(color("ACCENT_GRAY")), 2))
+        painter.drawLines(off)
+
+    def _paint_axis(self, painter, t_a, t_b, spp, plot_h, color):
+        painter.setPen(QColor(color("INPUT_BORDER")))
+        painter.drawLine(QLineF((t_a - self.t0) / spp - 1, plot_h, (t_b - self.t0) / spp + 1, plot_h))
+        step = next((s for s in TICK_STEPS if s / spp >= self.TICK_MIN_PX), TICK_STEPS[-1])
+        # Labels straddling the painted region's edges are drawn too (clipped by Qt)
+        reach = self.TICK_MIN_PX * spp
+        k = math.floor((t_a - reach) / step)
+        painter.setPen(QColor(color("TEXT_SECONDARY")))
+        font = painter.font()
+        font.setPixelSize(10)
+        painter.setFont(font)
+        while k * step <= t_b + reach:
+            x = (k * step - self.t0) / spp
+            painter.drawLine(QLineF(x, plot_h, x, plot_h + 4))
+            painter.drawText(QRectF(x + 3, plot_h + 2, self.TICK_MIN_PX, self.AXIS_HEIGHT - 2),
+                             Qt.AlignLeft | Qt.AlignVCenter, tick_label(k * step, step))
+            k += 1
+
+    # --- Interaction ---
+
+    def wheelEvent(self, event):
+        notches = event.angleDelta().y() / 120
+        if not notches:
+            return
+        x = event.position().x()
+        anchor = self.t0 + x * self.seconds_per_px()
+        self.span = min(self.MAX_SPAN, max(self.MIN_SPAN, self.span * self.ZOOM_STEP ** notches))
+        self.t0 = anchor - x * self.seconds_per_px()
+        self.update()
+        event.accept()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._drag_x = int(event.position().x())
+            self.setCursor(Qt.ClosedHandCursor)
+
+    def mouseMoveEvent(self, event):
+        if self._drag_x is None:
+            return
+        x = int(event.position().x())
+        dx = x - self._drag_x
+        if dx:
+            self._drag_x = x
+            self.t0 -= dx * self.seconds_per_px()
+            self.scroll(dx, 0)  # Moves the painted pixels; only the exposed strip is repainted
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._drag_x = None
+            self.setCursor(Qt.OpenHandCursor)
+
+    def mouseDoubleClickEvent(self, event):
+        spp = self.seconds_per_px()
+        t = self.t0 + event.position().x() * spp
+        i = self.index.nearest(t)
+        if i is not None and abs(self.index.times[i] - t) <= self.PICK_PX * spp:
+            self.row_activated.emit(self.index.rows[i])
@@ -1,12 +1,30 @@
 from PySide6.QtWidgets import (QWidget, QHBoxLayout, QLineEdit, QPushButton, 
-                             QCheckBox, QTimeEdit, QFrame, QVBoxLayout, QLabel, QSpinBox,
+                             QCheckBox, QTimeEdit, QFrame, QComboBox, QVBoxLayout, QLabel, QSpinBox,
                              QGraphicsDropShadowEffect, QMessageBox, QDialog)
 from PySide6.QtGui import QPainter, QIcon, QColor
 from PySide6.QtCore import Qt, Signal, QEvent, QObject, QPropertyAnimation, QEasingCurve
 import qtawesome as qta
+from functools import lru_cache
 from .notes_editor import NotesEditorDialog
+from core.macro import parse_steps, format_steps, normalize_steps
+from core.pixel_trigger import normalize_trigger
+from core.late_policy import normalize_late_policy
 from ui.styles.theme_config import ThemeManager
 
+@lru_cache(maxsize=None)
+def cached_pixmap(icon_name, color, size):
+    """Render each (icon, color, size) once; QPixmap is implicitly shared between rows (v2.3)."""
+    return qta.icon(icon_name, color=color).pixmap(size, size)
+
+@lru_cache(maxsize=None)
+def cached_solid_icon(icon_name, color, size):
+    """Plan A icon: same pixmap for Normal and Disabled to override Qt's automatic fading."""
+    pix = cached_pixmap(icon_name, color, size)
+    icon = QIcon()
+    icon.addPixmap(pix, QIcon.Normal)
+    icon.addPixmap(pix, QIcon.Disabled)
+    return icon
+
 class WheelIgnoreFilter(QObject):
     """Event filter to ignore wheel events on spinboxes so list scrolling works naturally."""
     def eventFilter(self, obj, event):
@@ -28,6 +46,26 @@ class NotesFocusFilter(QObject):
                 obj.setCursorPosition(0) 
         return super().eventFilter(obj, event)
 
+class LazyTextFilter(QObject):
+    """
+    Resolve per-row tooltips and placeholders from the shared language bundle on demand (v2.3).
+    Tooltips are set when Qt first asks for them; placeholders are refreshed on the first
+    paint after a language switch. change_language therefore does no per-row work.
+    """
+    def __init__(self, card):
+        super().__init__(card)
+        self.card = card
+
+    def eventFilter(self, obj, event):
+        etype = event.type()
+        if etype == QEvent.ToolTip:
+            key = obj.property("i18n_tooltip")
+            if key:
+                obj.setToolTip(self.card.text_bundle()[key])
+        elif etype == QEvent.Paint and obj.property("i18n_placeholder"):
+            self.card.sync_placeholders()
+        return super().eventFilter(obj, event)
+
 class TimerCard(QFrame):
     # Signals for parent communication
     delete_requested = Signal(object)
@@ -35,16 +73,67 @@ class TimerCard(QFrame):
     move_up_requested = Signal(object)
     move_down_requested = Signal(object)
     copy_requested = Signal(object)
+    fill_requested = Signal(object)  # Right-click on the copy button (v2.3)
+    selection_requested = Signal(object, object)  # card, keyboard modifiers (v2.3)
+    values_changed = Signal(object)  # Schedule or execution fields edited (v2.3)
+
+    # Widget attribute -> language key, resolved lazily via LazyTextFilter (v2.3)
+    TOOLTIP_KEYS = {
+        "btn_del": "tooltip_btn_delete_timer",
+        "btn_add": "tooltip_btn_insert_timer",
+        "btn_up": "tooltip_btn_up_timer",
+        "btn_down": "tooltip_btn_down_timer",
+        "chk_enabled": "tooltip_row_enabled",
+        "edit_x": "tooltip_edit_x",
+        "edit_y": "tooltip_edit_y",
+        "spin_h": "tooltip_spin_time",
+        "spin_m": "tooltip_spin_time",
+        "spin_s": "tooltip_spin_time",
+        "btn_copy": "tooltip_btn_copy",
+        "lbl_desktop_icon": "tooltip_show_desktop",
+        "chk_desktop": "tooltip_chk_desktop",
+        "lbl_clicks_icon": "tooltip_clicks_icon",
+        "edit_clicks": "tooltip_clicks_icon",
+        "lbl_interval_icon": "tooltip_interval_icon",
+        "edit_interval": "tooltip_interval_icon",
+        "edit_notes": "tooltip_edit_notes",
+        "btn_notes_edit": "tooltip_btn_notes_edit",
+        "btn_steps": "tooltip_btn_steps",
+        "btn_trigger": "tooltip_btn_trigger",
+        "btn_late": "tooltip_btn_late",
+        "combo_repeat": "tooltip_repeat",
+        "combo_date": "tooltip_date",
+    }
+    PLACEHOLDER_KEYS = {
+        "edit_x": "placeholder_x",
+        "edit_y": "placeholder_y",
+        "edit_notes": "placeholder_notes",
+        "edit_repeat": "placeholder_repeat",
+        "edit_date": "placeholder_date",
+    }
+    BUNDLE_KEYS = tuple(sorted(set(TOOLTIP_KEYS.values()) | set(PLACEHOLDER_KEYS.values())))
 
     def __init__(self, data=None, config=None):
         super().__init__()
         self.config = config # ConfigManager instance
+        self.row_index = -1  # Maintained by MainWindow, avoids list.index() scans
+        self.is_selected = False
+        self._placeholder_bundle = None  # Bundle the placeholders were last taken from
+        # v2.3: Sub-second / next-day parts of the schedule (set by pattern fill)
+        self.time_ms = 0
+        self.day_offset = 0
+        self.steps = ""  # v2.3: Compact macro steps; non-empty replaces the click/paste action
+        self.trigger = ""  # v2.3: Pixel / region wait condition; non-empty gates the fire
+        self.late = ""  # v2.3: Missed-deadline policy; empty follows General/late_policy
+        self.conflict_text = ""  # v2.3: Tooltip of the inline overlap flag; empty = no conflict
         self.theme_manager = ThemeManager()
         self.wheel_filter = WheelIgnoreFilter(self)
         self.init_ui()
         self.setup_effects()
         if data:
-            self.set_values(data)
+            self.set_values(data)  # Also renders the icons via on_desktop_toggled
+        else:
+            self.update_icon_states(can_edit=True, actions_active=True)
 
     def setup_effects(self):
         # 1. Shadow Effect - "Heng Dong" Style: Large Blur, Very Low Opacity
@@ -86,6 +175,20 @@ class TimerCard(QFrame):
         self.style().polish(self)
         super().leaveEvent(event)
 
+    def mousePressEvent(self, event):
+        # Clicks on the card body (not on child inputs) drive multi-row selection (v2.3)
+        if event.button() == Qt.LeftButton:
+            self.selection_requested.emit(self, event.modifiers())
+        super().mousePressEvent(event)
+
+    def set_selected(self, selected):
+        if self.is_selected == selected:
+            return
+        self.is_selected = selected
+        self.setProperty("selected", selected)
+        self.style().unpolish(self)
+        self.style().polish(self)
+
     def init_ui(self):
         self.setObjectName("TimerCard")
         self.setAttribute(Qt.WA_StyledBackground) # Ensure QSS backgrounds render on custom widgets
@@ -101,10 +204,11 @@ class TimerCard(QFrame):
         layout.setSpacing(8)
 
         # 1. Action Buttons Group
-        self.btn_del = QPushButton(qta.icon('fa5s.trash-alt', color='#EF4444'), "")
-        self.btn_add = QPushButton(qta.icon('fa5s.plus', color='#10B981'), "")
-        self.btn_up = QPushButton(qta.icon('fa5s.arrow-up'), "")
-        self.btn_down = QPushButton(qta.icon('fa5s.arrow-down'), "")
+        # Icons are rendered once by update_icon_states (v2.3: shared pixmap cache)
+        self.btn_del = QPushButton()
+        self.btn_add = QPushButton()
+        self.btn_up = QPushButton()
+        self.btn_down = QPushButton()
         
         for btn in [self.btn_del, self.btn_add, self.btn_up, self.btn_down]:
             btn.setFixedSize(28, 28)
@@ -169,13 +273,53 @@ class TimerCard(QFrame):
         time_layout.addWidget(lbl_colon2)
         
         time_layout.addWidget(self.spin_s)
+
+        # v2.3: ".250 +1d" suffix, only shown when the row carries ms / day offset
+        self.lbl_time_suffix = QLabel()
+        self.lbl_time_suffix.setObjectName("TimeSuffix")
+        self.lbl_time_suffix.hide()
+        time_layout.addWidget(self.lbl_time_suffix)
         
         layout.addWidget(self.time_frame)
 
+        # Conflict flag (v2.3): set by MainWindow when this row's execution window overlaps another
+        self.lbl_conflict = QLabel()
+        self.lbl_conflict.setFixedWidth(16)
+        self.lbl_conflict.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.lbl_conflict)
+
+        # 4a. Date target (v2.3): blank = today, "tomorrow", "next", "+N" or YYYY-MM-DD
+        self.combo_date = QComboBox()
+        self.combo_date.setEditable(True)
+        self.combo_date.addItems(["", "next", "tomorrow"])
+        self.combo_date.setFixedWidth(95)
+        self.combo_date.installEventFilter(self.wheel_filter)
+        self.edit_date = self.combo_date.lineEdit()
+        self.edit_date.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.combo_date)
+
+        # 4b. Repeat rule (v2.3): blank = one-shot, else "every 30s" / "daily" / "weekdays"
+        self.combo_repeat = QComboBox()
+        self.combo_repeat.setEditable(True)
+        self.combo_repeat.addItems(["", "every 60s", "every 5m", "every 1h", "daily", "weekdays"])
+        self.combo_repeat.setFixedWidth(95)
+        self.combo_repeat.installEventFilter(self.wheel_filter)
+        self.edit_repeat = self.combo_repeat.lineEdit()
+        self.edit_repeat.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.combo_repeat)
+
+        # 4c. Countdown (v2.3): remaining time while running, written by MainWindow's shared ticker
+        self.lbl_countdown = QLabel()
+        self.lbl_countdown.setObjectName("Countdown")
+        self.lbl_countdown.setFixedWidth(64)
+        self.lbl_countdown.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        layout.addWidget(self.lbl_countdown)
+
         # 5. Copy Button
-        self.btn_copy = QPushButton(qta.icon('fa5s.copy', color='#718096'), "")
+        self.btn_copy = QPushButton()
         self.btn_copy.setFixedSize(28, 28)
         self.btn_copy.setObjectName("IconButton")
+        self.btn_copy.setContextMenuPolicy(Qt.CustomContextMenu)
         layout.addWidget(self.btn_copy)
 
         # 6. Show Desktop (Final v8.3.1: Balanced spacing & Unified CheckBox)
@@ -187,8 +331,7 @@ class TimerCard(QFrame):
         desktop_group_layout.setSpacing(5) # Balanced spacing (v10.5: 5px)
         
         self.lbl_desktop_icon = QLabel()
-        self.lbl_desktop_icon.setPixmap(qta.icon('fa5s.desktop', color='#26D07C').pixmap(18, 18))
-        self.lbl_desktop_icon.setToolTip("") # Tooltip handled by retranslate if needed
+        self.lbl_desktop_icon.setToolTip("") # Tooltip resolved lazily by LazyTextFilter
         
         self.chk_desktop = QCheckBox()
         self.chk_desktop.toggled.connect(self.on_desktop_toggled)
@@ -200,17 +343,15 @@ class TimerCard(QFrame):
 
         # 7. Execution Params (Refined v9.3: Mouse & Clock Icons)
         self.lbl_clicks_icon = QLabel()
-        self.lbl_clicks_icon.setPixmap(qta.icon('fa5s.mouse', color='#26D07C').pixmap(16, 16))
         self.edit_clicks = QLineEdit()
         self.edit_clicks.setFixedWidth(45)
-        self.edit_clicks.setMaxLength(2)
+        self.edit_clicks.setMaxLength(5)  # v2.3: Burst rows run thousands of clicks
         self.edit_clicks.setAlignment(Qt.AlignCenter)
         
         self.lbl_interval_icon = QLabel()
-        self.lbl_interval_icon.setPixmap(qta.icon('fa5s.clock', color='#26D07C').pixmap(16, 16))
         self.edit_interval = QLineEdit()
         self.edit_interval.setFixedWidth(45)
-        self.edit_interval.setMaxLength(2)
+        self.edit_interval.setMaxLength(6)  # v2.3: "0.005" / "5ms" for burst rows
         self.edit_interval.setAlignment(Qt.AlignCenter)
         
         # Sub-groups for precise 5px spacing (v10.6)
@@ -251,8 +392,32 @@ class TimerCard(QFrame):
         layout.addWidget(self.edit_notes, 1)
         layout.addWidget(self.btn_notes_edit)
 
-        # Initialize Tooltips
-        self.retranslate_ui()
+        # 9. Macro steps (v2.3): multi-step plan editor
+        self.btn_steps = QPushButton()
+        self.btn_steps.setFixedSize(24, 24)
+        self.btn_steps.setFlat(True)
+        self.btn_steps.setCursor(Qt.PointingHandCursor)
+        self.btn_steps.clicked.connect(self.open_steps_editor)
+        layout.addWidget(self.btn_steps)
+
+        # 10. Pixel / region trigger (v2.3): fire when a screen region condition holds
+        self.btn_trigger = QPushButton()
+        self.btn_trigger.setFixedSize(24, 24)
+        self.btn_trigger.setFlat(True)
+        self.btn_trigger.setCursor(Qt.PointingHandCursor)
+        self.btn_trigger.clicked.connect(self.open_trigger_editor)
+        layout.addWidget(self.btn_trigger)
+
+        # 11. Missed-deadline policy (v2.3): fire / skip / shift when woken late
+        self.btn_late = QPushButton()
+        self.btn_late.setFixedSize(24, 24)
+        self.btn_late.setFlat(True)
+        self.btn_late.setCursor(Qt.PointingHandCursor)
+        self.btn_late.clicked.connect(self.open_late_editor)
+        layout.addWidget(self.btn_late)
+
+        # Initialize Tooltips & Placeholders (resolved lazily, v2.3)
+        self.install_lazy_texts()
 
         # Connections
         self.btn_del.clicked.connect(lambda: self.delete_requested.emit(self))
@@ -260,6 +425,18 @@ class TimerCard(QFrame):
         self.btn_up.clicked.connect(lambda: self.move_up_requested.emit(self))
         self.btn_down.clicked.connect(lambda: self.move_down_requested.emit(self))
         self.btn_copy.clicked.connect(lambda: self.copy_requested.emit(self))
+        self.btn_copy.customContextMenuRequested.connect(
+            lambda _pos: self.fill_requested.emit(self) if self.btn_copy.isEnabled() else None)
+        for spin in (self.spin_h, self.spin_m, self.spin_s):
+            spin.valueChanged.connect(self.emit_values_changed)
+        self.chk_enabled.toggled.connect(self.emit_values_changed)
+        self.combo_date.currentTextChanged.connect(self.emit_values_changed)
+        self.chk_desktop.toggled.connect(self.emit_values_changed)
+        for edit in (self.edit_clicks, self.edit_interval, self.edit_notes):
+            edit.textChanged.connect(self.emit_values_changed)
+
+    def emit_values_changed(self, *_args):
+        self.values_changed.emit(self)
 
     def on_desktop_toggled(self, checked):
         # Fix for Qt Enum truthiness: bool(Qt.Unchecked) is often True in Python.
@@ -281,8 +458,20 @@ class TimerCard(QFrame):
         # Fix (v13.0): Decouple button colors from param input state
         self.update_icon_states(can_edit=not is_desktop, actions_active=True)
 
+    def set_conflict(self, text):
+        """Show (tooltip `text`) or clear the inline overlap flag."""
+        self.conflict_text = text
+        if text:
+            self.lbl_conflict.setPixmap(cached_pixmap('fa5s.exclamation-triangle',
+                                                      self.theme_manager.get_color("ACCENT_ORANGE"), 14))
+        else:
+            self.lbl_conflict.clear()
+        self.lbl_conflict.setToolTip(text)
+
     def update_after_theme_change(self):
         """Called by MainWindow when theme changes."""
+        if self.conflict_text:
+            self.set_conflict(self.conflict_text)
         # 修复 Bug：主题切换时应保持当前的锁定状态
         # 检查删除按钮是否被禁用，以此判断当前是否处于全局“运行时”锁定状态
         is_card_enabled = self.btn_del.isEnabled()
@@ -315,30 +504,35 @@ class TimerCard(QFrame):
         color_desktop = color_theme if can_edit else color_muted
         
         # 1. Labels (Pure Pixmap - works naturally)
-        self.lbl_desktop_icon.setPixmap(qta.icon('fa5s.desktop', color=color_desktop).pixmap(18, 18))
-        self.lbl_clicks_icon.setPixmap(qta.icon('fa5s.mouse', color=color_param).pixmap(16, 16))
-        self.lbl_interval_icon.setPixmap(qta.icon('fa5s.clock', color=color_param).pixmap(16, 16))
+        self.lbl_desktop_icon.setPixmap(cached_pixmap('fa5s.desktop', color_desktop, 18))
+        self.lbl_clicks_icon.setPixmap(cached_pixmap('fa5s.mouse', color_param, 16))
+        self.lbl_interval_icon.setPixmap(cached_pixmap('fa5s.clock', color_param, 16))
         # self.lbl_notes_icon (Removed in v14.0)
         
         # 2. Buttons (Plan A: Force Disable Stage to matching solid color)
         def set_solid_icon(btn, icon_name, active_color, locked_color, size=18):
             # Use actions_active for Copy/Del/Add/Up/Down
             target_color = active_color if actions_active else locked_color
-            pix = qta.icon(icon_name, color=target_color).pixmap(size, size)
-            icon = QIcon()
-            icon.addPixmap(pix, QIcon.Normal)
-            icon.addPixmap(pix, QIcon.Disabled) # Override Qt's automatic fading
-            btn.setIcon(icon)
+            btn.setIcon(cached_solid_icon(icon_name, target_color, size))
 
         # Copy Button & Notes Edit Button (v14.0)
         set_solid_icon(self.btn_copy, 'fa5s.copy', color_theme, color_muted, 16)
         # Notes button should behave like a param input (can_edit), not an action button?
         # Requirement: "Clicking edit button...". It edits the input. So it follows can_edit.
         notes_color = color_theme if can_edit else color_muted
-        pix_notes = qta.icon('fa5s.edit', color=notes_color).pixmap(16, 16)
         # We manually set icon for btn_notes_edit because it uses can_edit logic directly
-        self.btn_notes_edit.setIcon(QIcon(pix_notes))
+        self.btn_notes_edit.setIcon(QIcon(cached_pixmap('fa5s.edit', notes_color, 16)))
         self.btn_notes_edit.setEnabled(can_edit) # Logically disable it too
+        # Macro button is highlighted while the row carries steps
+        steps_color = ('#10B981' if self.steps else color_theme) if can_edit else color_muted
+        self.btn_steps.setIcon(QIcon(cached_pixmap('fa5s.list-ol', steps_color, 16)))
+        self.btn_steps.setEnabled(can_edit)
+        trigger_color = ('#10B981' if self.trigger else color_theme) if can_edit else color_muted
+        self.btn_trigger.setIcon(QIcon(cached_pixmap('fa5s.crosshairs', trigger_color, 16)))
+        self.btn_trigger.setEnabled(can_edit)
+        late_color = ('#10B981' if self.late else color_theme) if actions_active else color_muted
+        self.btn_late.setIcon(QIcon(cached_pixmap('fa5s.hourglass-end', late_color, 16)))
+        self.btn_late.setEnabled(actions_active)
         
         # Left side buttons (Management) - Also unified to color_muted when locked
         set_solid_icon(self.btn_del, 'fa5s.trash-alt', '#EF4444', color_muted, 16)
@@ -375,6 +569,47 @@ class TimerCard(QFrame):
         # 无论是否保存，都要确保 Card 回到可用的状态
         self.force_state_reset()
 
+    def open_steps_editor(self):
+        """Edit the macro steps one per line; stored as a compact single line (v2.3)."""
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        parent_widget = self.window() if self.window() else self
+        try:
+            current = format_steps(parse_steps(self.steps), "\n")
+        except ValueError:
+            current = self.steps
+        dialog = NotesEditorDialog(current, self.config, parent_widget, title_key="title_edit_steps",
+                                   placeholder_key="placeholder_steps", validator=normalize_steps)
+        result = dialog.exec()
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, False)
+        if result == QDialog.Accepted:
+            self.steps = dialog.get_text()
+            self.update_icon_states(can_edit=not self.chk_desktop.isChecked(), actions_active=True)
+            self.values_changed.emit(self)
+
+    def open_trigger_editor(self):
+        """Edit the row's pixel / region trigger (v2.3); validated and stored canonically."""
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        parent_widget = self.window() if self.window() else self
+        dialog = NotesEditorDialog(self.trigger, self.config, parent_widget, title_key="title_edit_trigger",
+                                   placeholder_key="placeholder_trigger", validator=normalize_trigger)
+        result = dialog.exec()
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, False)
+        if result == QDialog.Accepted:
+            self.trigger = dialog.get_text()
+            self.update_icon_states(can_edit=not self.chk_desktop.isChecked(), actions_active=True)
+
+    def open_late_editor(self):
+        """Edit the row's missed-deadline policy (v2.3), e.g. "skip 30"."""
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        parent_widget = self.window() if self.window() else self
+        dialog = NotesEditorDialog(self.late, self.config, parent_widget, title_key="title_edit_late",
+                                   placeholder_key="placeholder_late", validator=normalize_late_policy)
+        result = dialog.exec()
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, False)
+        if result == QDialog.Accepted:
+            self.late = dialog.get_text()
+            self.update_icon_states(can_edit=not self.chk_desktop.isChecked(), actions_active=True)
+
     def force_state_reset(self):
         """
         强制重置组件状态，无视之前的任何动画或焦点丢失。
@@ -407,9 +642,29 @@ class TimerCard(QFrame):
             "show_desktop": self.chk_desktop.isChecked(),
             "clicks": self.edit_clicks.text(),
             "interval": self.edit_interval.text(),
-            "paste_text": self.edit_notes.text()
+            "paste_text": self.edit_notes.text(),
+            "time_ms": self.time_ms,
+            "day_offset": self.day_offset,
+            "repeat": self.combo_repeat.currentText().strip(),
+            "date": self.combo_date.currentText().strip(),
+            "steps": self.steps,
+            "trigger": self.trigger,
+            "late": self.late
         }
 
+    def set_time_extras(self, time_ms, day_offset):
+        """Store the sub-second / day-offset parts of the schedule and refresh the suffix."""
+        self.time_ms = int(time_ms or 0)
+        self.day_offset = int(day_offset or 0)
+        parts = []
+        if self.time_ms:
+            parts.append(f".{self.time_ms:03d}")
+        if self.day_offset:
+            parts.append(f"+{self.day_offset}d")
+        self.lbl_time_suffix.setText(" ".join(parts))
+        self.lbl_time_suffix.setVisible(bool(parts))
+        self.values_changed.emit(self)
+
     def set_values(self, data):
         # Block signals to prevent on_desktop_toggled from clearing data during loading
         self.chk_desktop.blockSignals(True)
@@ -423,6 +678,12 @@ class TimerCard(QFrame):
             self.spin_h.setValue(int(t_str[0:2]))
             self.spin_m.setValue(int(t_str[2:4]))
             self.spin_s.setValue(int(t_str[4:6]))
+        self.set_time_extras(data.get("time_ms", 0), data.get("day_offset", 0))
+        self.combo_repeat.setCurrentText(str(data.get("repeat", "")))
+        self.combo_date.setCurrentText(str(data.get("date", "")))
+        self.steps = str(data.get("steps", ""))
+        self.trigger = str(data.get("trigger", ""))
+        self.late = str(data.get("late", ""))
             
         self.chk_desktop.setChecked(bool(int(data.get("show_desktop", 0))))
         self.edit_clicks.setText(str(data.get("clicks", "")))
@@ -448,47 +709,38 @@ class TimerCard(QFrame):
                 self.spin_h.setValue(int(t_str[0:2]))
                 self.spin_m.setValue(int(t_str[2:4]))
                 self.spin_s.setValue(int(t_str[4:6]))
+        if "time_ms" in data or "day_offset" in data:
+            self.set_time_extras(data.get("time_ms", self.time_ms), data.get("day_offset", self.day_offset))
+        if "date" in data:
+            self.combo_date.setCurrentText(str(data["date"]))
         if "clicks" in data and data["clicks"] is not None:
             self.edit_clicks.setText(str(data["clicks"]))
         if "interval" in data and data["interval"] is not None:
             self.edit_interval.setText(str(data["interval"]))
 
-    def retranslate_ui(self):
-        """Update tooltips and placeholders for all interactive elements (v15.0)."""
-        # 1. Management Buttons
-        self.btn_del.setToolTip(self.config.get_message("tooltip_btn_delete_timer"))
-        self.btn_add.setToolTip(self.config.get_message("tooltip_btn_insert_timer"))
-        self.btn_up.setToolTip(self.config.get_message("tooltip_btn_up_timer"))
-        self.btn_down.setToolTip(self.config.get_message("tooltip_btn_down_timer"))
-        
-        # 2. Parameters (With Placeholders)
-        self.chk_enabled.setToolTip(self.config.get_message("tooltip_row_enabled"))
-        self.edit_x.setPlaceholderText(self.config.get_message("placeholder_x"))
-        self.edit_x.setToolTip(self.config.get_message("tooltip_edit_x"))
-        self.edit_y.setPlaceholderText(self.config.get_message("placeholder_y"))
-        self.edit_y.setToolTip(self.config.get_message("tooltip_edit_y"))
-        
-        # 3. Time
-        time_tip = self.config.get_message("tooltip_spin_time")
-        self.spin_h.setToolTip(time_tip)
-        self.spin_m.setToolTip(time_tip)
-        self.spin_s.setToolTip(time_tip)
-        
-        # 4. Actions
-        self.btn_copy.setToolTip(self.config.get_message("tooltip_btn_copy"))
-        self.lbl_desktop_icon.setToolTip(self.config.get_message("tooltip_show_desktop"))
-        self.chk_desktop.setToolTip(self.config.get_message("tooltip_chk_desktop"))
-        
-        # 5. Params
-        self.lbl_clicks_icon.setToolTip(self.config.get_message("tooltip_clicks_icon"))
-        self.edit_clicks.setToolTip(self.config.get_message("tooltip_clicks_icon"))
-        self.lbl_interval_icon.setToolTip(self.config.get_message("tooltip_interval_icon"))
-        self.edit_interval.setToolTip(self.config.get_message("tooltip_interval_icon"))
-        
-        # 6. Notes (With Placeholder)
-        self.edit_notes.setPlaceholderText(self.config.get_message("placeholder_notes"))
-        self.edit_notes.setToolTip(self.config.get_message("tooltip_edit_notes"))
-        self.btn_notes_edit.setToolTip(self.config.get_message("tooltip_btn_notes_edit"))
+    def text_bundle(self):
+        """Per-language strings shared by every card (resolved once by ConfigManager)."""
+        return self.config.get_bundle("timer_card", self.BUNDLE_KEYS)
+
+    def install_lazy_texts(self):
+        """Tag widgets with their language keys instead of pushing strings into each one (v2.3)."""
+        self.lazy_text_filter = LazyTextFilter(self)
+        for attr, key in self.TOOLTIP_KEYS.items():
+            widget = getattr(self, attr)
+            widget.setProperty("i18n_tooltip", key)
+            widget.installEventFilter(self.lazy_text_filter)
+        for attr, key in self.PLACEHOLDER_KEYS.items():
+            getattr(self, attr).setProperty("i18n_placeholder", key)
+        self.sync_placeholders()
+
+    def sync_placeholders(self):
+        """Re-apply placeholders only if the language bundle changed since the last call."""
+        bundle = self.text_bundle()
+        if bundle is self._placeholder_bundle:
+            return
+        self._placeholder_bundle = bundle
+        for attr, key in self.PLACEHOLDER_KEYS.items():
+            getattr(self, attr).setPlaceholderText(bundle[key])
 
     def set_editing_enabled(self, enabled):
         """Enable or disable all child widgets for editing."""
@@ -502,6 +754,8 @@ class TimerCard(QFrame):
         self.spin_h.setEnabled(enabled)
         self.spin_m.setEnabled(enabled)
         self.spin_s.setEnabled(enabled)
+        self.combo_repeat.setEnabled(enabled)
+        self.combo_date.setEnabled(enabled)
         self.btn_copy.setEnabled(enabled)
         self.chk_desktop.setEnabled(enabled)
         self.edit_clicks.setEnabled(enabled)
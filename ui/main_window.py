@@ -1,16 +1,29 @@
 import os
+import time
 import datetime
+from contextlib import contextmanager
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QPushButton, QLabel, QComboBox, QScrollArea, 
-                             QTextEdit, QFrame, QFileDialog, QMessageBox, QStyledItemDelegate)
-from PySide6.QtCore import Qt, QTimer, QSize, QObject, QEvent
-from PySide6.QtGui import QIcon, QTextCursor
+                             QTextEdit, QFrame, QFileDialog, QMessageBox, QStyledItemDelegate,
+                             QDialog)
+from PySide6.QtCore import Qt, QTimer, QSize, QObject, QEvent, QPoint
+from PySide6.QtGui import QIcon, QTextCursor, QShortcut, QKeySequence
 import qtawesome as qta
-import win32api
 
 from core.config_manager import ConfigManager
+from core.startup_trace import TRACE
 from core.timer_engine import TimerEngine
+from core.cursor_tracker import CursorTracker
 from ui.components.timer_card import TimerCard
+from ui.components.pattern_fill_dialog import PatternFillDialog
+from ui.components.timeline_view import TimelineView
+from core.pattern_fill import generate_fill_rows, time_to_ms
+from core.schedule import compile_tasks, resume_tasks, format_remaining
+from core.journal import replay, discard, JOURNAL_FILE
+from core.timeline import TimelineIndex
+from core.conflicts import ConflictIndex, execution_window, report_conflicts
+from core.reference_clock import start_clock_sync
+from core.macro_recorder import MacroRecorder, recording_to_rows, recording_to_macro_row, trim_own_window
 from ui.styles.theme_config import ThemeManager
 from ui.widgets import SunMoonToggle
 
@@ -40,16 +53,73 @@ class LineEditClickFilter(QObject):
         return super().eventFilter(obj, event)
 
 
+class FirstPaintProbe(QObject):
+    """One-shot filter: fires `callback` on the window's first paint, then uninstalls itself."""
+    def __init__(self, window, callback):
+        super().__init__(window)
+        self.callback = callback
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            # Let the paint finish before doing any follow-up work
+            QTimer.singleShot(0, self.callback)
+        return super().eventFilter(obj, event)
+
+
 class MainWindow(QMainWindow):
-    def __init__(self):
+    # v2.3 Lazy startup: rows beyond the first screen are built after the first paint
+    LAZY_FIRST_ROWS = 20
+    LAZY_CHUNK_ROWS = 50
+    TIMELINE_REFRESH_MS = 300
+    CONFLICT_CHECK_MS = 150
+    CONFLICT_REBUILD_ROWS = 500  # More edited rows than this: one sort-and-sweep instead
+
+    def __init__(self, cursor_source=None, lazy_rows=True):
         super().__init__()
-        self.config = ConfigManager()
+        with TRACE.phase("config_load"):
+            self.config = ConfigManager()
         self.theme_manager = ThemeManager()
         self.theme_manager.current_theme = self.config.theme
+        # v2.3: A session still armed when the process died comes back (core/journal.py)
+        started = time.perf_counter()
+        self.recovery = replay(JOURNAL_FILE) if self.config.journal else None
+        self._recovery_ms = (time.perf_counter() - started) * 1000
+        if self.recovery is not None:
+            self.config.timers_data = self.recovery.rows
 
         self.engine = TimerEngine(config=self.config)
         self.timer_cards = []
+        self.selection = set()  # v2.3: Multi-row selection
+        self.selection_anchor = None
+        self._batch_depth = 0
+        self.lazy_rows = lazy_rows
+        self._deferred_rows = []
         self.active_tasks_count = 0  # v8.1: Task counter for robust UI unlocking
+        self.recorder = None  # v2.3: Active MacroRecorder while record mode is on
+        # v2.3: One 1 Hz ticker for every row's countdown (replaces the per-wait log lines)
+        self.countdown_timer = QTimer(self)
+        self.countdown_timer.setInterval(1000)
+        self.countdown_timer.timeout.connect(self.tick_countdown)
+        self._countdown = []         # Epoch deadline per row, rebuilt when the fire index changes
+        self._countdown_armed = []   # Row was armed in this run
+        self._countdown_index = None
+        self._countdown_version = -1
+        self._countdown_shown = set()
+        # v2.3: Timeline overview, rebuilt (debounced) only while it is shown
+        self.timeline_refresh = QTimer(self)
+        self.timeline_refresh.setSingleShot(True)
+        self.timeline_refresh.setInterval(self.TIMELINE_REFRESH_MS)
+        self.timeline_refresh.timeout.connect(self.refresh_timeline)
+        # v2.3: Execution-window conflicts, re-checked incrementally for the edited rows
+        self.conflicts = ConflictIndex()
+        self._conflict_dirty = set()
+        self._conflict_flagged = set()
+        self.conflict_timer = QTimer(self)
+        self.conflict_timer.setSingleShot(True)
+        self.conflict_timer.setInterval(self.CONFLICT_CHECK_MS)
+        self.conflict_timer.timeout.connect(self.check_dirty_conflicts)
 
         self.setWindowTitle(self.config.get_message("app_title"))
         
@@ -63,17 +133,30 @@ class MainWindow(QMainWindow):
             self.move(self.config.window_x, self.config.window_y)
 
         self.init_ui()
-        self.load_initial_data()
+        with TRACE.phase("card_construction"):
+            self.load_initial_data()
         self.change_language(self.config.selected_language)
+        self.first_paint_probe = FirstPaintProbe(self, self.on_first_paint)
         
-        # Coordinate Polling
-        self.coord_timer = QTimer(self)
-        self.coord_timer.timeout.connect(self.update_coords)
-        self.coord_timer.start(200)
+        # Coordinate Tracking (v2.3: change-driven, paused while minimized)
+        self.cursor_tracker = CursorTracker(source=cursor_source, parent=self)
+        self.cursor_tracker.position_changed.connect(self.update_coords)
 
         # Engine Signals
         self.engine.log_signal.connect(self.log)
         self.engine.task_finished.connect(self.on_task_finished)
+        # Reference clock (v2.3): keeps the engine's offset / drift estimate current
+        self.clock_sync = start_clock_sync(self.config, self.engine.clock, self.log)
+
+        # Block Operations on the Selection (v2.3)
+        QShortcut(QKeySequence("Ctrl+D"), self, self.duplicate_selection)
+        QShortcut(QKeySequence.Delete, self, self.delete_selection)
+        QShortcut(QKeySequence("Alt+Up"), self, lambda: self.move_selection(-1))
+        QShortcut(QKeySequence("Alt+Down"), self, lambda: self.move_selection(1))
+        QShortcut(QKeySequence(Qt.Key_Escape), self, self.clear_selection)
+
+        if self.recovery is not None:
+            QTimer.singleShot(0, self.resume_session)
 
     def init_ui(self):
         central_widget = QWidget()
@@ -117,6 +200,13 @@ class MainWindow(QMainWindow):
         self.btn_load.setFixedWidth(42)
         self.btn_load.setToolTip(self.config.get_message("button_load_config"))
         self.btn_load.clicked.connect(self.load_config_dialog)
+
+        # Timeline toggle (v2.3): shows / hides the schedule overview strip
+        self.btn_timeline = QPushButton()
+        self.btn_timeline.setFixedHeight(32)
+        self.btn_timeline.setFixedWidth(42)
+        self.btn_timeline.setCheckable(True)
+        self.btn_timeline.toggled.connect(self.toggle_timeline)
         
         # 统一使用图标：fa5s.copy
         self.lbl_copy_range_sel = QLabel()
@@ -160,6 +250,13 @@ class MainWindow(QMainWindow):
         coord_group.addWidget(self.lbl_coord_icon)
         coord_group.addWidget(self.lbl_coords)
 
+        # Record mode (v2.3): capture clicks / keystrokes into rows or macro steps
+        self.btn_record = QPushButton()
+        self.btn_record.setFixedSize(32, 31)
+        self.btn_record.setIcon(qta.icon('fa5s.circle', color='#E53E3E'))
+        self.btn_record.clicked.connect(self.toggle_recording)
+        coord_group.addWidget(self.btn_record)
+
         self.btn_start = QPushButton(self.config.get_message("button_start"))
         self.btn_start.setObjectName("ActionButton")
         self.btn_start.setProperty("type", "start")
@@ -183,6 +280,7 @@ class MainWindow(QMainWindow):
         # 按组添加至主布局
         header_layout.addLayout(lang_group)
         header_layout.addWidget(self.btn_load)
+        header_layout.addWidget(self.btn_timeline)
         header_layout.addLayout(copy_group)
         header_layout.addLayout(coord_group) # Moved to left side
         header_layout.addStretch()
@@ -190,10 +288,23 @@ class MainWindow(QMainWindow):
         header_layout.addWidget(self.btn_stop)
 
         # Initialize icons with correct colors (v9.7.2 Fix: Call after all components are defined)
-        self.apply_theme()
+        with TRACE.phase("theme"):
+            self.apply_theme()
 
         main_layout.addWidget(self.header_card)
 
+        # --- Timeline Card (v2.3, hidden until toggled) ---
+        self.timeline_card = QFrame()
+        self.timeline_card.setObjectName("TimelineCard")
+        timeline_layout = QVBoxLayout(self.timeline_card)
+        timeline_layout.setContentsMargins(15, 8, 15, 8)
+        self.timeline_view = TimelineView()
+        self.timeline_view.setFixedHeight(90)
+        self.timeline_view.row_activated.connect(self.on_timeline_row)
+        timeline_layout.addWidget(self.timeline_view)
+        self.timeline_card.hide()
+        main_layout.addWidget(self.timeline_card)
+
         # --- Timer Workspace Card ---
         self.workspace_card = QFrame()
         self.workspace_card.setObjectName("TimerWorkspaceCard")
@@ -211,6 +322,8 @@ class MainWindow(QMainWindow):
         self.timer_list_layout.setSpacing(2)
         
         scroll.setWidget(self.timer_container)
+        scroll.verticalScrollBar().valueChanged.connect(self.on_timer_scroll)
+        self.timer_scroll = scroll
         workspace_layout.addWidget(scroll)
         
         main_layout.addWidget(self.workspace_card, 1)
@@ -271,87 +384,330 @@ class MainWindow(QMainWindow):
         if not timers_data:
             timers_data = [None] * 5
         
-        for data in timers_data:
-            self.add_timer_card(data)
+        self._deferred_rows = []
+        if self.lazy_rows and len(timers_data) > self.LAZY_FIRST_ROWS:
+            # Only the first screen is built before show(); see build_deferred_rows
+            self._deferred_rows = list(timers_data[self.LAZY_FIRST_ROWS:])
+            timers_data = timers_data[:self.LAZY_FIRST_ROWS]
+        self.insert_timer_cards(timers_data)
 
-    def add_timer_card(self, data=None, index=None):
+    def on_first_paint(self):
+        TRACE.mark("first_paint")
+        if self._deferred_rows:
+            QTimer.singleShot(0, self.build_deferred_rows)
+        else:
+            self.report_startup_trace()
+
+    def report_startup_trace(self):
+        TRACE.mark("interactive")
+        line = TRACE.report()
+        if line:
+            self.log(line)
+
+    def build_deferred_rows(self):
+        """Append the next chunk of off-screen rows, yielding to the event loop between chunks."""
+        if not self._deferred_rows:
+            return
+        chunk = self._deferred_rows[:self.LAZY_CHUNK_ROWS]
+        del self._deferred_rows[:self.LAZY_CHUNK_ROWS]
+        with TRACE.phase("deferred_rows"):
+            self.insert_timer_cards(chunk)
+        if self._deferred_rows:
+            QTimer.singleShot(0, self.build_deferred_rows)
+        else:
+            self.report_startup_trace()
+
+    def flush_deferred_rows(self):
+        """Build any rows still pending; anything reading the whole list must call this first."""
+        if self._deferred_rows:
+            rows, self._deferred_rows = self._deferred_rows, []
+            self.insert_timer_cards(rows)
+
+    def create_timer_card(self, data=None):
         card = TimerCard(data=data, config=self.config)
         card.delete_requested.connect(self.delete_timer)
         card.insert_requested.connect(self.insert_timer)
         card.move_up_requested.connect(self.move_up)
         card.move_down_requested.connect(self.move_down)
         card.copy_requested.connect(self.copy_settings)
-        
-        if index is not None:
-            self.timer_list_layout.insertWidget(index, card)
-            self.timer_cards.insert(index, card)
-        else:
-            self.timer_list_layout.addWidget(card)
-            self.timer_cards.append(card)
+        card.fill_requested.connect(self.fill_pattern)
+        card.selection_requested.connect(self.on_card_selection)
+        card.values_changed.connect(self.on_card_values_changed)
+        return card
+
+    def add_timer_card(self, data=None, index=None):
+        return self.insert_timer_cards([data], index)[0]
+
+    def insert_timer_cards(self, data_list, index=None):
+        """
+        Batch-insert rows at `index` (append when None) (v2.3).
+        Only the new cards enter the layout; row indices are refreshed in one pass.
+        """
+        if index is None:
+            index = len(self.timer_cards)
+        cards = [self.create_timer_card(data) for data in data_list]
+        with self.batched_updates():
+            for offset, card in enumerate(cards):
+                self.timer_list_layout.insertWidget(index + offset, card)
+            self.timer_cards[index:index] = cards
+            self._reindex_cards(index)
+        self.mark_conflict_dirty(cards)
+        return cards
+
+    def _reindex_cards(self, start=0, stop=None):
+        """Refresh the cached row_index of cards[start:stop] only."""
+        cards = self.timer_cards
+        if stop is None:
+            stop = len(cards)
+        for i in range(start, stop):
+            cards[i].row_index = i
+        self.schedule_timeline_refresh()  # Rows added, removed or moved
+        if self._conflict_flagged:
+            # Tooltips name the other row by number
+            partners = self.conflicts.conflicts
+            self.show_conflicts([card for card in self._conflict_flagged
+                                 if card not in partners or partners[card].row_index >= start])
+
+    @contextmanager
+    def batched_updates(self):
+        """Suspend timer list repaints while a block operation runs (re-entrant)."""
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self.timer_container.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.timer_container.setUpdatesEnabled(True)
+
+    def _move_card(self, idx, new_idx):
+        """Relocate one card; only the rows between idx and new_idx are touched."""
+        card = self.timer_cards.pop(idx)
+        self.timer_cards.insert(new_idx, card)
+        self.timer_list_layout.removeWidget(card)
+        self.timer_list_layout.insertWidget(new_idx, card)
+        self._reindex_cards(min(idx, new_idx), max(idx, new_idx) + 1)
+
+    def _is_block_target(self, card):
+        """Row buttons act on the whole selection when the clicked row is part of it."""
+        return card in self.selection and len(self.selection) > 1
 
     def delete_timer(self, card):
+        if self._is_block_target(card):
+            self.delete_selection()
+            return
         if len(self.timer_cards) <= 1: return
-        self.timer_cards.remove(card)
+        idx = card.row_index
+        self.timer_cards.pop(idx)
+        self.timer_list_layout.removeWidget(card)
+        self._forget_card(card)
+        self.mark_conflict_dirty([card])
         card.deleteLater()
+        self._reindex_cards(idx)
         self.log(self.config.get_message("log_timer_row_deleted"))
 
     def insert_timer(self, card):
-        idx = self.timer_cards.index(card)
-        self.add_timer_card(index=idx + 1)
+        self.add_timer_card(index=card.row_index + 1)
         self.log(self.config.get_message("log_timer_row_inserted"))
 
     def move_up(self, card):
-        idx = self.timer_cards.index(card)
+        if self._is_block_target(card):
+            self.move_selection(-1)
+            return
+        idx = card.row_index
         if idx > 0:
-            self.timer_cards.pop(idx)
-            self.timer_cards.insert(idx - 1, card)
-            self.refresh_list()
+            self._move_card(idx, idx - 1)
 
     def move_down(self, card):
-        idx = self.timer_cards.index(card)
+        if self._is_block_target(card):
+            self.move_selection(1)
+            return
+        idx = card.row_index
         if idx < len(self.timer_cards) - 1:
-            self.timer_cards.pop(idx)
-            self.timer_cards.insert(idx + 1, card)
-            self.refresh_list()
-
-    def refresh_list(self):
-        # Remove all from layout then re-add
-        for i in reversed(range(self.timer_list_layout.count())): 
-            self.timer_list_layout.itemAt(i).widget().setParent(None)
-        for card in self.timer_cards:
-            self.timer_list_layout.addWidget(card)
+            self._move_card(idx, idx + 1)
+
+    # --- Multi-row Selection (v2.3) ---
+    def on_card_selection(self, card, modifiers):
+        """Click = single select, Ctrl+Click = toggle, Shift+Click = range from anchor."""
+        if not self.btn_start.isEnabled():
+            return
+        anchor = self.selection_anchor
+        if (modifiers & Qt.ShiftModifier) == Qt.ShiftModifier and anchor is not None:
+            lo, hi = sorted((anchor.row_index, card.row_index))
+            self.set_selection(self.timer_cards[lo:hi + 1])
+            return
+        if (modifiers & Qt.ControlModifier) == Qt.ControlModifier:
+            self.set_selection(self.selection ^ {card})
+        elif self.selection == {card}:
+            self.set_selection(())
+        else:
+            self.set_selection((card,))
+        self.selection_anchor = card
+
+    def set_selection(self, cards):
+        new_selection = set(cards)
+        for card in self.selection - new_selection:
+            card.set_selected(False)
+        for card in new_selection - self.selection:
+            card.set_selected(True)
+        self.selection = new_selection
+
+    def clear_selection(self):
+        self.set_selection(())
+        self.selection_anchor = None
+
+    def _forget_card(self, card):
+        self.selection.discard(card)
+        if self.selection_anchor is card:
+            self.selection_anchor = None
+
+    def _selected_rows(self):
+        return sorted(card.row_index for card in self.selection)
+
+    def move_selection(self, step):
+        """Shift the selected rows by one as a block; no-op when the block hits an edge."""
+        rows = self._selected_rows()
+        if not rows or not self.btn_start.isEnabled():
+            return
+        if (step < 0 and rows[0] == 0) or (step > 0 and rows[-1] == len(self.timer_cards) - 1):
+            return
+        with self.batched_updates():
+            for idx in (rows if step < 0 else reversed(rows)):
+                self._move_card(idx, idx + step)
+
+    def delete_selection(self):
+        rows = self._selected_rows()
+        if not rows or not self.btn_start.isEnabled():
+            return
+        doomed = self.selection
+        survivors = [card for card in self.timer_cards if card not in doomed]
+        if not survivors:
+            # Keep at least one row, matching single-row delete
+            survivors = [self.timer_cards[0]]
+        with self.batched_updates():
+            for card in self.timer_cards[rows[0]:]:
+                if card is not survivors[0] and card in doomed:
+                    self.timer_list_layout.removeWidget(card)
+                    card.deleteLater()
+            self.mark_conflict_dirty(doomed - {survivors[0]})
+            self.timer_cards = survivors
+            self._reindex_cards(rows[0])
+        deleted = len(doomed) - (1 if survivors[0] in doomed else 0)
+        self.clear_selection()
+        self.log(self.config.get_message("log_timer_rows_deleted", count=deleted))
+
+    def duplicate_selection(self):
+        """Insert copies of the selected rows right after the last selected row."""
+        rows = self._selected_rows()
+        if not rows or not self.btn_start.isEnabled():
+            return
+        payload = [self.timer_cards[idx].get_values() for idx in rows]
+        new_cards = self.insert_timer_cards(payload, rows[-1] + 1)
+        self.set_selection(new_cards)
+        self.selection_anchor = new_cards[0]
+        self.log(self.config.get_message("log_timer_rows_duplicated", count=len(new_cards)))
 
     def copy_settings(self, source_card):
-        idx = self.timer_cards.index(source_card)
+        """Spread the source row's schedule over the next `copy_range` rows (+1s each, with carry)."""
+        idx = source_card.row_index
         src_vals = source_card.get_values()
-        copy_range = self.config.copy_range
-        
-        for i in range(1, copy_range + 1):
-            target_idx = idx + i
-            if target_idx < len(self.timer_cards):
-                target_card = self.timer_cards[target_idx]
-                
-                # Calculate incrementing SS (Legacy HH:MM preserved, SS += offset)
-                try:
-                    h, m, s = int(src_vals['time'][0:2]), int(src_vals['time'][2:4]), int(src_vals['time'][4:6])
-                    new_s = (s + i) % 60
-                    new_time_str = f"{h:02d}{m:02d}{new_s:02d}"
-                    
-                    partial_data = {
-                        "time": new_time_str,
-                        "clicks": src_vals['clicks'] if not src_vals['show_desktop'] else None,
-                        "interval": src_vals['interval'] if not src_vals['show_desktop'] else None
-                    }
-                    target_card.update_partial_values(partial_data)
-                except:
-                    pass
-
-    def update_coords(self):
+        targets = self.timer_cards[idx + 1:idx + 1 + self.config.copy_range]
+        if not targets:
+            return
         try:
-            pos = win32api.GetCursorPos()
-            self.lbl_coords.setText(f"{pos}") # Value only
-        except:
-            pass
+            start_ms = time_to_ms(src_vals['time'], src_vals['time_ms'], src_vals['day_offset']) + 1000
+            rows = generate_fill_rows(src_vals, start_ms, 1, "s", len(targets))
+        except ValueError:
+            return
+        keep_params = not src_vals['show_desktop']
+        with self.batched_updates():
+            for target_card, row in zip(targets, rows):
+                target_card.update_partial_values({
+                    "time": row['time'],
+                    "time_ms": row['time_ms'],
+                    "day_offset": row['day_offset'],
+                    "date": src_vals['date'],
+                    "clicks": src_vals['clicks'] if keep_params else None,
+                    "interval": src_vals['interval'] if keep_params else None
+                })
+
+    def fill_pattern(self, source_card):
+        """Pattern fill (v2.3): generate rows after the source row in a single batch."""
+        dialog = PatternFillDialog(source_card.get_values(), self.config, self)
+        if dialog.exec() != QDialog.Accepted:
+            return
+        params = dialog.get_params()
+        try:
+            rows = generate_fill_rows(source_card.get_values(), **params)
+        except ValueError as e:
+            self.log(self.config.get_message("error_copy_settings", error=str(e)))
+            return
+        self.insert_timer_cards(rows, source_card.row_index + 1)
+        self.log(self.config.get_message("log_pattern_filled", from_row=source_card.row_index + 1, count=len(rows)))
+
+    def update_coords(self, x, y):
+        self.lbl_coords.setText(f"({x}, {y})") # Value only
+
+    def toggle_recording(self):
+        if self.recorder is None:
+            self.recorder = MacroRecorder()
+            self.recorder.start()
+            self.btn_record.setIcon(qta.icon('fa5s.stop-circle', color='#E53E3E'))
+            self.log(self.config.get_message("log_record_started"))
+        else:
+            self.finish_recording()
+
+    def finish_recording(self):
+        """Stop record mode and insert the recording after the last selected row (or at the end)."""
+        events = self.recorder.stop()
+        self.recorder = None
+        self.btn_record.setIcon(qta.icon('fa5s.circle', color='#E53E3E'))
+        # Input aimed at this window (the way to the stop button, the stop click) is not recorded
+        own = self.frameGeometry()
+        events = trim_own_window(events, lambda x, y: own.contains(QPoint(x, y)))
+        if not any(e.kind in ("click", "key_down") for e in events):
+            self.log(self.config.get_message("log_record_empty"))
+            return
+
+        box = QMessageBox(self)
+        box.setWindowTitle(self.config.get_message("title_record_result"))
+        box.setText(self.config.get_message("msg_record_result", count=len(events)))
+        btn_rows = box.addButton(self.config.get_message("button_record_rows"), QMessageBox.AcceptRole)
+        btn_macro = box.addButton(self.config.get_message("button_record_macro"), QMessageBox.AcceptRole)
+        box.addButton(QMessageBox.Cancel)
+        box.exec()
+        if box.clickedButton() not in (btn_rows, btn_macro):
+            return
+
+        self.flush_deferred_rows()
+        rows = self._selected_rows()
+        index = rows[-1] + 1 if rows else len(self.timer_cards)
+        if index > 0:
+            prev = self.timer_cards[index - 1].get_values()
+            start_ms = time_to_ms(prev['time'], prev['time_ms'], prev['day_offset']) + 1000
+        else:
+            now = datetime.datetime.now()
+            start_ms = time_to_ms(now.strftime("%H%M%S")) + 60000
+        if box.clickedButton() is btn_rows:
+            new_rows = recording_to_rows(events, start_ms)
+        else:
+            new_rows = [recording_to_macro_row(events, start_ms)]
+        cards = self.insert_timer_cards(new_rows, index)
+        self.set_selection(cards)
+        self.log(self.config.get_message("log_record_done", events=len(events), count=len(cards)))
+
+    def sync_cursor_tracker(self):
+        self.cursor_tracker.set_window_state(self.isActiveWindow(), self.isMinimized() or not self.isVisible())
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.sync_cursor_tracker()
+
+    def changeEvent(self, event):
+        if event.type() in (QEvent.WindowStateChange, QEvent.ActivationChange):
+            self.sync_cursor_tracker()
+        super().changeEvent(event)
 
     def log(self, message):
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
@@ -359,6 +715,9 @@ class MainWindow(QMainWindow):
         self.txt_log.moveCursor(QTextCursor.End)
 
     def start_timers(self):
+        if self.recorder is not None:
+            self.finish_recording()
+        self.flush_deferred_rows()
         # v9.6: Update header icons color
         self.update_header_icons(False)
         # 1. Lock UI first to prevent double clicks (High priority in legacy parity)
@@ -367,59 +726,202 @@ class MainWindow(QMainWindow):
         # 2. Start log
         self.log(self.config.get_message("log_timer_started"))
         
-        tasks_info = []
-        now = datetime.datetime.now()
-        
-        enabled_timers_indices = []
-        for idx, card in enumerate(self.timer_cards):
-            vals = card.get_values()
-            if vals['enabled']:
-                try:
-                    t_str = vals['time']
-                    scheduled_time = datetime.datetime.strptime(t_str, "%H%M%S")
-                    scheduled_time = now.replace(hour=scheduled_time.hour, minute=scheduled_time.minute, second=scheduled_time.second, microsecond=0)
-                    
-                    if scheduled_time < now:
-                        # Exact legacy message key: log_timer_time_passed
-                        self.log(self.config.get_message("log_timer_time_passed", timer_no=idx+1))
-                        continue
-                    
-                    enabled_timers_indices.append((idx, scheduled_time))
-                except Exception as e:
-                    self.log(self.config.get_message("error_timer_generic", timer_no=idx+1, error=str(e)))
-
-        if not enabled_timers_indices:
+        rows = [card.get_values() for card in self.timer_cards]
+        now = self.engine.clock.now()
+        tasks_info = compile_tasks(rows, self.config, self.log, now=now)
+        # v2.3: Overlaps are flagged and logged, not refused (the later row starts late)
+        self.check_conflicts(rows, now)
+        report_conflicts(self.conflicts, lambda card: card.row_index + 1, self.config, self.log)
+        self.arm_tasks(tasks_info, rows)
+
+    def resume_session(self):
+        """Re-arm the rows an interrupted session still had pending (v2.3)."""
+        recovery, self.recovery = self.recovery, None
+        if recovery.states:
+            started_at = datetime.datetime.fromtimestamp(recovery.started).strftime("%Y-%m-%d %H:%M:%S")
+            answer = QMessageBox.question(
+                self, self.config.get_message("title_journal_resume"),
+                self.config.get_message("msg_journal_resume", started=started_at, pending=len(recovery.states)))
+            if answer != QMessageBox.Yes:
+                discard(JOURNAL_FILE)  # The rows stay in the table, disarmed
+                self.log(self.config.get_message("log_journal_declined", pending=len(recovery.states)))
+                return
+        started = time.perf_counter()
+        # Deadlines are checked against the time of the answer, not of the launch
+        tasks_info = resume_tasks(recovery.rows, recovery.states, self.config, self.log,
+                                  now=self.engine.clock.now())
+        if tasks_info:
+            self.arm_tasks(tasks_info, recovery.rows)
+        else:
+            discard(JOURNAL_FILE)  # Nothing left to re-arm; don't offer it again
+        self.log(self.config.get_message("log_journal_recovered", pending=len(tasks_info),
+                                         interrupted=len(recovery.states) - len(tasks_info),
+                                         ms=f"{self._recovery_ms + (time.perf_counter() - started) * 1000:.0f}"))
+        if tasks_info:
+            self.flush_deferred_rows()
+            self.update_header_icons(False)
+            self.set_ui_locked(True)
+
+    def arm_tasks(self, tasks_info, rows):
+        """Hand compiled tasks to the engine (Start and session recovery)."""
+        if not tasks_info:
             # Exact legacy message key: error_no_valid_timer
             self.log(self.config.get_message("error_no_valid_timer"))
             self.stop_timers() # This will unlock the UI
             return
 
-        # Figure out which is the last timer to execute based on scheduled time
-        last_scheduled = max(item[1] for item in enabled_timers_indices)
-        
-        for idx, scheduled_time in enabled_timers_indices:
-            card = self.timer_cards[idx]
-            vals = card.get_values()
-            tasks_info.append({
-                "timer_no": idx + 1,
-                "scheduled_time": scheduled_time,
-                "show_desktop": vals['show_desktop'],
-                "x": int(vals['x']) if vals['x'] and not vals['show_desktop'] else 0,
-                "y": int(vals['y']) if vals['y'] and not vals['show_desktop'] else 0,
-                "clicks": int(vals['clicks']) if vals['clicks'] and not vals['show_desktop'] else 1,
-                "interval": float(vals['interval']) if vals['interval'] and not vals['show_desktop'] else 1.0,
-                "paste_text": vals['paste_text'] if not vals['show_desktop'] else "",
-                "is_last": scheduled_time == last_scheduled
-            })
-
-        # v8.1: Set active tasks count
-        self.active_tasks_count = len(tasks_info)
-        self.engine.start_tasks(tasks_info)
+        # v8.1: Set active tasks count (v2.3: recurring rows never finish on their own)
+        self.active_tasks_count = sum(1 for task in tasks_info if not task.get('recurrence'))
+        self.engine.start_tasks(tasks_info, rows)
+        self.start_countdown(tasks_info, len(rows))
+        self.schedule_timeline_refresh()  # "next" dates resolve against the Start time
+        next_fire = self.engine.next_fire()
+        if next_fire:
+            self.log(self.config.get_message("log_timer_next_fire", timer_no=next_fire[1],
+                                             time=next_fire[0].strftime("%Y-%m-%d %H:%M:%S"),
+                                             count=len(self.engine.fire_index)))
+
+    def start_countdown(self, tasks_info, row_count):
+        self.stop_countdown()
+        armed = [False] * row_count
+        for task in tasks_info:
+            if 0 < task['timer_no'] <= row_count:
+                armed[task['timer_no'] - 1] = True
+        self._countdown_armed = armed
+        self._countdown_index = None
+        self.tick_countdown()
+        self.countdown_timer.start()
+
+    def stop_countdown(self):
+        self.countdown_timer.stop()
+        for i in self._countdown_shown:
+            if i < len(self.timer_cards):
+                self.timer_cards[i].lbl_countdown.clear()
+        self._countdown_shown = set()
+        self._countdown_armed = []
+
+    def tick_countdown(self):
+        """Shared ticker (v2.3): refresh the countdown of the rows inside the viewport only."""
+        index = self.engine.fire_index
+        if index is not self._countdown_index or index.version != self._countdown_version:
+            # Read the version first: a change during the rebuild is picked up next tick
+            self._countdown_index, self._countdown_version = index, index.version
+            self._countdown = index.deadline_array(len(self._countdown_armed))
+        now = self.engine.clock.time()
+        first, last = self.visible_card_range()
+        for i in range(first, min(last, len(self._countdown_armed))):
+            if not self._countdown_armed[i]:
+                continue
+            deadline = self._countdown[i]
+            text = format_remaining(deadline - now) if deadline is not None else "✓"
+            label = self.timer_cards[i].lbl_countdown
+            if label.text() != text:
+                label.setText(text)
+                self._countdown_shown.add(i)
+        if not len(index):
+            self.countdown_timer.stop()  # Everything ran; the marks stay until the next Start / Stop
+
+    def on_timer_scroll(self, _value):
+        if self._countdown_armed:
+            self.tick_countdown()  # Rows scrolled into view get their countdown right away
+
+    def visible_card_range(self):
+        """[first, last) of the cards inside the scroll viewport (cards are stacked in row order)."""
+        cards = self.timer_cards
+        top = self.timer_scroll.verticalScrollBar().value()
+        bottom = top + self.timer_scroll.viewport().height()
+        lo, hi = 0, len(cards)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if cards[mid].geometry().bottom() < top:
+                lo = mid + 1
+            else:
+                hi = mid
+        last = lo
+        while last < len(cards) and cards[last].y() <= bottom:
+            last += 1
+        return lo, last
+
+    def on_card_values_changed(self, card):
+        self.schedule_timeline_refresh()
+        self.mark_conflict_dirty([card])
+
+    def mark_conflict_dirty(self, cards):
+        """Queue rows (edited, added or removed) for the next incremental conflict check."""
+        self._conflict_dirty.update(cards)
+        self.conflict_timer.start()
+
+    def _card_alive(self, card):
+        idx = card.row_index
+        return 0 <= idx < len(self.timer_cards) and self.timer_cards[idx] is card
+
+    def check_dirty_conflicts(self):
+        dirty, self._conflict_dirty = self._conflict_dirty, set()
+        if len(dirty) > self.CONFLICT_REBUILD_ROWS:
+            self.check_conflicts()
+            return
+        now, day_of, mode = self.engine.clock.now(), {}, self.config.paste_mode
+        changed = set()
+        for card in dirty:
+            window = execution_window(card.get_values(), now, day_of, mode) if self._card_alive(card) else None
+            changed |= self.conflicts.update(card, window)
+        self.show_conflicts(changed)
+
+    def check_conflicts(self, rows=None, now=None):
+        """Sort-and-sweep over every row (Start and large edits); refreshes the inline flags."""
+        self.conflict_timer.stop()
+        self._conflict_dirty = set()
+        if rows is None:
+            rows = [card.get_values() for card in self.timer_cards]
+        now, day_of, mode = now or self.engine.clock.now(), {}, self.config.paste_mode
+        flagged = self.conflicts.rebuild({card: execution_window(vals, now, day_of, mode)
+                                          for card, vals in zip(self.timer_cards, rows)})
+        self.show_conflicts(flagged | self._conflict_flagged)
+
+    def show_conflicts(self, cards):
+        conflicts = self.conflicts.conflicts
+        for card in list(cards):
+            partner = conflicts.get(card)
+            if partner is None or not self._card_alive(card):
+                self._conflict_flagged.discard(card)
+                if self._card_alive(card):
+                    card.set_conflict("")
+                continue
+            self._conflict_flagged.add(card)
+            text = self.config.get_message("tooltip_conflict", row=partner.row_index + 1,
+                                           delay=f"{self.conflicts.delay_seconds(card):.2f}")
+            if text != card.conflict_text:
+                card.set_conflict(text)
+
+    def toggle_timeline(self, checked):
+        self.timeline_card.setVisible(checked)
+        if checked:
+            self.refresh_timeline()
+
+    def schedule_timeline_refresh(self):
+        """Coalesce edits into one index rebuild; nothing is done while the timeline is hidden."""
+        if self.timeline_card.isVisible():
+            self.timeline_refresh.start()
+
+    def refresh_timeline(self):
+        self.timeline_refresh.stop()
+        rows = [card.get_values() for card in self.timer_cards]
+        rows.extend(data or {} for data in self._deferred_rows)  # Row numbers continue past the built cards
+        self.timeline_view.set_index(TimelineIndex.from_rows(rows, self.engine.clock.now()))
+
+    def on_timeline_row(self, row_no):
+        """Double-click on the timeline: bring that row into view and select it."""
+        self.flush_deferred_rows()
+        if 0 < row_no <= len(self.timer_cards):
+            card = self.timer_cards[row_no - 1]
+            self.timer_scroll.ensureWidgetVisible(card)
+            self.set_selection([card])
 
     def stop_timers(self):
         # v9.6: Update header icons color
         self.update_header_icons(True)
         self.engine.stop_all()
+        self.stop_countdown()
         self.active_tasks_count = 0 # Force reset
         self.set_ui_locked(False)
         self.log(self.config.get_message("log_stop_all_timer"))
@@ -439,7 +941,7 @@ class MainWindow(QMainWindow):
                 QTimer.singleShot(self.config.auto_close_delay_seconds * 1000, self.auto_close_procedure)
             else:
                 self.set_ui_locked(False)
-        elif self.active_tasks_count <= 0:
+        elif self.active_tasks_count <= 0 and not self.engine.recurring_active:
             # Fallback: Unlock if all tasks are finished even if is_last wasn't received
             self.set_ui_locked(False)
 
@@ -454,6 +956,7 @@ class MainWindow(QMainWindow):
         self.btn_stop.setVisible(locked)
         
         self.btn_load.setEnabled(not locked)
+        self.btn_record.setEnabled(not locked)
         self.combo_lang.setEnabled(not locked)
         self.combo_copy_range.setEnabled(not locked)
         
@@ -474,6 +977,7 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(self.config.get_message("app_title"))
         # Update all labels
         self.btn_load.setToolTip(self.config.get_message("tooltip_btn_load_config"))
+        self.btn_timeline.setToolTip(self.config.get_message("tooltip_btn_timeline"))
         self.btn_start.setText(self.config.get_message("button_start"))
         self.btn_stop.setText(self.config.get_message("button_stop"))
         self.lbl_lang_sel.setToolTip(self.config.get_message("tooltip_lang_sel"))
@@ -482,13 +986,14 @@ class MainWindow(QMainWindow):
         self.combo_copy_range.setToolTip(self.config.get_message("tooltip_copy_range_combo"))
         self.lbl_coord_icon.setToolTip(self.config.get_message("tooltip_coord_icon"))
         self.lbl_coords.setToolTip(self.config.get_message("tooltip_coords"))
+        self.btn_record.setToolTip(self.config.get_message("tooltip_btn_record"))
         self.btn_start.setToolTip(self.config.get_message("tooltip_btn_start"))
         self.btn_stop.setToolTip(self.config.get_message("tooltip_btn_stop"))
         self.lbl_log_header.setText(self.config.get_message("log"))
         
-        # New: Retranslate all cards
-        for card in self.timer_cards:
-            card.retranslate_ui()
+        # v2.3: Cards resolve their strings lazily from the shared bundle;
+        # repainting the list lets visible rows pick up the new placeholders.
+        self.timer_container.update()
             
         self.log(self.config.get_message("log_lang_changed", lang=lang))
 
@@ -515,34 +1020,109 @@ class MainWindow(QMainWindow):
         icon.addPixmap(pix, QIcon.Disabled)
         self.btn_load.setIcon(icon)
         self.btn_load.setIconSize(QSize(20, 20))
+        self.btn_timeline.setIcon(qta.icon('fa5s.stream', color=color_active))
+        self.btn_timeline.setIconSize(QSize(18, 18))
 
     def load_config_dialog(self):
         file_path, _ = QFileDialog.getOpenFileName(self, self.config.get_message("tooltip_btn_load_config"), "", "INI Files (*.ini)")
         if file_path:
-            import configparser
-            temp_config = configparser.ConfigParser()
             try:
-                temp_config.read(file_path, encoding="utf-8")
-                self.config.app_config = temp_config
-                self.config.load_app_config(read_default_file=False)
-                # Clear and Reload (Explicit Layout Clearing to fix refresh bug)
-                while self.timer_list_layout.count():
-                    item = self.timer_list_layout.takeAt(0)
-                    widget = item.widget()
-                    if widget:
-                        widget.deleteLater()
-                
-                self.timer_cards = []
-                self.load_initial_data()
-                self.log(self.config.get_message("log_config_loaded", filename=os.path.basename(file_path)))
-                self.combo_lang.setCurrentText(self.config.selected_language)
-                self.change_language(self.config.selected_language)
+                self.load_config_file(file_path)
             except Exception as e:
                 self.log(self.config.get_message("error_config_load_generic", error=str(e)))
 
+    def load_config_file(self, file_path):
+        """Replace the rows and settings with those of `file_path` (dialog and control API)."""
+        self.config.load_file(file_path)
+        # Clear and Reload (Explicit Layout Clearing to fix refresh bug)
+        while self.timer_list_layout.count():
+            item = self.timer_list_layout.takeAt(0)
+            widget = item.widget()
+            if widget:
+                widget.deleteLater()
+        
+        self.timer_cards = []
+        self.selection = set()
+        self.selection_anchor = None
+        self._deferred_rows = []
+        self.conflicts = ConflictIndex()
+        self._conflict_dirty = set()
+        self._conflict_flagged = set()
+        self.load_initial_data()
+        QTimer.singleShot(0, self.build_deferred_rows)
+        self.log(self.config.get_message("log_config_loaded", filename=os.path.basename(file_path)))
+        self.combo_lang.setCurrentText(self.config.selected_language)
+        self.change_language(self.config.selected_language)
+
+    # --- Local control API (v2.3, see core.ipc) ---
+    @property
+    def is_running(self):
+        return not self.btn_start.isEnabled()
+
+    def _ipc_require_idle(self):
+        if self.is_running:
+            raise ValueError("schedule is running; send stop first")
+
+    def ipc_status(self):
+        self.flush_deferred_rows()
+        next_fire = self.engine.next_fire() if self.is_running else None
+        return {
+            "running": self.is_running,
+            "rows": len(self.timer_cards),
+            "enabled": [card.row_index + 1 for card in self.timer_cards if card.chk_enabled.isChecked()],
+            "pending": len(self.engine.fire_index),
+            "late_events": len(self.engine.late_events),
+            "next_fire": {"row": next_fire[1], "time": next_fire[0].isoformat(timespec="milliseconds")}
+                         if next_fire else None,
+        }
+
+    def ipc_load(self, path):
+        self._ipc_require_idle()
+        self.load_config_file(path)
+
+    def ipc_append(self, rows):
+        self._ipc_require_idle()
+        self.flush_deferred_rows()
+        cards = self.insert_timer_cards(rows)
+        self.log(self.config.get_message("log_ipc_rows_appended", count=len(cards)))
+        return len(cards)
+
+    def ipc_set_enabled(self, row_numbers, enabled):
+        self._ipc_require_idle()
+        self.flush_deferred_rows()
+        changed = 0
+        with self.batched_updates():
+            for number in row_numbers:
+                idx = int(number) - 1
+                if 0 <= idx < len(self.timer_cards):
+                    self.timer_cards[idx].chk_enabled.setChecked(enabled)
+                    changed += 1
+        return changed
+
+    def ipc_start(self):
+        if not self.is_running:
+            self.start_timers()
+        return self.is_running
+
+    def ipc_stop(self):
+        if self.is_running:
+            self.stop_timers()
+
+    def ipc_show(self):
+        if self.isMinimized():
+            self.showNormal()
+        self.raise_()
+        self.activateWindow()
+
     def closeEvent(self, event):
         # Stop engine first
         self.engine.stop_all()
+        self.cursor_tracker.stop()
+        if self.recorder is not None:
+            self.recorder.stop()
+        if self.clock_sync:
+            self.clock_sync.stop()
+        self.flush_deferred_rows()
         geo = {
             'x': self.x(),
             'y': self.y(),